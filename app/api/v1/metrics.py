@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from app.core.metrics import metrics
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get("")
+async def read_metrics() -> dict[str, object]:
+    return metrics.snapshot()
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
+from app.api.v1.metrics import router as metrics_router
 from app.api.v1.workflows import router as workflows_router
 
 api_router = APIRouter()
 api_router.include_router(workflows_router, tags=["workflows"])
+api_router.include_router(metrics_router, tags=["metrics"])
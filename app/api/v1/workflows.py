@@ -1,8 +1,28 @@
-from fastapi import APIRouter, HTTPException
+import math
+from collections.abc import AsyncIterator
 
-from app.engine.executor import execute
+import orjson
+from fastapi import APIRouter, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.engine.admission import (
+    AdmissionRejected,
+    QueueFullError,
+    get_admission_controller,
+)
+from app.engine.executor import RunNotFoundError, execute, stream_execute
+from app.engine.jobs import (
+    FINISHED_STATUSES,
+    JobConflictError,
+    JobStatus,
+    get_job_manager,
+)
 from app.engine.nodes.types import Workflow
-from app.engine.schema import ResearchRequest
+from app.engine.registry import list_workflows
+from app.engine.schema import RerunRequest, ResearchRequest
+from app.engine.streaming import StreamEvent
 
 router = APIRouter(
     prefix="/workflows",
@@ -10,15 +30,164 @@ router = APIRouter(
 )
 
 
+def _overloaded(exc: AdmissionRejected) -> HTTPException:
+    # A full queue is the caller's signal to back off (429); a queue timeout
+    # means the service is saturated (503).
+    status_code = 429 if isinstance(exc, QueueFullError) else 503
+    return HTTPException(
+        status_code=status_code,
+        detail=str(exc),
+        headers={"Retry-After": str(math.ceil(exc.retry_after_s))},
+    )
+
+
 @router.post("/run/{workflow_name}")
 async def run_workflow(
     workflow_name: Workflow,
     request: ResearchRequest,
 ) -> dict[str, object]:
+    # The Workflow enum admits values (e.g. "persist") that aren't registered
+    # as invocable workflows; reject those before they take an admission slot.
+    _ensure_registered(workflow_name)
     try:
-        return await execute(workflow_name, request)
-    except ValueError as exc:
-        # get_workflow raises ValueError for unregistered names. The Workflow
-        # enum admits values (e.g. "persist") that aren't registered as
-        # invocable workflows, so this happens for well-formed URLs.
+        return await execute(workflow_name, request, admit=True)
+    except AdmissionRejected as exc:
+        raise _overloaded(exc) from exc
+
+
+def _ensure_registered(workflow_name: Workflow) -> None:
+    if workflow_name not in list_workflows():
+        raise HTTPException(
+            status_code=404,
+            detail=f"Workflow '{workflow_name}' not found. "
+            f"Available: {list_workflows()}",
+        )
+
+
+async def _sse(events: AsyncIterator[StreamEvent]) -> AsyncIterator[bytes]:
+    async for event in events:
+        data = orjson.dumps(jsonable_encoder(event["data"]))
+        yield b"event: " + event["event"].encode() + b"\ndata: " + data + b"\n\n"
+
+
+class _AdmittedStreamingResponse(StreamingResponse):
+    """Releases the workflow's admission slot once the response is done.
+
+    The release wraps the whole ASGI call rather than the body generator: a
+    generator that never starts (the client is gone before
+    ``http.response.start``) never runs its ``finally``.
+    """
+
+    def __init__(
+        self, content: AsyncIterator[bytes], workflow_name: Workflow, **kwargs
+    ) -> None:
+        super().__init__(content, **kwargs)
+        self.workflow_name = workflow_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            get_admission_controller().release(self.workflow_name)
+
+
+@router.post("/stream/{workflow_name}")
+async def stream_workflow(
+    workflow_name: Workflow,
+    request: ResearchRequest,
+) -> StreamingResponse:
+    """Run a workflow and stream progress as Server-Sent Events.
+
+    Events: ``run``, ``node``, ``tool_call``, ``tool_result``, ``reasoning``,
+    ``token``, then ``done`` (final state) or ``error``.
+    """
+    _ensure_registered(workflow_name)
+    try:
+        await get_admission_controller().acquire(workflow_name)
+    except AdmissionRejected as exc:
+        raise _overloaded(exc) from exc
+    return _AdmittedStreamingResponse(
+        _sse(stream_execute(workflow_name, request)),
+        workflow_name,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/jobs/{workflow_name}", status_code=status.HTTP_202_ACCEPTED)
+async def submit_workflow(
+    workflow_name: Workflow,
+    request: ResearchRequest,
+) -> dict[str, object]:
+    # Validate up front: the job runs detached, so a ValueError from
+    # get_workflow would otherwise only surface as a failed job.
+    _ensure_registered(workflow_name)
+    job = get_job_manager().submit(workflow_name, request)
+    return job.as_dict()
+
+
+@router.get("/jobs/{thread_id}")
+async def get_job_status(thread_id: str) -> dict[str, object]:
+    job_status = await get_job_manager().status(thread_id)
+    if job_status is None:
+        raise HTTPException(status_code=404, detail=f"Job '{thread_id}' not found")
+    return job_status
+
+
+@router.get("/jobs/{thread_id}/result")
+async def get_job_result(thread_id: str) -> dict[str, object]:
+    outcome = await get_job_manager().result(thread_id)
+    if outcome is None:
+        raise HTTPException(status_code=404, detail=f"Job '{thread_id}' not found")
+
+    job_status, result = outcome
+    if job_status != JobStatus.COMPLETED:
+        raise HTTPException(
+            status_code=409, detail=f"Job '{thread_id}' is {job_status}"
+        )
+    return result
+
+
+@router.post("/jobs/{thread_id}/cancel", status_code=status.HTTP_202_ACCEPTED)
+async def cancel_job(thread_id: str) -> dict[str, object]:
+    manager = get_job_manager()
+    job = manager.get(thread_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{thread_id}' not found")
+    if job.status in FINISHED_STATUSES:
+        raise HTTPException(
+            status_code=409, detail=f"Job '{thread_id}' is already {job.status}"
+        )
+    manager.cancel(thread_id)
+    return job.as_dict()
+
+
+@router.post("/jobs/{thread_id}/resume", status_code=status.HTTP_202_ACCEPTED)
+async def resume_job(thread_id: str) -> dict[str, object]:
+    """Continue a failed or interrupted run from its last checkpoint."""
+    try:
+        job = await get_job_manager().resume(thread_id)
+    except RunNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except JobConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return job.as_dict()
+
+
+@router.post("/jobs/{thread_id}/rerun/{node}", status_code=status.HTTP_202_ACCEPTED)
+async def rerun_job(
+    thread_id: str,
+    node: str,
+    request: RerunRequest | None = None,
+) -> dict[str, object]:
+    """Re-run a checkpointed run from ``node``, reusing earlier nodes' output."""
+    updates = request.updates if request is not None else None
+    try:
+        job = await get_job_manager().rerun(thread_id, node, updates)
+    except RunNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except JobConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return job.as_dict()
@@ -0,0 +1,85 @@
+"""In-process metrics registry.
+
+Callers push counters, gauges and timings by dotted name
+(e.g. ``admission.research.queue_depth``). Components that already track
+their own statistics (connection pools, caches) register a collector that is
+pulled on every snapshot instead.
+"""
+
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+Collector = Callable[[], Mapping[str, object]]
+
+
+@dataclass(slots=True)
+class Timing:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> dict[str, float]:
+        mean = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "total": self.total, "mean": mean, "max": self.max}
+
+
+class Metrics:
+    """Thread-safe registry of counters, gauges, timings and collectors."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, Timing] = {}
+        self._collectors: dict[str, Collector] = {}
+
+    def inc(self, name: str, value: float = 1.0) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0.0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            self._timings.setdefault(name, Timing()).observe(value)
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        with self._lock:
+            self._collectors[name] = collector
+
+    def unregister_collector(self, name: str) -> None:
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            timings = {name: t.as_dict() for name, t in self._timings.items()}
+            collectors = dict(self._collectors)
+
+        collected = {name: dict(collector()) for name, collector in collectors.items()}
+        return {
+            "counters": counters,
+            "gauges": gauges,
+            "timings": timings,
+            "collectors": collected,
+        }
+
+    def reset(self) -> None:
+        """Clear pushed values. Registered collectors are kept."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+
+metrics = Metrics()
@@ -5,4 +5,5 @@ DEFAULT_MEMORIES_DIR = Path(".memories")
 DEFAULT_VAULT_DIR = Path(".vault")
 DEFAULT_OUTPUT_DIR = Path("outputs")
 DEFAULT_LOGS_DIR = Path(".logs")
+DEFAULT_INDEX_DIR = Path(".index")
 DEFAULT_REPORT_PATH = DEFAULT_OUTPUT_DIR / "report.md"
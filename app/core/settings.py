@@ -10,6 +10,7 @@ from pydantic_settings import (
 )
 
 from app.core.paths import (
+    DEFAULT_INDEX_DIR,
     DEFAULT_LOGS_DIR,
     DEFAULT_MEMORIES_DIR,
     DEFAULT_OUTPUT_DIR,
@@ -72,24 +73,164 @@ class FilesystemConfig(BaseModel):
 
     backend_type: FilesystemBackendType = FilesystemBackendType.IN_PROCESS
     base_path: Path = Path(".")
+    # Threads behind the async backend used from the event loop.
+    io_workers: int = 4
+
+
+class CheckpointerConfig(BaseModel):
+    """Connection-pool sizing for the Postgres checkpointer (``DATABASE_URL``)."""
+
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    pool_timeout_s: float = 30.0
+
+
+class JobsConfig(BaseModel):
+    """Background job pool for ``POST /workflows/jobs/{workflow_name}``."""
+
+    max_workers: int = 4
+    max_retained: int = 256
+
+
+class AdmissionConfig(BaseModel):
+    """Per-workflow admission limits for the synchronous run/stream endpoints.
+
+    ``per_workflow`` overrides ``max_in_flight`` by workflow name.
+    """
+
+    max_in_flight: int = 4
+    max_queue: int = 16
+    queue_timeout_s: float = 30.0
+    retry_after_s: float = 10.0
+    per_workflow: dict[str, int] = Field(default_factory=dict)
+
+
+class CoalescingConfig(BaseModel):
+    """Singleflight for identical synchronous runs.
+
+    ``result_ttl_s`` > 0 additionally serves repeats from a short-lived cache.
+    """
+
+    enabled: bool = True
+    result_ttl_s: float = 0.0
+    max_cached_results: int = 128
+
+
+class MemoryConfig(BaseModel):
+    """Relevance-ranked memory retrieval seeded into ``ResearchState.memories``.
+
+    ``token_budget`` caps the estimated prompt tokens of the selected memories.
+    ``embedding_dim`` and ``related_top_k`` configure the vector index behind
+    the ``search_related_notes`` tool. ``compaction_interval_s`` > 0 rolls old
+    runs up into per-topic shards in the background while the app runs.
+    """
+
+    top_k: int = 5
+    token_budget: int = 2000
+    embedding_dim: int = 512
+    related_top_k: int = 5
+    compaction_keep_recent: int = 3
+    compaction_interval_s: float = 0.0
+
+
+class HttpConfig(BaseModel):
+    """Shared outbound HTTP clients for tool calls (``app/services/http``).
+
+    Each provider (``brave``, ``exa``, ``jina``, ``github``) gets its own
+    pooled client, so the connection limits apply per upstream host.
+    ``timeouts_s`` overrides ``timeout_s`` by provider name. ``http2`` needs
+    the ``h2`` package and falls back to HTTP/1.1 without it.
+
+    Requests are paced per provider at ``requests_per_s`` (else
+    ``default_requests_per_s``) with at most ``max_concurrency`` in flight;
+    the concurrency limit adapts to 429/503 responses.
+
+    Calls to ``hedge_providers`` are duplicated once they run longer than
+    the provider's ``hedge_percentile`` latency (``hedge_initial_delay_s``
+    until ``hedge_min_samples`` responses were seen). A provider's circuit
+    opens after ``breaker_failure_threshold`` consecutive failures and is
+    probed again after ``breaker_reset_s``.
+    """
+
+    http2: bool = True
+    timeout_s: float = 20.0
+    connect_timeout_s: float = 5.0
+    timeouts_s: dict[str, float] = Field(
+        default_factory=lambda: {"jina": 15.0, "github": 90.0}
+    )
+    max_connections_per_host: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 30.0
+    default_requests_per_s: float = 5.0
+    requests_per_s: dict[str, float] = Field(
+        default_factory=lambda: {"brave": 20.0, "exa": 5.0, "jina": 3.0}
+    )
+    max_concurrency: int = 8
+    hedge_providers: list[str] = Field(default_factory=lambda: ["brave", "exa", "jina"])
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_initial_delay_s: float = 3.0
+    breaker_failure_threshold: int = 5
+    breaker_reset_s: float = 30.0
+
+
+class SearchConfig(BaseModel):
+    """Fan-out behaviour of the ``federated_search`` tool.
+
+    Each provider's call is abandoned after ``deadlines_s[provider]`` (else
+    ``default_deadline_s``), so one slow API can't hold up the fused result.
+    """
+
+    default_deadline_s: float = 8.0
+    deadlines_s: dict[str, float] = Field(
+        default_factory=lambda: {"brave": 5.0, "exa": 8.0}
+    )
+
+
+class SearchCacheConfig(BaseModel):
+    """Brave/Exa result cache (``app/engine/search_cache.py``).
+
+    Results are fresh for ``ttl_s[provider]`` (else ``default_ttl_s``) and
+    then served stale for up to ``stale_while_revalidate_s`` more while a
+    background refresh runs. ``path`` holds the SQLite tier shared across
+    runs; ``None`` keeps the cache in memory only.
+    """
+
+    enabled: bool = True
+    max_entries: int = 1024
+    path: Path | None = DEFAULT_INDEX_DIR / "search_cache.sqlite3"
+    default_ttl_s: float = 3600.0
+    ttl_s: dict[str, float] = Field(
+        default_factory=lambda: {"brave": 6 * 3600.0, "exa": 24 * 3600.0}
+    )
+    stale_while_revalidate_s: float = 24 * 3600.0
 
 
 class Settings(BaseSettings):
     github: GithubConfig | None = None
     workflow: WorkflowConfig = WorkflowConfig()
+    jobs: JobsConfig = JobsConfig()
+    admission: AdmissionConfig = AdmissionConfig()
+    coalescing: CoalescingConfig = CoalescingConfig()
     filesystem: FilesystemConfig = FilesystemConfig()
+    memory: MemoryConfig = MemoryConfig()
+    http: HttpConfig = HttpConfig()
+    search: SearchConfig = SearchConfig()
+    search_cache: SearchCacheConfig = SearchCacheConfig()
 
     # Paths
     MEMORIES_DIR: Path = DEFAULT_MEMORIES_DIR
     VAULT_DIR: Path = DEFAULT_VAULT_DIR
     OUTPUT_DIR: Path = DEFAULT_OUTPUT_DIR
     LOGS_DIR: Path = DEFAULT_LOGS_DIR
+    INDEX_DIR: Path = DEFAULT_INDEX_DIR
 
     # Logging
     LOG_LEVEL: str = "INFO"
 
     # Checkpointer (LangGraph AsyncPostgresSaver connection string)
     DATABASE_URL: str = ""
+    checkpointer: CheckpointerConfig = CheckpointerConfig()
 
     # API Keys
     BRAVE_SEARCH_API_KEY: str = ""
@@ -0,0 +1,166 @@
+"""
+Admission control for workflow runs.
+
+Each workflow gets a lane with a max-in-flight limit and a bounded FIFO wait
+queue. A request that finds the queue full is rejected immediately; one that
+waits longer than the queue timeout is rejected when the timeout fires. The
+API layer maps both to fast 429/503 responses with ``Retry-After``.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+
+class AdmissionRejected(Exception):
+    """Raised when a run cannot be admitted."""
+
+    def __init__(self, workflow_name: str, reason: str, retry_after_s: float) -> None:
+        super().__init__(f"Workflow '{workflow_name}' is overloaded: {reason}")
+        self.workflow_name = workflow_name
+        self.retry_after_s = retry_after_s
+
+
+class QueueFullError(AdmissionRejected):
+    """Raised when the lane's wait queue is already at capacity."""
+
+
+class QueueTimeoutError(AdmissionRejected):
+    """Raised when a queued run was not admitted within the queue timeout."""
+
+
+@dataclass(slots=True)
+class _Lane:
+    limit: int
+    in_flight: int = 0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+class AdmissionController:
+    """Per-workflow concurrency limit with a bounded, timed wait queue.
+
+    Waiters are futures created on the caller's running loop, so the
+    controller itself is not bound to any event loop.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        max_queue: int = 16,
+        queue_timeout_s: float = 30.0,
+        retry_after_s: float = 10.0,
+        per_workflow: Mapping[str, int] | None = None,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        self.retry_after_s = retry_after_s
+        self.per_workflow = dict(per_workflow or {})
+        self._lanes: dict[str, _Lane] = {}
+        metrics.register_collector("admission", self.stats)
+
+    async def acquire(self, workflow_name: str) -> None:
+        """Wait for a slot in the workflow's lane or raise ``AdmissionRejected``."""
+        name = str(workflow_name)
+        lane = self._lane(name)
+        if lane.in_flight < lane.limit and not lane.waiters:
+            lane.in_flight += 1
+            self._record(name, lane, "admitted", wait_s=0.0)
+            return
+
+        if len(lane.waiters) >= self.max_queue:
+            self._record(name, lane, "rejected_queue_full")
+            raise QueueFullError(name, "wait queue is full", self.retry_after_s)
+
+        waiter = asyncio.get_running_loop().create_future()
+        lane.waiters.append(waiter)
+        self._record(name, lane, "queued")
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout_s)
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on.
+                self.release(name)
+            elif waiter in lane.waiters:
+                lane.waiters.remove(waiter)
+            if isinstance(exc, TimeoutError):
+                self._record(name, lane, "rejected_timeout")
+                raise QueueTimeoutError(
+                    name,
+                    f"not admitted within {self.queue_timeout_s:g}s",
+                    self.retry_after_s,
+                ) from exc
+            raise
+        self._record(name, lane, "admitted", wait_s=time.monotonic() - started)
+
+    def release(self, workflow_name: str) -> None:
+        """Free a slot, handing it straight to the oldest live waiter if any."""
+        name = str(workflow_name)
+        lane = self._lane(name)
+        while lane.waiters:
+            waiter = lane.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._record(name, lane)
+                return
+        lane.in_flight = max(lane.in_flight - 1, 0)
+        self._record(name, lane)
+
+    @asynccontextmanager
+    async def admit(self, workflow_name: str) -> AsyncIterator[None]:
+        await self.acquire(workflow_name)
+        try:
+            yield
+        finally:
+            self.release(workflow_name)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            name: {
+                "limit": lane.limit,
+                "in_flight": lane.in_flight,
+                "queue_depth": len(lane.waiters),
+            }
+            for name, lane in self._lanes.items()
+        }
+
+    def _lane(self, name: str) -> _Lane:
+        lane = self._lanes.get(name)
+        if lane is None:
+            limit = self.per_workflow.get(name, self.max_in_flight)
+            lane = self._lanes[name] = _Lane(limit=limit)
+        return lane
+
+    def _record(
+        self,
+        name: str,
+        lane: _Lane,
+        outcome: str | None = None,
+        wait_s: float | None = None,
+    ) -> None:
+        if outcome is not None:
+            metrics.inc(f"admission.{name}.{outcome}")
+        if wait_s is not None:
+            metrics.observe(f"admission.{name}.wait_s", wait_s)
+        metrics.set_gauge(f"admission.{name}.in_flight", lane.in_flight)
+        metrics.set_gauge(f"admission.{name}.queue_depth", len(lane.waiters))
+
+
+@lru_cache(maxsize=1)
+def get_admission_controller() -> AdmissionController:
+    config = settings.admission
+    return AdmissionController(
+        max_in_flight=config.max_in_flight,
+        max_queue=config.max_queue,
+        queue_timeout_s=config.queue_timeout_s,
+        retry_after_s=config.retry_after_s,
+        per_workflow=config.per_workflow,
+    )
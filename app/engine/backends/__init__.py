@@ -1,8 +1,16 @@
-from app.engine.backends.factory import FilesystemBackendType, get_filesystem_backend
-from app.engine.backends.protocol import FilesystemBackend
+from app.engine.backends.factory import (
+    FilesystemBackendType,
+    close_async_filesystem_backends,
+    get_async_filesystem_backend,
+    get_filesystem_backend,
+)
+from app.engine.backends.protocol import AsyncFilesystemBackend, FilesystemBackend
 
 __all__ = [
+    "AsyncFilesystemBackend",
     "FilesystemBackend",
     "FilesystemBackendType",
+    "close_async_filesystem_backends",
+    "get_async_filesystem_backend",
     "get_filesystem_backend",
 ]
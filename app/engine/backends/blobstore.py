@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tarfile
+import threading
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from app.core.metrics import metrics
+from app.core.paths import DEFAULT_ASSETS_DIR
+from app.engine.backends.errors import InvalidPathError, OperationFailedError
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.backends.protocol import DirEntry, EntryFilter
+
+BLOB_DIRNAME = ".blobs"
+_COPY_CHUNK = 1024 * 1024
+
+
+class BlobStoreFilesystemBackend(InProcessFilesystemBackend):
+    """Sandboxed local backend that stores file contents once per hash.
+
+    Every written file is a hardlink to ``{base_path}/.blobs/ab/cdef…``, named
+    by the SHA-256 of its bytes. Writing content that already exists links
+    the existing blob instead of writing it again, so consecutive repository
+    snapshots and unchanged artifact rewrites cost only the changed bytes.
+    Logical paths stay ordinary files, so readers (and ``os.stat``/``mmap``)
+    behave exactly as with ``InProcessFilesystemBackend``.
+
+    Files sharing a blob share an inode. Writes through this backend always
+    replace the link rather than modifying the inode, and ``open_write``
+    detaches a shared file before handing it out; tools editing a file in
+    place outside the backend would change every path sharing its content.
+    ``collect_garbage`` removes blobs no logical path links to any more.
+    """
+
+    def __init__(self, base_path: str | Path = DEFAULT_ASSETS_DIR) -> None:
+        super().__init__(base_path=base_path)
+        self.blob_dir = self.base_path / BLOB_DIRNAME
+        self.blob_dir.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self.blobs_written = 0
+        self.dedup_hits = 0
+        self.bytes_written = 0
+        self.bytes_deduplicated = 0
+        metrics.register_collector(f"filesystem_blobs:{self.base_path}", self.stats)
+
+    def resolve(self, path: str | Path) -> Path:
+        resolved = super().resolve(path)
+        if self._is_relative_to(resolved, self.blob_dir):
+            raise InvalidPathError(f"Blob store paths are not addressable: {path}")
+        return resolved
+
+    def walk(
+        self,
+        path: str | Path,
+        predicate: EntryFilter | None = None,
+        descend: EntryFilter | None = None,
+    ) -> Iterator[DirEntry]:
+        # Keep a walk from ``base_path`` out of the (large) blob directory.
+        blob_dir = str(self.blob_dir)
+        return super().walk(
+            path,
+            predicate=lambda entry: (
+                entry.path != blob_dir and (predicate is None or predicate(entry))
+            ),
+            descend=lambda entry: (
+                entry.path != blob_dir and (descend is None or descend(entry))
+            ),
+        )
+
+    def write_text(
+        self,
+        path: str | Path,
+        content: str,
+        encoding: str = "utf-8",
+    ) -> Path:
+        return self.write_bytes(path, content.encode(encoding))
+
+    def write_bytes(self, path: str | Path, content: bytes) -> Path:
+        target = self.resolve(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._link(self._put_blob(content), target)
+        return target
+
+    def open_write(
+        self,
+        path: str | Path,
+        mode: str = "w",
+        encoding: str | None = "utf-8",
+    ) -> TextIO | BinaryIO:
+        target = self.resolve(path)
+        try:
+            shared = target.stat().st_nlink > 1
+        except FileNotFoundError:
+            shared = False
+        if shared:
+            if "w" in mode:
+                # Truncating would empty every path sharing the blob.
+                target.unlink()
+            else:
+                self._detach(target)
+        return super().open_write(path, mode=mode, encoding=encoding)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "blobs_written": self.blobs_written,
+                "dedup_hits": self.dedup_hits,
+                "bytes_written": self.bytes_written,
+                "bytes_deduplicated": self.bytes_deduplicated,
+            }
+
+    def collect_garbage(self) -> int:
+        """Delete blobs no logical path links to and stale temp files.
+
+        Run it while nothing is writing through the backend: a blob that a
+        concurrent write is about to link may otherwise be removed. Returns
+        the number of bytes reclaimed.
+        """
+        reclaimed = 0
+        for shard in self.blob_dir.iterdir():
+            blobs = shard.iterdir() if shard.is_dir() else [shard]
+            for blob in blobs:
+                stat = blob.stat()
+                if stat.st_nlink == 1 or blob.name.endswith(".tmp"):
+                    blob.unlink(missing_ok=True)
+                    reclaimed += stat.st_size
+        return reclaimed
+
+    def _extract_member(
+        self, tar: tarfile.TarFile, member: tarfile.TarInfo, dest: Path
+    ) -> None:
+        if not member.isreg():
+            super()._extract_member(tar, member, dest)
+            return
+        # Same checks ``tar.extract(filter="data")`` applies to regular files.
+        member = tarfile.data_filter(member, str(dest))
+        target = dest / member.name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        source = tar.extractfile(member)
+        if source is None:
+            raise OperationFailedError(f"Tar member has no data: {member.name}")
+        with source:
+            self._link(self._put_blob_stream(source), target)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest[2:]
+
+    def _put_blob(self, content: bytes, fsync: bool = False) -> Path:
+        blob = self._blob_path(hashlib.sha256(content).hexdigest())
+        if blob.exists():
+            self._count(len(content), hit=True)
+            return blob
+        blob.parent.mkdir(exist_ok=True)
+        tmp = blob.with_name(f"{blob.name}.{uuid.uuid4().hex}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(content)
+            if fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, blob)
+        self._count(len(content), hit=False)
+        return blob
+
+    def _put_blob_stream(self, source: BinaryIO) -> Path:
+        # The digest is only known after reading, so stream into a temp file
+        # under the blob dir and rename it into place (or drop it on a hit).
+        digest = hashlib.sha256()
+        tmp = self.blob_dir / f"{uuid.uuid4().hex}.tmp"
+        size = 0
+        try:
+            with open(tmp, "xb") as fh:
+                while chunk := source.read(_COPY_CHUNK):
+                    digest.update(chunk)
+                    fh.write(chunk)
+                    size += len(chunk)
+            blob = self._blob_path(digest.hexdigest())
+            if blob.exists():
+                self._count(size, hit=True)
+                return blob
+            blob.parent.mkdir(exist_ok=True)
+            os.replace(tmp, blob)
+            self._count(size, hit=False)
+            return blob
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def _stage_file(self, target: Path, content: bytes, fsync: bool) -> Path | None:
+        """Store ``content`` as a blob and stage a link to it beside ``target``.
+
+        Returns ``None`` when ``target`` already holds ``content`` (it is a
+        link to the same blob) and nothing needs replacing.
+        """
+        # Blobs are immutable and unreferenced until linked, so storing them
+        # during staging keeps ``write_many`` all-or-nothing for the targets.
+        return self._stage_link(self._put_blob(content, fsync=fsync), target)
+
+    def _stage_link(self, blob: Path, target: Path) -> Path | None:
+        """Hardlink ``blob`` next to ``target``; ``None`` if already linked.
+
+        ``rename`` between two links to one inode is a no-op that leaves the
+        source behind, so the already-linked case must be skipped explicitly.
+        """
+        try:
+            if os.path.samefile(blob, target):
+                return None
+        except FileNotFoundError:
+            pass
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            os.link(blob, tmp)
+        except OSError:
+            # Cross-device or no hardlink support: fall back to a copy.
+            shutil.copyfile(blob, tmp)
+        return tmp
+
+    def _link(self, blob: Path, target: Path) -> None:
+        tmp = self._stage_link(blob, target)
+        if tmp is not None:
+            os.replace(tmp, target)
+
+    def _detach(self, target: Path) -> None:
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        shutil.copyfile(target, tmp)
+        os.replace(tmp, target)
+
+    def _count(self, size: int, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.dedup_hits += 1
+                self.bytes_deduplicated += size
+            else:
+                self.blobs_written += 1
+                self.bytes_written += size
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from app.core.metrics import metrics
+from app.core.paths import DEFAULT_ASSETS_DIR
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.backends.protocol import (
+    DirEntry,
+    EntryFilter,
+    FilesystemBackend,
+    WriteBatch,
+)
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_RESOLVE_ENTRIES = 4096
+
+
+@dataclass(slots=True)
+class _Entry:
+    mtime_ns: int
+    size: int
+    content: bytes
+
+
+class CachingFilesystemBackend:
+    """Read-through cache in front of a local ``FilesystemBackend``.
+
+    File contents are kept in an LRU bounded by ``max_bytes`` and served only
+    while the file's ``(mtime_ns, size)`` still matches, so changes made
+    outside this process are picked up on the next read. Writes, moves and
+    deletes through this backend drop the affected entries.
+
+    ``resolve`` results are memoized too: once the wrapped backend has
+    validated a path against the sandbox, later lookups skip the realpath
+    syscalls. Cache hits are validated with ``os.stat`` on that resolved
+    path, so the wrapped backend must store files on the local disk.
+    """
+
+    def __init__(
+        self,
+        base_path: str | Path = DEFAULT_ASSETS_DIR,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        backend: FilesystemBackend | None = None,
+        max_resolved: int = DEFAULT_RESOLVE_ENTRIES,
+    ) -> None:
+        self.backend = backend or InProcessFilesystemBackend(base_path=base_path)
+        self.base_path = self.backend.base_path
+        self.max_bytes = max_bytes
+        # Files larger than this are never cached so one read can't flush
+        # the whole cache.
+        self.max_entry_bytes = max_bytes // 8
+        self.max_resolved = max_resolved
+        self._entries: OrderedDict[Path, _Entry] = OrderedDict()
+        self._resolved: OrderedDict[str, Path] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.resolve_hits = 0
+        metrics.register_collector(f"filesystem_cache:{self.base_path}", self.stats)
+
+    def resolve(self, path: str | Path) -> Path:
+        key = os.fspath(path)
+        with self._lock:
+            resolved = self._resolved.get(key)
+            if resolved is not None:
+                self._resolved.move_to_end(key)
+                self.resolve_hits += 1
+                return resolved
+        resolved = self.backend.resolve(path)
+        with self._lock:
+            self._resolved[key] = resolved
+            if len(self._resolved) > self.max_resolved:
+                self._resolved.popitem(last=False)
+        return resolved
+
+    def exists(self, path: str | Path) -> bool:
+        return self.backend.exists(path)
+
+    def is_file(self, path: str | Path) -> bool:
+        return self.backend.is_file(path)
+
+    def is_dir(self, path: str | Path) -> bool:
+        return self.backend.is_dir(path)
+
+    def mkdir(
+        self,
+        path: str | Path,
+        parents: bool = True,
+        exist_ok: bool = True,
+    ) -> Path:
+        return self.backend.mkdir(path, parents=parents, exist_ok=exist_ok)
+
+    def list_dir(self, path: str | Path) -> list[Path]:
+        return self.backend.list_dir(path)
+
+    def iter_dir(
+        self, path: str | Path, predicate: EntryFilter | None = None
+    ) -> Iterator[DirEntry]:
+        return self.backend.iter_dir(path, predicate)
+
+    def walk(
+        self,
+        path: str | Path,
+        predicate: EntryFilter | None = None,
+        descend: EntryFilter | None = None,
+    ) -> Iterator[DirEntry]:
+        return self.backend.walk(path, predicate, descend)
+
+    def glob(self, path: str | Path, pattern: str) -> Iterator[DirEntry]:
+        return self.backend.glob(path, pattern)
+
+    def stat(self, path: str | Path) -> os.stat_result:
+        return os.stat(self.resolve(path))
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        resolved = self.resolve(path)
+        try:
+            stat = os.stat(resolved)
+        except FileNotFoundError:
+            self._invalidate(resolved)
+            raise
+        with self._lock:
+            entry = self._entries.get(resolved)
+            if (
+                entry is not None
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                self._entries.move_to_end(resolved)
+                self.hits += 1
+                return entry.content
+            self.misses += 1
+
+        content = self.backend.read_bytes(resolved)
+        if len(content) == stat.st_size:
+            self._store(resolved, _Entry(stat.st_mtime_ns, stat.st_size, content))
+        return content
+
+    def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
+        return self.read_bytes(path).decode(encoding)
+
+    def write_text(
+        self,
+        path: str | Path,
+        content: str,
+        encoding: str = "utf-8",
+    ) -> Path:
+        written = self.backend.write_text(path, content, encoding=encoding)
+        self._invalidate(written)
+        return written
+
+    def write_bytes(self, path: str | Path, content: bytes) -> Path:
+        written = self.backend.write_bytes(path, content)
+        self._invalidate(written)
+        return written
+
+    def write_many(
+        self,
+        files: WriteBatch,
+        encoding: str = "utf-8",
+        fsync: bool = False,
+    ) -> list[Path]:
+        written = self.backend.write_many(files, encoding=encoding, fsync=fsync)
+        for path in written:
+            self._invalidate(path)
+        return written
+
+    def open_read(
+        self,
+        path: str | Path,
+        mode: str = "r",
+        encoding: str | None = "utf-8",
+    ) -> TextIO | BinaryIO:
+        return self.backend.open_read(path, mode=mode, encoding=encoding)
+
+    def open_write(
+        self,
+        path: str | Path,
+        mode: str = "w",
+        encoding: str | None = "utf-8",
+    ) -> TextIO | BinaryIO:
+        self._invalidate(self.resolve(path))
+        return self.backend.open_write(path, mode=mode, encoding=encoding)
+
+    def delete_file(self, path: str | Path, missing_ok: bool = True) -> None:
+        self._invalidate(self.resolve(path))
+        self.backend.delete_file(path, missing_ok=missing_ok)
+
+    def delete_dir(self, path: str | Path, missing_ok: bool = True) -> None:
+        self._invalidate_tree(self.resolve(path))
+        self.backend.delete_dir(path, missing_ok=missing_ok)
+
+    def move(self, src: str | Path, dst: str | Path) -> Path:
+        self._invalidate_tree(self.resolve(src))
+        destination = self.backend.move(src, dst)
+        self._invalidate_tree(destination)
+        return destination
+
+    def extract_tar_bytes(
+        self,
+        archive_bytes: bytes,
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        dest = self.backend.extract_tar_bytes(
+            archive_bytes, destination, strip_components=strip_components
+        )
+        self._invalidate_tree(dest)
+        return dest
+
+    def extract_tar_stream(
+        self,
+        chunks: Iterable[bytes],
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        dest = self.backend.extract_tar_stream(
+            chunks, destination, strip_components=strip_components
+        )
+        self._invalidate_tree(dest)
+        return dest
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "resolve_hits": self.resolve_hits,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._resolved.clear()
+            self._bytes = 0
+
+    def _store(self, resolved: Path, entry: _Entry) -> None:
+        if entry.size > self.max_entry_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(resolved, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[resolved] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def _invalidate(self, resolved: Path) -> None:
+        with self._lock:
+            entry = self._entries.pop(resolved, None)
+            if entry is not None:
+                self._bytes -= entry.size
+                self.invalidations += 1
+
+    def _invalidate_tree(self, root: Path) -> None:
+        # Directory moves/deletes also change what cached child paths resolve
+        # to, so both caches are pruned under ``root``.
+        with self._lock:
+            for resolved in [p for p in self._entries if p.is_relative_to(root)]:
+                self._bytes -= self._entries.pop(resolved).size
+                self.invalidations += 1
+            for key in [k for k, p in self._resolved.items() if p.is_relative_to(root)]:
+                del self._resolved[key]
@@ -6,18 +6,62 @@ from pathlib import Path
 from typing import Callable
 
 from app.core.paths import DEFAULT_ASSETS_DIR
+from app.engine.backends.blobstore import BlobStoreFilesystemBackend
+from app.engine.backends.caching import CachingFilesystemBackend
 from app.engine.backends.inprocess import InProcessFilesystemBackend
-from app.engine.backends.protocol import FilesystemBackend
+from app.engine.backends.memory import MemoryFilesystemBackend
+from app.engine.backends.protocol import AsyncFilesystemBackend, FilesystemBackend
+from app.engine.backends.threaded import (
+    AsyncInProcessFilesystemBackend,
+    ThreadedAsyncFilesystemBackend,
+)
 
 
 class FilesystemBackendType(StrEnum):
     IN_PROCESS = "inprocess"
+    CACHING = "caching"
+    BLOB_STORE = "blobstore"
+    MEMORY = "memory"
+    # In memory, written behind to an ``inprocess`` backend at the same path.
+    MEMORY_WRITE_BEHIND = "memory_writebehind"
 
 
+WRITE_BEHIND_INTERVAL_S = 1.0
+
 BackendFactory = Callable[[str | Path], FilesystemBackend]
+# Builds the async backend around the (cached) sync backend of the same type
+# and the configured number of I/O threads.
+AsyncBackendFactory = Callable[[FilesystemBackend, int], AsyncFilesystemBackend]
 
 BACKEND_FACTORIES: dict[FilesystemBackendType, BackendFactory] = {
     FilesystemBackendType.IN_PROCESS: InProcessFilesystemBackend,
+    FilesystemBackendType.CACHING: CachingFilesystemBackend,
+    FilesystemBackendType.BLOB_STORE: BlobStoreFilesystemBackend,
+    FilesystemBackendType.MEMORY: MemoryFilesystemBackend,
+    FilesystemBackendType.MEMORY_WRITE_BEHIND: lambda base_path: (
+        MemoryFilesystemBackend(
+            flush_to=InProcessFilesystemBackend(base_path),
+            flush_interval_s=WRITE_BEHIND_INTERVAL_S,
+        )
+    ),
+}
+
+ASYNC_BACKEND_FACTORIES: dict[FilesystemBackendType, AsyncBackendFactory] = {
+    FilesystemBackendType.IN_PROCESS: lambda backend, max_workers: (
+        AsyncInProcessFilesystemBackend(backend=backend, max_workers=max_workers)
+    ),
+    FilesystemBackendType.CACHING: lambda backend, max_workers: (
+        AsyncInProcessFilesystemBackend(backend=backend, max_workers=max_workers)
+    ),
+    FilesystemBackendType.BLOB_STORE: lambda backend, max_workers: (
+        AsyncInProcessFilesystemBackend(backend=backend, max_workers=max_workers)
+    ),
+    FilesystemBackendType.MEMORY: lambda backend, max_workers: (
+        ThreadedAsyncFilesystemBackend(backend, max_workers=max_workers)
+    ),
+    FilesystemBackendType.MEMORY_WRITE_BEHIND: lambda backend, max_workers: (
+        ThreadedAsyncFilesystemBackend(backend, max_workers=max_workers)
+    ),
 }
 
 
@@ -36,3 +80,29 @@ def get_filesystem_backend(
     # Normalize so ``"/x"`` and ``Path("/x")`` share one cache entry.
     key = str(Path(base_path).expanduser().resolve())
     return _cached_backend(backend_type, key)
+
+
+_ASYNC_BACKENDS: dict[
+    tuple[FilesystemBackendType, str, int], AsyncFilesystemBackend
+] = {}
+
+
+def get_async_filesystem_backend(
+    backend_type: FilesystemBackendType = FilesystemBackendType.IN_PROCESS,
+    base_path: str | Path = DEFAULT_ASSETS_DIR,
+    max_workers: int = 4,
+) -> AsyncFilesystemBackend:
+    key = (backend_type, str(Path(base_path).expanduser().resolve()), max_workers)
+    backend = _ASYNC_BACKENDS.get(key)
+    if backend is None:
+        sync_backend = _cached_backend(backend_type, key[1])
+        backend = ASYNC_BACKEND_FACTORIES[backend_type](sync_backend, max_workers)
+        _ASYNC_BACKENDS[key] = backend
+    return backend
+
+
+def close_async_filesystem_backends() -> None:
+    """Shut down the I/O threads of every async backend handed out so far."""
+    while _ASYNC_BACKENDS:
+        _, backend = _ASYNC_BACKENDS.popitem()
+        backend.shutdown()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import io
+import os
 import shutil
 import tarfile
-from pathlib import Path
+import uuid
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path, PurePosixPath
 from typing import BinaryIO, TextIO
 
 from app.core.paths import DEFAULT_ASSETS_DIR
@@ -12,6 +15,12 @@ from app.engine.backends.errors import (
     OperationFailedError,
     PathEscapeError,
 )
+from app.engine.backends.protocol import (
+    DirEntry,
+    EntryFilter,
+    FilesystemBackend,
+    WriteBatch,
+)
 
 
 class InProcessFilesystemBackend:
@@ -56,6 +65,48 @@ class InProcessFilesystemBackend:
             return []
         return sorted(target.iterdir())
 
+    def iter_dir(
+        self, path: str | Path, predicate: EntryFilter | None = None
+    ) -> Iterator[DirEntry]:
+        # Only the root goes through ``resolve``; children are derived from
+        # the already-sandboxed directory.
+        try:
+            with os.scandir(self.resolve(path)) as entries:
+                for entry in entries:
+                    if predicate is None or predicate(entry):
+                        yield entry
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+    def walk(
+        self,
+        path: str | Path,
+        predicate: EntryFilter | None = None,
+        descend: EntryFilter | None = None,
+    ) -> Iterator[DirEntry]:
+        stack = [self.resolve(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    subdirs: list[str] = []
+                    for entry in entries:
+                        if predicate is None or predicate(entry):
+                            yield entry
+                        # Never follow symlinked directories out of the sandbox.
+                        if entry.is_dir(follow_symlinks=False) and (
+                            descend is None or descend(entry)
+                        ):
+                            subdirs.append(entry.path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            stack.extend(reversed(subdirs))
+
+    def glob(self, path: str | Path, pattern: str) -> Iterator[DirEntry]:
+        return glob_entries(self, path, pattern)
+
+    def stat(self, path: str | Path) -> os.stat_result:
+        return self.resolve(path).stat()
+
     def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
         return self.resolve(path).read_text(encoding=encoding)
 
@@ -79,6 +130,74 @@ class InProcessFilesystemBackend:
         target.write_bytes(content)
         return target
 
+    def write_many(
+        self,
+        files: WriteBatch,
+        encoding: str = "utf-8",
+        fsync: bool = False,
+    ) -> list[Path]:
+        items = files.items() if isinstance(files, Mapping) else files
+        # Resolve everything before touching the disk so one bad path fails
+        # the batch up front. A repeated path keeps its last content.
+        batch: dict[Path, bytes] = {}
+        for path, content in items:
+            target = self.resolve(path)
+            if target.is_dir():
+                raise InvalidPathError(f"Expected file path, got directory: {target}")
+            batch[target] = (
+                content.encode(encoding) if isinstance(content, str) else content
+            )
+
+        parents = {target.parent for target in batch}
+        for parent in parents:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # Stage every file next to its target first; a failure or crash here
+        # leaves only hidden temp files behind and no target half-written.
+        staged: list[tuple[Path, Path]] = []
+        try:
+            for target, content in batch.items():
+                tmp = self._stage_file(target, content, fsync)
+                if tmp is not None:
+                    staged.append((tmp, target))
+        except OSError as exc:
+            for tmp, _ in staged:
+                tmp.unlink(missing_ok=True)
+            raise OperationFailedError(f"Unable to stage batch write: {exc}") from exc
+
+        for tmp, target in staged:
+            os.replace(tmp, target)
+        if fsync:
+            # Persist the renames: one directory fsync per parent, not per file.
+            for parent in parents:
+                dir_fd = os.open(parent, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+        return list(batch)
+
+    def _stage_file(self, target: Path, content: bytes, fsync: bool) -> Path | None:
+        """Write ``content`` to a hidden temp file beside ``target``.
+
+        Returns the temp path to ``os.replace`` onto ``target``. The return
+        type allows ``None`` for overrides that can skip the replace.
+        """
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        # O_EXCL with 0o666 gives the same umask-derived mode as
+        # ``write_bytes``; ``mkstemp`` would leave the file 0600.
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(content)
+                if fsync:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return tmp
+
     def open_read(
         self,
         path: str | Path,
@@ -133,12 +252,24 @@ class InProcessFilesystemBackend:
         archive_bytes: bytes,
         destination: str | Path,
         strip_components: int = 1,
+    ) -> Path:
+        return self.extract_tar_stream(
+            (archive_bytes,), destination, strip_components=strip_components
+        )
+
+    def extract_tar_stream(
+        self,
+        chunks: Iterable[bytes],
+        destination: str | Path,
+        strip_components: int = 1,
     ) -> Path:
         dest = self.mkdir(destination)
 
         try:
-            with tarfile.open(fileobj=io.BytesIO(archive_bytes), mode="r:*") as tar:
-                for member in tar.getmembers():
+            # Stream mode reads members strictly in order and keeps no member
+            # index, so memory stays flat however large the archive is.
+            with tarfile.open(fileobj=_ChunkReader(chunks), mode="r|*") as tar:
+                for member in tar:
                     stripped_name = self._strip_member_name(
                         member.name,
                         strip_components,
@@ -154,12 +285,17 @@ class InProcessFilesystemBackend:
                         )
 
                     member.name = stripped_name.as_posix()
-                    tar.extract(member, path=dest, filter="data")
+                    self._extract_member(tar, member, dest)
         except (tarfile.TarError, OSError) as exc:
             raise OperationFailedError(f"Unable to extract tar archive: {exc}") from exc
 
         return dest
 
+    def _extract_member(
+        self, tar: tarfile.TarFile, member: tarfile.TarInfo, dest: Path
+    ) -> None:
+        tar.extract(member, path=dest, filter="data")
+
     def _strip_member_name(self, name: str, strip_components: int) -> Path | None:
         member_path = Path(name)
         parts = member_path.parts
@@ -183,3 +319,52 @@ class InProcessFilesystemBackend:
             return True
         except ValueError:
             return False
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterable of byte chunks.
+
+    Holds at most one chunk at a time, which is what lets ``tarfile`` in
+    stream mode consume an HTTP body without buffering it.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def glob_entries(
+    backend: FilesystemBackend, path: str | Path, pattern: str
+) -> Iterator[DirEntry]:
+    """``FilesystemBackend.glob`` on top of the backend's own ``walk``."""
+    root = backend.resolve(path)
+    prefix = len(str(root)) + 1
+    parts = PurePosixPath(pattern).parts
+    # Without ``**`` a match can sit at most ``len(parts)`` levels down.
+    max_depth = None if "**" in parts else len(parts)
+
+    def relative(entry: DirEntry) -> PurePosixPath:
+        return PurePosixPath(entry.path[prefix:].replace(os.sep, "/"))
+
+    def descend(entry: DirEntry) -> bool:
+        return max_depth is None or len(relative(entry).parts) < max_depth
+
+    return backend.walk(
+        root,
+        predicate=lambda entry: relative(entry).full_match(pattern),
+        descend=descend,
+    )
@@ -0,0 +1,550 @@
+from __future__ import annotations
+
+import atexit
+import io
+import itertools
+import logging
+import os
+import stat
+import tarfile
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from app.core.metrics import metrics
+from app.core.paths import DEFAULT_ASSETS_DIR
+from app.engine.backends.errors import (
+    InvalidPathError,
+    OperationFailedError,
+    PathEscapeError,
+)
+from app.engine.backends.inprocess import _ChunkReader, glob_entries
+from app.engine.backends.protocol import (
+    DirEntry,
+    EntryFilter,
+    FilesystemBackend,
+    WriteBatch,
+)
+
+# ``app.core.logger`` imports settings, which imports this package.
+logger = logging.getLogger(__name__)
+
+_INODES = itertools.count(1)
+
+
+@dataclass(slots=True)
+class _MemoryFile:
+    content: bytes
+    mtime_ns: int
+    ino: int
+
+
+class _MemoryDirEntry:
+    """``DirEntry`` for a path held by ``MemoryFilesystemBackend``."""
+
+    __slots__ = ("_backend", "_is_dir", "name", "path")
+
+    def __init__(
+        self, backend: MemoryFilesystemBackend, path: Path, is_dir: bool
+    ) -> None:
+        self._backend = backend
+        self._is_dir = is_dir
+        self.name = path.name
+        self.path = str(path)
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._is_dir
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return not self._is_dir
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        return self._backend.stat(self.path)
+
+
+class _MemoryWriter(io.BytesIO):
+    """Buffer that stores its contents in the backend when closed."""
+
+    def __init__(
+        self,
+        backend: MemoryFilesystemBackend,
+        target: Path,
+        initial: bytes,
+        append: bool,
+    ) -> None:
+        super().__init__(initial)
+        self._backend = backend
+        self._target = target
+        self._append = append
+        if append:
+            self.seek(0, io.SEEK_END)
+
+    def write(self, data: bytes) -> int:
+        if self._append:
+            # Like O_APPEND: every write lands at the current end.
+            self.seek(0, io.SEEK_END)
+        return super().write(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._backend._store(self._target, self.getvalue())
+        super().close()
+
+
+class MemoryFilesystemBackend:
+    """Sandboxed backend that keeps every file in process memory.
+
+    Paths follow the same ``base_path`` rules as
+    ``InProcessFilesystemBackend``; they are normalized lexically since there
+    are no symlinks to follow. Contents are gone when the process exits
+    unless a ``flush_to`` backend is given: then changed files are written
+    behind to it in one ``write_many`` batch per flush, every
+    ``flush_interval_s`` seconds on a background thread (``0`` disables the
+    thread) and on ``close()``, which also runs at interpreter exit.
+
+    The store starts empty; it does not read what ``flush_to`` already holds.
+    """
+
+    def __init__(
+        self,
+        base_path: str | Path = DEFAULT_ASSETS_DIR,
+        flush_to: FilesystemBackend | None = None,
+        flush_interval_s: float = 0.0,
+    ) -> None:
+        self.flush_to = flush_to
+        self.base_path = (
+            flush_to.base_path
+            if flush_to is not None
+            else Path(base_path).expanduser().resolve()
+        )
+        self._files: dict[Path, _MemoryFile] = {}
+        self._children: dict[Path, set[str]] = {self.base_path: set()}
+        self._lock = threading.RLock()
+        # Write-behind bookkeeping: paths whose on-disk copy is stale.
+        self._dirty: set[Path] = set()
+        self._deleted_dirs: set[Path] = set()
+        self._flush_lock = threading.Lock()
+        self.flushes = 0
+        self.flushed_files = 0
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if flush_to is not None:
+            if flush_interval_s > 0:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    args=(flush_interval_s,),
+                    name="fs-write-behind",
+                    daemon=True,
+                )
+                self._flusher.start()
+            atexit.register(self.close)
+        metrics.register_collector(f"filesystem_memory:{self.base_path}", self.stats)
+
+    def resolve(self, path: str | Path) -> Path:
+        candidate = Path(path).expanduser()
+        if not candidate.is_absolute():
+            candidate = self.base_path / candidate
+        resolved = Path(os.path.normpath(candidate))
+        if resolved != self.base_path and not resolved.is_relative_to(self.base_path):
+            raise PathEscapeError(
+                f"Path '{resolved}' escapes base path '{self.base_path}'"
+            )
+        return resolved
+
+    def exists(self, path: str | Path) -> bool:
+        target = self.resolve(path)
+        with self._lock:
+            return target in self._files or target in self._children
+
+    def is_file(self, path: str | Path) -> bool:
+        target = self.resolve(path)
+        with self._lock:
+            return target in self._files
+
+    def is_dir(self, path: str | Path) -> bool:
+        target = self.resolve(path)
+        with self._lock:
+            return target in self._children
+
+    def mkdir(
+        self,
+        path: str | Path,
+        parents: bool = True,
+        exist_ok: bool = True,
+    ) -> Path:
+        target = self.resolve(path)
+        with self._lock:
+            if target in self._files:
+                raise FileExistsError(f"File exists: {target}")
+            if target in self._children:
+                if not exist_ok:
+                    raise FileExistsError(f"Directory exists: {target}")
+                return target
+            if not parents and target.parent not in self._children:
+                raise FileNotFoundError(f"Parent directory missing: {target.parent}")
+            self._make_dirs(target)
+        return target
+
+    def list_dir(self, path: str | Path) -> list[Path]:
+        target = self.resolve(path)
+        with self._lock:
+            names = sorted(self._children.get(target, ()))
+        return [target / name for name in names]
+
+    def iter_dir(
+        self, path: str | Path, predicate: EntryFilter | None = None
+    ) -> Iterator[DirEntry]:
+        for entry in self._entries(self.resolve(path)):
+            if predicate is None or predicate(entry):
+                yield entry
+
+    def walk(
+        self,
+        path: str | Path,
+        predicate: EntryFilter | None = None,
+        descend: EntryFilter | None = None,
+    ) -> Iterator[DirEntry]:
+        stack = [self.resolve(path)]
+        while stack:
+            subdirs: list[Path] = []
+            for entry in self._entries(stack.pop()):
+                if predicate is None or predicate(entry):
+                    yield entry
+                if entry.is_dir() and (descend is None or descend(entry)):
+                    subdirs.append(Path(entry.path))
+            stack.extend(reversed(subdirs))
+
+    def glob(self, path: str | Path, pattern: str) -> Iterator[DirEntry]:
+        return glob_entries(self, path, pattern)
+
+    def stat(self, path: str | Path) -> os.stat_result:
+        target = self.resolve(path)
+        with self._lock:
+            file = self._files.get(target)
+            if file is not None:
+                mode, size, mtime_ns, ino = (
+                    stat.S_IFREG | 0o644,
+                    len(file.content),
+                    file.mtime_ns,
+                    file.ino,
+                )
+            elif target in self._children:
+                mode, size, mtime_ns, ino = stat.S_IFDIR | 0o755, 0, 0, 0
+            else:
+                raise FileNotFoundError(f"No such file or directory: {target}")
+        seconds = mtime_ns // 1_000_000_000
+        return os.stat_result(
+            (mode, ino, 0, 1, 0, 0, size, seconds, seconds, seconds),
+            {"st_mtime_ns": mtime_ns, "st_atime_ns": mtime_ns},
+        )
+
+    def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
+        return self.read_bytes(path).decode(encoding)
+
+    def write_text(
+        self,
+        path: str | Path,
+        content: str,
+        encoding: str = "utf-8",
+    ) -> Path:
+        return self.write_bytes(path, content.encode(encoding))
+
+    def read_bytes(self, path: str | Path) -> bytes:
+        target = self.resolve(path)
+        with self._lock:
+            file = self._files.get(target)
+            if file is None:
+                if target in self._children:
+                    raise IsADirectoryError(f"Is a directory: {target}")
+                raise FileNotFoundError(f"No such file: {target}")
+            return file.content
+
+    def write_bytes(self, path: str | Path, content: bytes) -> Path:
+        target = self.resolve(path)
+        self._store(target, bytes(content))
+        return target
+
+    def write_many(
+        self,
+        files: WriteBatch,
+        encoding: str = "utf-8",
+        fsync: bool = False,
+    ) -> list[Path]:
+        items = files.items() if isinstance(files, Mapping) else files
+        batch: dict[Path, bytes] = {}
+        for path, content in items:
+            target = self.resolve(path)
+            batch[target] = (
+                content.encode(encoding) if isinstance(content, str) else content
+            )
+        with self._lock:
+            for target in batch:
+                if target in self._children:
+                    raise InvalidPathError(
+                        f"Expected file path, got directory: {target}"
+                    )
+            # One lock hold makes the batch visible to readers all at once.
+            for target, content in batch.items():
+                self._store(target, content)
+        return list(batch)
+
+    def open_read(
+        self,
+        path: str | Path,
+        mode: str = "r",
+        encoding: str | None = "utf-8",
+    ) -> TextIO | BinaryIO:
+        buffer = io.BytesIO(self.read_bytes(path))
+        if "b" in mode:
+            return buffer
+        return io.TextIOWrapper(buffer, encoding=encoding)
+
+    def open_write(
+        self,
+        path: str | Path,
+        mode: str = "w",
+        encoding: str | None = "utf-8",
+    ) -> TextIO | BinaryIO:
+        target = self.resolve(path)
+        with self._lock:
+            if target in self._children:
+                raise IsADirectoryError(f"Is a directory: {target}")
+            existing = self._files.get(target)
+            if "x" in mode and existing is not None:
+                raise FileExistsError(f"File exists: {target}")
+            if "r" in mode and existing is None:
+                raise FileNotFoundError(f"No such file: {target}")
+            self._make_dirs(target.parent)
+        keep = existing is not None and ("a" in mode or "r" in mode)
+        writer = _MemoryWriter(
+            self, target, existing.content if keep else b"", append="a" in mode
+        )
+        if "r" in mode:
+            writer.seek(0)
+        if "b" in mode:
+            return writer
+        return io.TextIOWrapper(writer, encoding=encoding)
+
+    def delete_file(self, path: str | Path, missing_ok: bool = True) -> None:
+        target = self.resolve(path)
+        with self._lock:
+            if target in self._children:
+                raise IsADirectoryError(f"Is a directory: {target}")
+            if self._files.pop(target, None) is None:
+                if not missing_ok:
+                    raise FileNotFoundError(f"No such file: {target}")
+                return
+            self._children[target.parent].discard(target.name)
+            self._mark_dirty(target)
+
+    def delete_dir(self, path: str | Path, missing_ok: bool = True) -> None:
+        target = self.resolve(path)
+        with self._lock:
+            if target in self._files:
+                raise InvalidPathError(f"Expected directory path, got file: {target}")
+            if target not in self._children:
+                if not missing_ok:
+                    raise FileNotFoundError(f"No such directory: {target}")
+                return
+            self._remove_tree(target)
+            if self.flush_to is not None:
+                self._deleted_dirs.add(target)
+
+    def move(self, src: str | Path, dst: str | Path) -> Path:
+        source = self.resolve(src)
+        destination = self.resolve(dst)
+        with self._lock:
+            if destination in self._children and source not in self._children:
+                # ``shutil.move`` semantics: moving into an existing directory.
+                destination = destination / source.name
+            if source in self._files:
+                file = self._files.pop(source)
+                self._children[source.parent].discard(source.name)
+                self._mark_dirty(source)
+                self._make_dirs(destination.parent)
+                self._files[destination] = file
+                self._children[destination.parent].add(destination.name)
+                self._mark_dirty(destination)
+            elif source in self._children:
+                if destination.is_relative_to(source):
+                    raise InvalidPathError(
+                        f"Cannot move '{source}' into itself: {destination}"
+                    )
+                moved = {
+                    path: file
+                    for path, file in self._files.items()
+                    if path.is_relative_to(source)
+                }
+                dirs = [path for path in self._children if path.is_relative_to(source)]
+                self._remove_tree(source)
+                if self.flush_to is not None:
+                    self._deleted_dirs.add(source)
+                for path in dirs:
+                    self._make_dirs(destination / path.relative_to(source))
+                for path, file in moved.items():
+                    new_path = destination / path.relative_to(source)
+                    self._files[new_path] = file
+                    self._children[new_path.parent].add(new_path.name)
+                    self._mark_dirty(new_path)
+            else:
+                raise FileNotFoundError(f"No such file or directory: {source}")
+        return destination
+
+    def extract_tar_bytes(
+        self,
+        archive_bytes: bytes,
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        return self.extract_tar_stream(
+            (archive_bytes,), destination, strip_components=strip_components
+        )
+
+    def extract_tar_stream(
+        self,
+        chunks: Iterable[bytes],
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        dest = self.mkdir(destination)
+        try:
+            with tarfile.open(fileobj=_ChunkReader(chunks), mode="r|*") as tar:
+                for member in tar:
+                    parts = Path(member.name).parts
+                    if len(parts) <= strip_components:
+                        continue
+                    stripped = Path(*parts[strip_components:])
+                    if stripped.is_absolute():
+                        raise PathEscapeError(
+                            f"Absolute tar member path is not allowed: {member.name}"
+                        )
+                    target = self.resolve(dest / stripped)
+                    if not target.is_relative_to(dest):
+                        raise PathEscapeError(
+                            f"Tar member escapes destination: {member.name}"
+                        )
+                    if member.isdir():
+                        self.mkdir(target)
+                    elif member.isreg():
+                        source = tar.extractfile(member)
+                        if source is not None:
+                            with source:
+                                self.write_bytes(target, source.read())
+                    # Links and special files have no in-memory equivalent.
+        except (tarfile.TarError, OSError) as exc:
+            raise OperationFailedError(f"Unable to extract tar archive: {exc}") from exc
+        return dest
+
+    def flush(self) -> int:
+        """Write changed files behind to ``flush_to``. Returns files written."""
+        if self.flush_to is None:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, set()
+                deleted_dirs, self._deleted_dirs = self._deleted_dirs, set()
+                writes = {
+                    path.relative_to(self.base_path): self._files[path].content
+                    for path in dirty
+                    if path in self._files
+                }
+            deletes = [
+                path.relative_to(self.base_path)
+                for path in dirty
+                if path.relative_to(self.base_path) not in writes
+            ]
+            try:
+                for path in deleted_dirs:
+                    self.flush_to.delete_dir(path.relative_to(self.base_path))
+                for path in deletes:
+                    self.flush_to.delete_file(path)
+                if writes:
+                    self.flush_to.write_many(writes)
+            except Exception:
+                with self._lock:
+                    # Retry on the next flush; newer changes are already queued.
+                    self._dirty |= dirty
+                    self._deleted_dirs |= deleted_dirs
+                raise
+            self.flushes += 1
+            self.flushed_files += len(writes)
+            return len(writes)
+
+    def close(self) -> None:
+        """Stop the background flusher and write out anything still dirty."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "bytes": sum(len(file.content) for file in self._files.values()),
+                "dirty": len(self._dirty),
+                "flushes": self.flushes,
+                "flushed_files": self.flushed_files,
+            }
+
+    def _flush_loop(self, interval_s: float) -> None:
+        while not self._stop.wait(interval_s):
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.exception(f"Write-behind flush failed: {exc}")
+
+    def _entries(self, directory: Path) -> list[_MemoryDirEntry]:
+        # Snapshot under the lock so callers may write while iterating.
+        with self._lock:
+            paths = [directory / name for name in self._children.get(directory, ())]
+            return [
+                _MemoryDirEntry(self, path, path in self._children) for path in paths
+            ]
+
+    def _store(self, target: Path, content: bytes) -> None:
+        with self._lock:
+            if target in self._children:
+                raise IsADirectoryError(f"Is a directory: {target}")
+            self._make_dirs(target.parent)
+            previous = self._files.get(target)
+            self._files[target] = _MemoryFile(
+                content,
+                time.time_ns(),
+                previous.ino if previous is not None else next(_INODES),
+            )
+            self._children[target.parent].add(target.name)
+            self._mark_dirty(target)
+
+    def _make_dirs(self, target: Path) -> None:
+        missing: list[Path] = []
+        while target not in self._children:
+            if target in self._files:
+                raise NotADirectoryError(f"Not a directory: {target}")
+            missing.append(target)
+            target = target.parent
+        for directory in reversed(missing):
+            self._children[directory] = set()
+            self._children[directory.parent].add(directory.name)
+
+    def _remove_tree(self, root: Path) -> None:
+        for path in [path for path in self._files if path.is_relative_to(root)]:
+            del self._files[path]
+            self._dirty.discard(path)
+        for path in [path for path in self._children if path.is_relative_to(root)]:
+            del self._children[path]
+        if root != self.base_path:
+            self._children[root.parent].discard(root.name)
+        else:
+            self._children[root] = set()
+
+    def _mark_dirty(self, target: Path) -> None:
+        if self.flush_to is not None:
+            self._dirty.add(target)
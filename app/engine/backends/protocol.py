@@ -1,7 +1,33 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
-from typing import BinaryIO, Protocol, TextIO, runtime_checkable
+from typing import BinaryIO, Protocol, TextIO, TypeVar, runtime_checkable
+
+T = TypeVar("T")
+
+
+class DirEntry(Protocol):
+    """The subset of ``os.DirEntry`` that directory scans hand out."""
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def path(self) -> str: ...
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool: ...
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool: ...
+
+    def is_symlink(self) -> bool: ...
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result: ...
+
+
+EntryFilter = Callable[[DirEntry], bool]
+WriteBatch = Mapping[str | Path, str | bytes] | Iterable[tuple[str | Path, str | bytes]]
 
 
 @runtime_checkable
@@ -25,6 +51,40 @@ class FilesystemBackend(Protocol):
 
     def list_dir(self, path: str | Path) -> list[Path]: ...
 
+    def iter_dir(
+        self, path: str | Path, predicate: EntryFilter | None = None
+    ) -> Iterator[DirEntry]:
+        """Yield the entries of one directory level, unsorted, as they are read.
+
+        A missing directory yields nothing. Entries carry cached type/stat
+        info, so filtering by ``entry.is_file()`` costs no extra syscall on
+        most platforms.
+        """
+        ...
+
+    def walk(
+        self,
+        path: str | Path,
+        predicate: EntryFilter | None = None,
+        descend: EntryFilter | None = None,
+    ) -> Iterator[DirEntry]:
+        """Yield every entry below ``path``, depth first.
+
+        ``descend`` decides which directories are entered (all by default);
+        symlinked directories are never followed.
+        """
+        ...
+
+    def glob(self, path: str | Path, pattern: str) -> Iterator[DirEntry]:
+        """Yield entries whose path relative to ``path`` matches ``pattern``.
+
+        ``*`` and ``?`` stay within one path segment; ``**`` spans any number.
+        Only as many levels as the pattern needs are scanned.
+        """
+        ...
+
+    def stat(self, path: str | Path) -> os.stat_result: ...
+
     def read_text(self, path: str | Path, encoding: str = "utf-8") -> str: ...
 
     def write_text(
@@ -38,6 +98,19 @@ class FilesystemBackend(Protocol):
 
     def write_bytes(self, path: str | Path, content: bytes) -> Path: ...
 
+    def write_many(
+        self,
+        files: WriteBatch,
+        encoding: str = "utf-8",
+        fsync: bool = False,
+    ) -> list[Path]:
+        """Write several files, each atomically, validating every path first.
+
+        ``str`` contents are encoded with ``encoding``. Nothing is replaced
+        unless every file was staged; ``fsync`` makes the batch durable.
+        """
+        ...
+
     def open_read(
         self,
         path: str | Path,
@@ -68,3 +141,94 @@ class FilesystemBackend(Protocol):
         destination: str | Path,
         strip_components: int = 1,
     ) -> Path: ...
+
+    def extract_tar_stream(
+        self,
+        chunks: Iterable[bytes],
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        """Extract a (possibly compressed) tar archive read from ``chunks``.
+
+        Members are extracted one at a time as they arrive, under the same
+        sandbox and ``strip_components`` rules as ``extract_tar_bytes``.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncFilesystemBackend(Protocol):
+    """Awaitable counterpart of ``FilesystemBackend`` for use on the event loop.
+
+    ``resolve`` stays synchronous (pure path policy). ``run_sync`` runs a
+    composite synchronous operation against ``backend`` off the loop, for
+    helpers that need several calls in a row (e.g. ``persist_memories``).
+    """
+
+    base_path: Path
+    backend: FilesystemBackend
+
+    def resolve(self, path: str | Path) -> Path: ...
+
+    async def exists(self, path: str | Path) -> bool: ...
+
+    async def is_file(self, path: str | Path) -> bool: ...
+
+    async def is_dir(self, path: str | Path) -> bool: ...
+
+    async def mkdir(
+        self,
+        path: str | Path,
+        parents: bool = True,
+        exist_ok: bool = True,
+    ) -> Path: ...
+
+    async def list_dir(self, path: str | Path) -> list[Path]: ...
+
+    async def stat(self, path: str | Path) -> os.stat_result: ...
+
+    async def read_text(self, path: str | Path, encoding: str = "utf-8") -> str: ...
+
+    async def write_text(
+        self,
+        path: str | Path,
+        content: str,
+        encoding: str = "utf-8",
+    ) -> Path: ...
+
+    async def read_bytes(self, path: str | Path) -> bytes: ...
+
+    async def write_bytes(self, path: str | Path, content: bytes) -> Path: ...
+
+    async def write_many(
+        self,
+        files: WriteBatch,
+        encoding: str = "utf-8",
+        fsync: bool = False,
+    ) -> list[Path]: ...
+
+    async def delete_file(self, path: str | Path, missing_ok: bool = True) -> None: ...
+
+    async def delete_dir(self, path: str | Path, missing_ok: bool = True) -> None: ...
+
+    async def move(self, src: str | Path, dst: str | Path) -> Path: ...
+
+    async def extract_tar_bytes(
+        self,
+        archive_bytes: bytes,
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path: ...
+
+    async def extract_tar_stream(
+        self,
+        chunks: Iterable[bytes],
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path: ...
+
+    async def run_sync(
+        self, fn: Callable[..., T], /, *args: object, **kwargs: object
+    ) -> T: ...
+
+    def shutdown(self) -> None: ...
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+from app.core.paths import DEFAULT_ASSETS_DIR
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.backends.protocol import FilesystemBackend, WriteBatch
+
+T = TypeVar("T")
+
+
+class ThreadedAsyncFilesystemBackend:
+    """Async adapter that runs a synchronous backend on a bounded thread pool.
+
+    The pool is private to the adapter, so slow disk I/O queues behind at most
+    ``max_workers`` threads instead of tying up the loop or the default
+    executor shared with the rest of the app.
+    """
+
+    def __init__(self, backend: FilesystemBackend, max_workers: int = 4) -> None:
+        self.backend = backend
+        self.base_path = backend.base_path
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fs-io"
+        )
+
+    async def run_sync(
+        self, fn: Callable[..., T], /, *args: object, **kwargs: object
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    def resolve(self, path: str | Path) -> Path:
+        return self.backend.resolve(path)
+
+    async def exists(self, path: str | Path) -> bool:
+        return await self.run_sync(self.backend.exists, path)
+
+    async def is_file(self, path: str | Path) -> bool:
+        return await self.run_sync(self.backend.is_file, path)
+
+    async def is_dir(self, path: str | Path) -> bool:
+        return await self.run_sync(self.backend.is_dir, path)
+
+    async def mkdir(
+        self,
+        path: str | Path,
+        parents: bool = True,
+        exist_ok: bool = True,
+    ) -> Path:
+        return await self.run_sync(self.backend.mkdir, path, parents, exist_ok)
+
+    async def list_dir(self, path: str | Path) -> list[Path]:
+        return await self.run_sync(self.backend.list_dir, path)
+
+    async def stat(self, path: str | Path) -> os.stat_result:
+        return await self.run_sync(self.backend.stat, path)
+
+    async def read_text(self, path: str | Path, encoding: str = "utf-8") -> str:
+        return await self.run_sync(self.backend.read_text, path, encoding)
+
+    async def write_text(
+        self,
+        path: str | Path,
+        content: str,
+        encoding: str = "utf-8",
+    ) -> Path:
+        return await self.run_sync(self.backend.write_text, path, content, encoding)
+
+    async def read_bytes(self, path: str | Path) -> bytes:
+        return await self.run_sync(self.backend.read_bytes, path)
+
+    async def write_bytes(self, path: str | Path, content: bytes) -> Path:
+        return await self.run_sync(self.backend.write_bytes, path, content)
+
+    async def write_many(
+        self,
+        files: WriteBatch,
+        encoding: str = "utf-8",
+        fsync: bool = False,
+    ) -> list[Path]:
+        return await self.run_sync(self.backend.write_many, files, encoding, fsync)
+
+    async def delete_file(self, path: str | Path, missing_ok: bool = True) -> None:
+        await self.run_sync(self.backend.delete_file, path, missing_ok)
+
+    async def delete_dir(self, path: str | Path, missing_ok: bool = True) -> None:
+        await self.run_sync(self.backend.delete_dir, path, missing_ok)
+
+    async def move(self, src: str | Path, dst: str | Path) -> Path:
+        return await self.run_sync(self.backend.move, src, dst)
+
+    async def extract_tar_bytes(
+        self,
+        archive_bytes: bytes,
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        return await self.run_sync(
+            self.backend.extract_tar_bytes,
+            archive_bytes,
+            destination,
+            strip_components,
+        )
+
+    async def extract_tar_stream(
+        self,
+        chunks: Iterable[bytes],
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        # ``chunks`` is pulled from the I/O thread, so a blocking iterator
+        # (e.g. ``httpx.Response.iter_bytes``) never stalls the loop.
+        return await self.run_sync(
+            self.backend.extract_tar_stream,
+            chunks,
+            destination,
+            strip_components,
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=False)
+
+
+class AsyncInProcessFilesystemBackend(ThreadedAsyncFilesystemBackend):
+    """``InProcessFilesystemBackend`` behind a bounded I/O thread pool."""
+
+    def __init__(
+        self,
+        base_path: str | Path = DEFAULT_ASSETS_DIR,
+        max_workers: int = 4,
+        backend: FilesystemBackend | None = None,
+    ) -> None:
+        super().__init__(
+            backend or InProcessFilesystemBackend(base_path=base_path),
+            max_workers=max_workers,
+        )
@@ -0,0 +1,111 @@
+"""
+Process-wide LangGraph checkpointer.
+
+With ``DATABASE_URL`` set, checkpoints go to Postgres through one
+``AsyncConnectionPool`` that is opened (and migrated via ``setup()``) once,
+normally from the FastAPI lifespan. Without it, a single in-memory saver is
+shared by every run.
+"""
+
+import asyncio
+
+from langgraph.checkpoint.memory import BaseCheckpointSaver, MemorySaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+_checkpointer: BaseCheckpointSaver | None = None
+_pool: AsyncConnectionPool | None = None
+_lock: asyncio.Lock | None = None
+
+
+def _pool_stats() -> dict[str, object]:
+    if _pool is None:
+        return {"backend": "memory" if _checkpointer is not None else "closed"}
+
+    stats = _pool.get_stats()
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    return {
+        "backend": "postgres",
+        **stats,
+        "in_use": size - available,
+        "saturation": (size - available) / (_pool.max_size or 1),
+    }
+
+
+async def _open_postgres() -> tuple[AsyncConnectionPool, AsyncPostgresSaver]:
+    config = settings.checkpointer
+    pool = AsyncConnectionPool(
+        conninfo=settings.DATABASE_URL,
+        min_size=config.pool_min_size,
+        max_size=config.pool_max_size,
+        timeout=config.pool_timeout_s,
+        kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        open=False,
+    )
+    await pool.open(wait=True, timeout=config.pool_timeout_s)
+    saver = AsyncPostgresSaver(conn=pool)
+    try:
+        # Idempotent; creates checkpoint tables on first run.
+        await saver.setup()
+    except Exception:
+        await pool.close()
+        raise
+    return pool, saver
+
+
+async def open_checkpointer() -> BaseCheckpointSaver:
+    """
+    Create the process-wide checkpointer if needed and return it.
+    """
+    global _checkpointer, _pool, _lock
+
+    if _checkpointer is not None:
+        return _checkpointer
+
+    if _lock is None:
+        _lock = asyncio.Lock()
+    async with _lock:
+        if _checkpointer is not None:
+            return _checkpointer
+
+        if settings.DATABASE_URL:
+            _pool, _checkpointer = await _open_postgres()
+            logger.info(
+                "Postgres checkpointer ready "
+                f"(pool {_pool.min_size}-{_pool.max_size} connections)"
+            )
+        else:
+            _checkpointer = MemorySaver()
+            logger.info("DATABASE_URL unset; using in-memory checkpointer")
+
+        metrics.register_collector("checkpointer", _pool_stats)
+        return _checkpointer
+
+
+async def get_checkpointer() -> BaseCheckpointSaver:
+    """
+    Return the process-wide checkpointer, opening it lazily outside the lifespan.
+    """
+    if _checkpointer is not None:
+        return _checkpointer
+    return await open_checkpointer()
+
+
+async def close_checkpointer() -> None:
+    """
+    Close the connection pool (if any) and forget the checkpointer.
+    """
+    global _checkpointer, _pool
+
+    pool = _pool
+    _checkpointer = None
+    _pool = None
+    metrics.unregister_collector("checkpointer")
+    if pool is not None:
+        await pool.close()
@@ -0,0 +1,127 @@
+"""
+Singleflight coalescing for identical workflow requests.
+
+Concurrent calls with the same key await one shared execution instead of
+each starting their own. Successful results can optionally be kept for a
+short TTL so near-simultaneous repeats are served without re-running.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import orjson
+
+from app.core.metrics import metrics
+from app.core.settings import settings
+from app.engine.schema import ResearchRequest
+
+
+def request_key(workflow_name: str, request: ResearchRequest) -> str:
+    """Canonical hash of a workflow name and request.
+
+    Whitespace in the topic is collapsed and seed URLs are treated as a set,
+    so cosmetically different payloads for the same research coalesce.
+    """
+    payload = request.model_dump(mode="json")
+    payload["topic"] = " ".join(request.topic.split())
+    payload["seed_urls"] = sorted({url.strip() for url in request.seed_urls})
+    canonical = orjson.dumps(
+        {"workflow": str(workflow_name).lower(), "request": payload},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(canonical).hexdigest()
+
+
+@dataclass(slots=True)
+class _Flight:
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class Coalescer:
+    """Share one in-flight execution per key, plus an optional TTL result cache."""
+
+    def __init__(self, result_ttl_s: float = 0.0, max_cached: int = 128) -> None:
+        self.result_ttl_s = result_ttl_s
+        self.max_cached = max_cached
+        self._flights: dict[str, _Flight] = {}
+        self._results: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        metrics.register_collector("coalescing", self.stats)
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._cached(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            flight = _Flight(task=asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task: self._land(key, task))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            # Keep the shared run alive for other waiters; stop it once
+            # nobody is left to receive the result.
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def stats(self) -> dict[str, object]:
+        lookups = self.hits + self.coalesced + self.misses
+        return {
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "in_flight": len(self._flights),
+            "cached_results": len(self._results),
+        }
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def _cached(self, key: str) -> Any | None:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._results[key]
+            return None
+        return result
+
+    def _land(self, key: str, task: asyncio.Future) -> None:
+        if self._flights.get(key) is not None and self._flights[key].task is task:
+            del self._flights[key]
+        if self.result_ttl_s <= 0 or task.cancelled() or task.exception() is not None:
+            return
+        self._results[key] = (time.monotonic() + self.result_ttl_s, task.result())
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_cached:
+            self._results.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_coalescer() -> Coalescer:
+    return Coalescer(
+        result_ttl_s=settings.coalescing.result_ttl_s,
+        max_cached=settings.coalescing.max_cached_results,
+    )
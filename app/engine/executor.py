@@ -6,38 +6,53 @@ handling state initialization, context setup, and graph invocation.
 """
 
 import uuid
+from collections.abc import AsyncIterator
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import StateSnapshot
 
 from app.core.logger import logger
 from app.core.settings import settings
-from app.engine.backends import get_filesystem_backend
+from app.engine.admission import get_admission_controller
+from app.engine.backends import get_async_filesystem_backend
+from app.engine.checkpointer import get_checkpointer
+from app.engine.coalescing import get_coalescer, request_key
+from app.engine.memory import retrieve_memories
 from app.engine.nodes.types import Workflow
 from app.engine.registry import get_workflow
 from app.engine.schema import ResearchContext, ResearchRequest, ResearchState
-from app.engine.tools.io import load_memories
+from app.engine.streaming import STREAM_MODES, StreamEvent, translate_chunk
 
 
-async def execute(
-    workflow_name: Workflow, request: ResearchRequest
-) -> dict[str, object]:
+def new_thread_id() -> str:
+    return str(uuid.uuid4())
+
+
+def run_config(
+    workflow_name: Workflow, request: ResearchRequest, thread_id: str
+) -> RunnableConfig:
     """
-    Execute a registered workflow with the given request.
+    Build the run config. The metadata is persisted with every checkpoint so a
+    thread can be inspected later knowing only its ``thread_id``.
     """
-    logger.info(f"Running workflow: {workflow_name} for topic: {request.topic}")
+    return {
+        "configurable": {"thread_id": thread_id},
+        "metadata": {
+            "workflow": str(workflow_name),
+            # Checkpoint metadata only keeps primitive values.
+            "request": request.model_dump_json(),
+        },
+    }
 
-    config: RunnableConfig = {"configurable": {"thread_id": str(uuid.uuid4())}}
 
-    backend = get_filesystem_backend(
-        backend_type=settings.filesystem.backend_type,
-        base_path=settings.filesystem.base_path,
-    )
-    memories = load_memories(settings.MEMORIES_DIR, backend=backend)
+class RunNotFoundError(LookupError):
+    """Raised when the checkpointer has no run for a ``thread_id``."""
 
-    context = ResearchContext(
+
+def _context(request: ResearchRequest) -> ResearchContext:
+    return ResearchContext(
         search_limit=settings.workflow.search_limit,
         exa_search_type=settings.workflow.exa_search_type,
         fetch_code_context=settings.workflow.fetch_code_context,
@@ -45,6 +60,26 @@ async def execute(
         experiment_snippets=request.experiment_snippets,
     )
 
+
+async def _prepare(
+    workflow_name: Workflow, request: ResearchRequest
+) -> tuple[ResearchState, ResearchContext]:
+    backend = get_async_filesystem_backend(
+        backend_type=settings.filesystem.backend_type,
+        base_path=settings.filesystem.base_path,
+        max_workers=settings.filesystem.io_workers,
+    )
+    memories = await backend.run_sync(
+        retrieve_memories,
+        request.topic,
+        settings.MEMORIES_DIR,
+        settings.INDEX_DIR,
+        backend=backend.backend,
+        top_k=settings.memory.top_k,
+        token_budget=settings.memory.token_budget,
+    )
+    context = _context(request)
+
     state = ResearchState(
         messages=[
             SystemMessage(content=f"Starting {workflow_name} workflow."),
@@ -62,16 +97,101 @@ async def execute(
         reasoning=[],
         key_insights=[],
     )
+    return state, context
 
-    if settings.DATABASE_URL:
-        async with AsyncPostgresSaver.from_conn_string(
-            settings.DATABASE_URL
-        ) as checkpointer:
-            # Idempotent; creates checkpoint tables on first run.
-            await checkpointer.setup()
-            return await _run(workflow_name, state, context, config, checkpointer)
 
-    return await _run(workflow_name, state, context, config, MemorySaver())
+async def execute(
+    workflow_name: Workflow,
+    request: ResearchRequest,
+    *,
+    thread_id: str | None = None,
+    admit: bool = False,
+) -> dict[str, object]:
+    """
+    Execute a registered workflow with the given request.
+
+    Without an explicit ``thread_id``, identical concurrent requests are
+    coalesced into one run (see ``app.engine.coalescing``). With ``admit``,
+    the run takes a slot from the admission controller; coalesced duplicates
+    and cached results don't, only the run that actually executes.
+    """
+    if thread_id is None and settings.coalescing.enabled:
+        key = request_key(workflow_name, request)
+        result = await get_coalescer().run(
+            key, lambda: _execute(workflow_name, request, new_thread_id(), admit)
+        )
+        # Callers share one run; give each its own top-level dict.
+        return dict(result)
+
+    return await _execute(workflow_name, request, thread_id or new_thread_id(), admit)
+
+
+async def _execute(
+    workflow_name: Workflow,
+    request: ResearchRequest,
+    thread_id: str,
+    admit: bool = False,
+) -> dict[str, object]:
+    if admit:
+        async with get_admission_controller().admit(workflow_name):
+            return await _execute(workflow_name, request, thread_id)
+
+    logger.info(f"Running workflow: {workflow_name} for topic: {request.topic}")
+
+    config = run_config(workflow_name, request, thread_id)
+    state, context = await _prepare(workflow_name, request)
+    checkpointer = await get_checkpointer()
+    return await _run(workflow_name, state, context, config, checkpointer)
+
+
+async def stream_execute(
+    workflow_name: Workflow,
+    request: ResearchRequest,
+    *,
+    thread_id: str | None = None,
+) -> AsyncIterator[StreamEvent]:
+    """
+    Execute a workflow and yield progress events as they happen.
+
+    The first event is ``run`` (carrying the ``thread_id``) and the last is
+    either ``done`` with the final state or ``error``.
+    """
+    logger.info(f"Streaming workflow: {workflow_name} for topic: {request.topic}")
+
+    thread_id = thread_id or new_thread_id()
+    config = run_config(workflow_name, request, thread_id)
+
+    yield StreamEvent(
+        event="run", data={"thread_id": thread_id, "workflow": str(workflow_name)}
+    )
+
+    final_state: object = None
+    try:
+        # Inside the ``try``: the response has started by now, so failures
+        # here must still end the stream with an ``error`` event.
+        state, context = await _prepare(workflow_name, request)
+        checkpointer = await get_checkpointer()
+        graph = get_workflow(workflow_name, checkpointer)
+        async for namespace, mode, data in graph.astream(
+            input=state,
+            config=config,
+            context=context,
+            stream_mode=STREAM_MODES,
+            subgraphs=True,
+        ):
+            if mode == "values" and not namespace:
+                final_state = data
+                continue
+            for event in translate_chunk(namespace, mode, data):
+                yield event
+    except Exception as exc:
+        logger.exception(f"Streaming workflow {workflow_name} failed: {exc}")
+        yield StreamEvent(
+            event="error", data={"thread_id": thread_id, "message": str(exc)}
+        )
+        return
+
+    yield StreamEvent(event="done", data={"thread_id": thread_id, "state": final_state})
 
 
 async def _run(
@@ -83,3 +203,107 @@ async def _run(
 ) -> dict[str, object]:
     graph = get_workflow(workflow_name, checkpointer)
     return await graph.ainvoke(input=state, config=config, context=context)
+
+
+async def _load_run(
+    thread_id: str,
+) -> tuple[CompiledStateGraph, RunnableConfig, ResearchContext]:
+    """Rebuild the graph, run config and context of a checkpointed run."""
+    checkpointer = await get_checkpointer()
+    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+    checkpoint = await checkpointer.aget_tuple(config)
+    if checkpoint is None or not checkpoint.metadata.get("workflow"):
+        raise RunNotFoundError(f"Run '{thread_id}' not found")
+
+    workflow_name = checkpoint.metadata["workflow"]
+    request = ResearchRequest.model_validate_json(checkpoint.metadata["request"])
+    graph = get_workflow(workflow_name, checkpointer)
+    return graph, run_config(workflow_name, request, thread_id), _context(request)
+
+
+async def resume(thread_id: str) -> dict[str, object]:
+    """
+    Continue a run from its last checkpoint.
+
+    Nodes that already completed are not re-run; a node that failed (or never
+    started because the process stopped) runs again with the state it was
+    originally given. Resuming a finished run returns its final state.
+    """
+    graph, config, context = await _load_run(thread_id)
+    snapshot = await graph.aget_state(config)
+    if not snapshot.next:
+        return snapshot.values
+
+    logger.info(f"Resuming run {thread_id} at {list(snapshot.next)}")
+    return await graph.ainvoke(None, config=config, context=context)
+
+
+def _check_rerun(
+    graph: CompiledStateGraph, node: str, updates: dict[str, object] | None
+) -> None:
+    if node.startswith("__") or node not in graph.nodes:
+        raise ValueError(f"Workflow has no node '{node}'")
+    unknown = set(updates or {}) - set(ResearchState.__annotations__)
+    if unknown:
+        raise ValueError(f"Unknown state keys: {sorted(unknown)}")
+
+
+async def validate_rerun(
+    thread_id: str, node: str, updates: dict[str, object] | None = None
+) -> None:
+    """Raise ``RunNotFoundError`` or ``ValueError`` if ``rerun_from`` would."""
+    graph, _, _ = await _load_run(thread_id)
+    _check_rerun(graph, node, updates)
+
+
+async def rerun_from(
+    thread_id: str,
+    node: str,
+    updates: dict[str, object] | None = None,
+) -> dict[str, object]:
+    """
+    Re-run a finished or failed run from ``node`` onwards.
+
+    The thread is forked at the latest checkpoint just before ``node`` ran, so
+    the state produced by earlier nodes (e.g. the researcher's sources and
+    notes) is reused. ``updates`` are applied to that state first. The fork
+    becomes the thread's latest checkpoint; earlier checkpoints are kept.
+    """
+    graph, config, context = await _load_run(thread_id)
+    _check_rerun(graph, node, updates)
+
+    target: StateSnapshot | None = None
+    async for snapshot in graph.aget_state_history(config):
+        if node in snapshot.next:
+            target = snapshot
+            break
+    if target is None:
+        raise ValueError(f"Run '{thread_id}' never reached node '{node}'")
+
+    fork_config = {**target.config, "metadata": config["metadata"]}
+    if updates:
+        fork_config = {
+            **await graph.aupdate_state(fork_config, updates),
+            "metadata": config["metadata"],
+        }
+
+    logger.info(f"Re-running {thread_id} from {node}")
+    return await graph.ainvoke(None, config=fork_config, context=context)
+
+
+async def get_run_state(thread_id: str) -> StateSnapshot | None:
+    """
+    Return the latest checkpointed state for ``thread_id``, or ``None`` if the
+    checkpointer has never seen it.
+    """
+    checkpointer = await get_checkpointer()
+    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+    checkpoint = await checkpointer.aget_tuple(config)
+    if checkpoint is None:
+        return None
+
+    workflow_name = checkpoint.metadata.get("workflow")
+    if not workflow_name:
+        return None
+    graph = get_workflow(workflow_name, checkpointer)
+    return await graph.aget_state(config)
@@ -0,0 +1,258 @@
+"""
+Background workflow jobs.
+
+``JobManager.submit`` schedules ``execute`` on the event loop and returns
+immediately with the run's ``thread_id``. At most ``max_workers`` jobs run at
+once; the rest wait in submission order. Live jobs are tracked in memory;
+anything older (or from a previous process) is answered from the
+checkpointer via ``get_run_state``.
+
+``resume`` and ``rerun`` schedule a continuation of an existing thread the
+same way, reusing the checkpoints it already wrote.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from functools import lru_cache
+
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.core.settings import settings
+from app.engine.executor import (
+    RunNotFoundError,
+    execute,
+    get_run_state,
+    new_thread_id,
+    rerun_from,
+    resume,
+    validate_rerun,
+)
+from app.engine.nodes.types import Workflow
+from app.engine.schema import ResearchRequest
+
+
+class JobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    # Known only to the checkpointer, stopped before reaching END (e.g. the
+    # process restarted mid-run).
+    INTERRUPTED = "interrupted"
+
+
+FINISHED_STATUSES = frozenset(
+    {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+)
+
+
+class JobConflictError(RuntimeError):
+    """Raised when a thread already has a live job."""
+
+
+@dataclass(slots=True)
+class Job:
+    thread_id: str
+    workflow_name: str
+    status: JobStatus = JobStatus.PENDING
+    submitted_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    result: dict[str, object] | None = field(default=None, repr=False)
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "thread_id": self.thread_id,
+            "workflow": self.workflow_name,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Runs workflows as background tasks under a bounded worker pool."""
+
+    def __init__(self, max_workers: int = 4, max_retained: int = 256) -> None:
+        self.max_workers = max_workers
+        self.max_retained = max_retained
+        self._slots = asyncio.Semaphore(max_workers)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        # Threads whose continuation is being validated but not yet started.
+        self._reserved: set[str] = set()
+        metrics.register_collector("jobs", self.stats)
+
+    def submit(self, workflow_name: Workflow, request: ResearchRequest) -> Job:
+        """Schedule a run and return its job record without waiting."""
+        job = Job(thread_id=new_thread_id(), workflow_name=str(workflow_name))
+        return self._start(
+            job,
+            lambda: execute(job.workflow_name, request, thread_id=job.thread_id),
+        )
+
+    async def resume(self, thread_id: str) -> Job:
+        """Schedule ``executor.resume`` for a checkpointed thread."""
+        with self._reserve(thread_id):
+            job = await self._continuation(thread_id)
+            return self._start(job, lambda: resume(thread_id))
+
+    async def rerun(
+        self,
+        thread_id: str,
+        node: str,
+        updates: dict[str, object] | None = None,
+    ) -> Job:
+        """Schedule ``executor.rerun_from`` for a checkpointed thread."""
+        with self._reserve(thread_id):
+            job = await self._continuation(thread_id)
+            await validate_rerun(thread_id, node, updates)
+            return self._start(job, lambda: rerun_from(thread_id, node, updates))
+
+    def get(self, thread_id: str) -> Job | None:
+        return self._jobs.get(thread_id)
+
+    async def status(self, thread_id: str) -> dict[str, object] | None:
+        """Job status merged with the latest checkpoint for the thread."""
+        job = self._jobs.get(thread_id)
+        snapshot = await get_run_state(thread_id)
+        if job is None and snapshot is None:
+            return None
+
+        if job is not None:
+            status = job.as_dict()
+        else:
+            status = {
+                "thread_id": thread_id,
+                "workflow": snapshot.metadata.get("workflow"),
+                "status": JobStatus.INTERRUPTED
+                if snapshot.next
+                else JobStatus.COMPLETED,
+            }
+
+        status["next"] = list(snapshot.next) if snapshot is not None else []
+        status["step"] = snapshot.metadata.get("step") if snapshot else None
+        return status
+
+    async def result(self, thread_id: str) -> tuple[JobStatus, object] | None:
+        """Return ``(status, final_state)``; the state is ``None`` until done."""
+        job = self._jobs.get(thread_id)
+        if job is not None and job.status != JobStatus.COMPLETED:
+            return job.status, None
+        if job is not None and job.result is not None:
+            return job.status, job.result
+
+        snapshot = await get_run_state(thread_id)
+        if snapshot is None:
+            return None
+        if snapshot.next:
+            return JobStatus.INTERRUPTED, None
+        return JobStatus.COMPLETED, snapshot.values
+
+    def cancel(self, thread_id: str) -> Job | None:
+        """Request cancellation of a live job. Returns the job, if known."""
+        job = self._jobs.get(thread_id)
+        if job is None:
+            return None
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+        return job
+
+    async def shutdown(self) -> None:
+        """Cancel every live job and wait for them to unwind."""
+        tasks = [
+            job.task
+            for job in self._jobs.values()
+            if job.task is not None and not job.task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, object]:
+        counts = {status.value: 0 for status in JobStatus}
+        for job in self._jobs.values():
+            counts[job.status.value] += 1
+        return {"max_workers": self.max_workers, **counts}
+
+    @contextmanager
+    def _reserve(self, thread_id: str) -> Iterator[None]:
+        """Claim ``thread_id`` until its continuation is started or rejected.
+
+        The live-job check and the claim happen before the first await, so
+        concurrent resume/rerun calls for one thread can't both get through.
+        """
+        live = self._jobs.get(thread_id)
+        if live is not None and live.status not in FINISHED_STATUSES:
+            raise JobConflictError(f"Job '{thread_id}' is {live.status}")
+        if thread_id in self._reserved:
+            raise JobConflictError(f"Job '{thread_id}' is already being scheduled")
+        self._reserved.add(thread_id)
+        try:
+            yield
+        finally:
+            self._reserved.discard(thread_id)
+
+    async def _continuation(self, thread_id: str) -> Job:
+        snapshot = await get_run_state(thread_id)
+        if snapshot is None:
+            raise RunNotFoundError(f"Run '{thread_id}' not found")
+        return Job(thread_id=thread_id, workflow_name=snapshot.metadata["workflow"])
+
+    def _start(self, job: Job, run: Callable[[], Awaitable[dict[str, object]]]) -> Job:
+        job.task = asyncio.create_task(
+            self._run(job, run), name=f"workflow-job-{job.thread_id}"
+        )
+        # A continuation replaces the thread's previous record.
+        self._jobs.pop(job.thread_id, None)
+        self._jobs[job.thread_id] = job
+        self._evict_finished()
+        return job
+
+    async def _run(
+        self, job: Job, run: Callable[[], Awaitable[dict[str, object]]]
+    ) -> None:
+        try:
+            async with self._slots:
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now(UTC)
+                job.result = await run()
+                job.status = JobStatus.COMPLETED
+        except asyncio.CancelledError:
+            job.status = JobStatus.CANCELLED
+            raise
+        except Exception as exc:
+            logger.exception(f"Workflow job {job.thread_id} failed: {exc}")
+            job.status = JobStatus.FAILED
+            job.error = str(exc)
+        finally:
+            job.finished_at = datetime.now(UTC)
+            metrics.inc(f"jobs.{job.status.value}")
+
+    def _evict_finished(self) -> None:
+        overflow = len(self._jobs) - self.max_retained
+        if overflow <= 0:
+            return
+        for thread_id in [
+            thread_id
+            for thread_id, job in self._jobs.items()
+            if job.status in FINISHED_STATUSES
+        ][:overflow]:
+            del self._jobs[thread_id]
+
+
+@lru_cache(maxsize=1)
+def get_job_manager() -> JobManager:
+    return JobManager(
+        max_workers=settings.jobs.max_workers,
+        max_retained=settings.jobs.max_retained,
+    )
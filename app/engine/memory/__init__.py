@@ -0,0 +1,51 @@
+from app.engine.memory.index import (
+    MemoryIndex,
+    clear_memory_index_cache,
+    index_memory,
+    retrieve_memories,
+    sync_memory_index,
+)
+from app.engine.memory.manifest import (
+    MemoryManifest,
+    MemoryRecord,
+    clear_manifest_cache,
+    load_manifest,
+    memory_insights,
+    parse_frontmatter,
+    parse_section,
+    record_memory,
+)
+from app.engine.memory.vectors import (
+    Embedder,
+    HashingEmbedder,
+    VectorIndex,
+    clear_vector_index_cache,
+    get_embedder,
+    index_documents,
+    search_related,
+    sync_vector_index,
+)
+
+__all__ = [
+    "Embedder",
+    "HashingEmbedder",
+    "MemoryIndex",
+    "MemoryManifest",
+    "MemoryRecord",
+    "VectorIndex",
+    "clear_manifest_cache",
+    "clear_memory_index_cache",
+    "clear_vector_index_cache",
+    "get_embedder",
+    "index_documents",
+    "index_memory",
+    "load_manifest",
+    "memory_insights",
+    "parse_frontmatter",
+    "parse_section",
+    "record_memory",
+    "retrieve_memories",
+    "search_related",
+    "sync_memory_index",
+    "sync_vector_index",
+]
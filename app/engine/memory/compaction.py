@@ -0,0 +1,208 @@
+"""
+Roll per-run memories up into one shard per topic slug.
+
+Every run writes ``{slug}-{YYYYmmddHHMMSS}.md``. Compaction keeps the newest
+``keep_recent`` run files of each slug as they are and merges the rest into
+``{slug}.rollup.md``, with Key Insights, reasoning and notes deduplicated.
+Merged originals are moved to ``.memories/.archive/``, so the directory
+holds at most ``keep_recent + 1`` files per topic however long the history.
+
+The shard is written before the originals are archived; if compaction is
+interrupted in between, the next pass merges them again and deduplication
+absorbs the repeats. Compaction never writes the indexes under
+``settings.INDEX_DIR``, so it is safe to run from a separate process next to
+the app: the app's indexes notice rewritten shards (by content hash and file
+stat) and archived runs on their next sync.
+
+Run it from the command line::
+
+    uv run python -m app.engine.memory.compaction [--keep-recent N] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app.core.logger import logger
+from app.core.settings import settings
+from app.engine.backends import get_filesystem_backend
+from app.engine.backends.protocol import FilesystemBackend
+from app.engine.memory.manifest import parse_frontmatter, parse_section
+
+ARCHIVE_DIRNAME = ".archive"
+SHARD_SUFFIX = ".rollup.md"
+SECTIONS = ("Key Insights", "Reasoning Log", "Research Notes")
+
+_RUN_FILE_RE = re.compile(r"^(?P<slug>.+)-(?P<ts>\d{14})\.md$")
+
+
+@dataclass
+class CompactionResult:
+    shards: list[str] = field(default_factory=list)
+    merged: int = 0
+    archived: int = 0
+
+    def as_dict(self) -> dict[str, object]:
+        return {"shards": self.shards, "merged": self.merged, "archived": self.archived}
+
+
+def _dedupe(items: list[str]) -> list[str]:
+    seen: set[str] = set()
+    unique: list[str] = []
+    for item in items:
+        key = " ".join(item.lower().split())
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def _render_shard(
+    topic: str, runs: int, first_run: str, last_run: str, sections: dict[str, list[str]]
+) -> str:
+    lines = [
+        "---",
+        f'topic: "{topic}"',
+        f"created_at: {datetime.now(UTC).isoformat()}",
+        "type: rollup",
+        f"run_count: {runs}",
+        f"first_run: {first_run}",
+        f"last_run: {last_run}",
+        f"insight_count: {len(sections['Key Insights'])}",
+        f"reasoning_count: {len(sections['Reasoning Log'])}",
+        f"notes_count: {len(sections['Research Notes'])}",
+        "---",
+        "",
+    ]
+    for heading in SECTIONS:
+        lines += [f"# {heading}", "", *[f"- {item}" for item in sections[heading]], ""]
+    return "\n".join(lines)
+
+
+def _compact_slug(
+    slug: str,
+    runs: list[Path],
+    memories_dir: Path,
+    backend: FilesystemBackend,
+    dry_run: bool,
+) -> int:
+    shard_path = memories_dir / f"{slug}{SHARD_SUFFIX}"
+    texts: list[str] = []
+    previous: dict[str, object] = {}
+    if backend.is_file(shard_path):
+        texts.append(backend.read_text(shard_path, encoding="utf-8"))
+        previous = parse_frontmatter(texts[0])
+    # Newest first so the freshest wording of a duplicate insight survives.
+    texts += [backend.read_text(path, encoding="utf-8") for path in reversed(runs)]
+
+    frontmatters = [parse_frontmatter(text) for text in texts]
+    timestamps = [_RUN_FILE_RE.match(path.name)["ts"] for path in runs]
+    first_run = min([str(previous.get("first_run", timestamps[0])), *timestamps])
+    last_run = max([str(previous.get("last_run", timestamps[-1])), *timestamps])
+    topic = next(
+        (str(meta["topic"]) for meta in frontmatters if meta.get("topic")), slug
+    )
+    run_count = int(previous.get("run_count", 0)) + len(runs)
+    sections = {
+        heading: _dedupe(
+            [item for text in texts for item in parse_section(text, heading)]
+        )
+        for heading in SECTIONS
+    }
+
+    if dry_run:
+        return len(runs)
+
+    content = _render_shard(topic, run_count, first_run, last_run, sections)
+    tmp_path = shard_path.with_name(f".{shard_path.name}.tmp")
+    backend.write_text(tmp_path, content, encoding="utf-8")
+    backend.move(tmp_path, shard_path)
+
+    archive_dir = memories_dir / ARCHIVE_DIRNAME
+    for path in runs:
+        backend.move(path, archive_dir / path.name)
+    return len(runs)
+
+
+def compact_memories(
+    memories_dir: Path,
+    backend: FilesystemBackend,
+    keep_recent: int = 3,
+    dry_run: bool = False,
+) -> CompactionResult:
+    """Merge all but the newest ``keep_recent`` runs of each slug into its shard."""
+    result = CompactionResult()
+    if not backend.is_dir(memories_dir):
+        return result
+
+    by_slug: dict[str, list[Path]] = defaultdict(list)
+    for entry in backend.iter_dir(memories_dir):
+        match = _RUN_FILE_RE.match(entry.name)
+        if match is not None and entry.is_file():
+            by_slug[match["slug"]].append(memories_dir / entry.name)
+
+    for slug, paths in sorted(by_slug.items()):
+        paths.sort(key=lambda path: _RUN_FILE_RE.match(path.name)["ts"])
+        runs = paths[: max(len(paths) - keep_recent, 0)]
+        if not runs:
+            continue
+        merged = _compact_slug(slug, runs, memories_dir, backend, dry_run)
+        result.shards.append(f"{slug}{SHARD_SUFFIX}")
+        result.merged += merged
+        result.archived += 0 if dry_run else merged
+
+    logger.info(
+        f"Memory compaction{' (dry run)' if dry_run else ''}: merged "
+        f"{result.merged} runs into {len(result.shards)} shards"
+    )
+    return result
+
+
+async def run_compaction_schedule(interval_s: float, keep_recent: int) -> None:
+    """Compact ``settings.MEMORIES_DIR`` every ``interval_s`` seconds."""
+    backend = get_filesystem_backend(
+        backend_type=settings.filesystem.backend_type,
+        base_path=settings.filesystem.base_path,
+    )
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            await asyncio.to_thread(
+                compact_memories, settings.MEMORIES_DIR, backend, keep_recent
+            )
+        except Exception as exc:
+            logger.exception(f"Scheduled memory compaction failed: {exc}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Roll old per-run memories up into per-topic shard files."
+    )
+    parser.add_argument("--memories-dir", type=Path, default=settings.MEMORIES_DIR)
+    parser.add_argument(
+        "--keep-recent",
+        type=int,
+        default=settings.memory.compaction_keep_recent,
+        help="Newest run files to leave untouched per topic.",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report what would be merged."
+    )
+    args = parser.parse_args(argv)
+
+    backend = get_filesystem_backend(
+        backend_type=settings.filesystem.backend_type,
+        base_path=settings.filesystem.base_path,
+    )
+    result = compact_memories(
+        args.memories_dir, backend, keep_recent=args.keep_recent, dry_run=args.dry_run
+    )
+    print(result.as_dict())
+
+
+if __name__ == "__main__":
+    main()
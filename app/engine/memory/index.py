@@ -0,0 +1,260 @@
+"""
+BM25 index over the run memories in ``settings.MEMORIES_DIR``.
+
+Only term statistics are kept in the index (one JSON file under
+``settings.INDEX_DIR``); memory text is read from disk for the top hits
+only. The list of memory files comes from the manifest
+(``app.engine.memory.manifest``), which stat-validates the directory in one
+scan. Each indexed doc keeps the content hash it was built from, so files
+the index hasn't seen and files rewritten in place (e.g. rollup shards,
+possibly by another process) are re-tokenized; deleted ones are dropped.
+"""
+
+import hashlib
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import orjson
+
+from app.core.logger import logger
+from app.engine.backends.protocol import FilesystemBackend
+from app.engine.memory.manifest import load_manifest
+
+INDEX_FILENAME = "memories.json"
+INDEX_VERSION = 2
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or that the this to "
+    "was were will with".split()
+)
+
+# Indexes are shared per resolved path so every run in the process sees
+# incremental updates without re-reading the JSON.
+_INDEXES: dict[Path, "MemoryIndex"] = {}
+_LOCK = threading.RLock()
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap prompt-token estimate (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+@dataclass(slots=True)
+class _Doc:
+    length: int
+    token_estimate: int
+    tf: dict[str, int]
+    sha256: str
+
+
+@dataclass
+class MemoryIndex:
+    """Okapi BM25 over memory files, keyed by file name."""
+
+    k1: float = 1.2
+    b: float = 0.75
+    docs: dict[str, _Doc] = field(default_factory=dict)
+    _df: Counter = field(default_factory=Counter, repr=False)
+    _total_length: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        for doc in self.docs.values():
+            self._count(doc, 1)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.docs
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, name: str, text: str) -> None:
+        self.remove(name)
+        terms = tokenize(text)
+        doc = _Doc(
+            length=len(terms),
+            token_estimate=estimate_tokens(text),
+            tf=dict(Counter(terms)),
+            sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        )
+        self.docs[name] = doc
+        self._count(doc, 1)
+
+    def remove(self, name: str) -> None:
+        doc = self.docs.pop(name, None)
+        if doc is not None:
+            self._count(doc, -1)
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """Return ``(name, score)`` for every matching memory, best first."""
+        terms = set(tokenize(query))
+        if not terms or not self.docs:
+            return []
+
+        n = len(self.docs)
+        avg_length = self._total_length / n or 1.0
+        idf = {
+            term: math.log(1 + (n - self._df[term] + 0.5) / (self._df[term] + 0.5))
+            for term in terms
+            if self._df[term]
+        }
+        scores: list[tuple[str, float]] = []
+        for name, doc in self.docs.items():
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * doc.length / avg_length)
+            for term, weight in idf.items():
+                freq = doc.tf.get(term)
+                if freq:
+                    score += weight * freq * (self.k1 + 1) / (freq + norm)
+            if score > 0:
+                scores.append((name, score))
+        # Ties go to the newer memory; names end in a sortable timestamp.
+        scores.sort(key=lambda item: (item[1], item[0]), reverse=True)
+        return scores
+
+    def to_bytes(self) -> bytes:
+        return orjson.dumps(
+            {
+                "version": INDEX_VERSION,
+                "docs": {
+                    name: {
+                        "length": doc.length,
+                        "token_estimate": doc.token_estimate,
+                        "tf": doc.tf,
+                        "sha256": doc.sha256,
+                    }
+                    for name, doc in self.docs.items()
+                },
+            }
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MemoryIndex":
+        payload = orjson.loads(data)
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported memory index version {payload.get('version')}"
+            )
+        return cls(docs={name: _Doc(**doc) for name, doc in payload["docs"].items()})
+
+    def _count(self, doc: _Doc, sign: int) -> None:
+        self._total_length += sign * doc.length
+        for term in doc.tf:
+            self._df[term] += sign
+            if self._df[term] <= 0:
+                del self._df[term]
+
+
+def _read_index(index_path: Path, backend: FilesystemBackend) -> MemoryIndex:
+    if not backend.is_file(index_path):
+        return MemoryIndex()
+    try:
+        return MemoryIndex.from_bytes(backend.read_bytes(index_path))
+    except (ValueError, TypeError, KeyError) as exc:
+        logger.warning(f"Rebuilding unreadable memory index {index_path}: {exc}")
+        return MemoryIndex()
+
+
+def _write_index(
+    index: MemoryIndex, index_path: Path, backend: FilesystemBackend
+) -> None:
+    # Write-then-move so a concurrent reader never sees a partial file.
+    backend.mkdir(index_path.parent)
+    tmp_path = index_path.with_name(f".{index_path.name}.tmp")
+    backend.write_bytes(tmp_path, index.to_bytes())
+    backend.move(tmp_path, index_path)
+
+
+def _cached_index(index_path: Path, backend: FilesystemBackend) -> MemoryIndex:
+    key = backend.resolve(index_path)
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = _read_index(index_path, backend)
+    return index
+
+
+def sync_memory_index(
+    memories_dir: Path, index_dir: Path, backend: FilesystemBackend
+) -> MemoryIndex:
+    """Load the index and bring it in line with the memory files on disk."""
+    index_path = index_dir / INDEX_FILENAME
+    with _LOCK:
+        index = _cached_index(index_path, backend)
+        records = load_manifest(memories_dir, index_dir, backend).records
+        stale = [name for name in index.docs if name not in records]
+        missing = [
+            name
+            for name, record in records.items()
+            if name not in index or index.docs[name].sha256 != record.sha256
+        ]
+        for name in stale:
+            index.remove(name)
+        for name in missing:
+            index.add(name, backend.read_text(memories_dir / name, encoding="utf-8"))
+        if stale or missing:
+            _write_index(index, index_path, backend)
+        return index
+
+
+def index_memory(
+    memory_path: Path,
+    content: str,
+    index_dir: Path,
+    backend: FilesystemBackend,
+) -> None:
+    """Add one freshly written memory to the persisted index."""
+    index_path = index_dir / INDEX_FILENAME
+    with _LOCK:
+        index = _cached_index(index_path, backend)
+        index.add(Path(memory_path).name, content)
+        _write_index(index, index_path, backend)
+
+
+def retrieve_memories(
+    query: str,
+    memories_dir: Path,
+    index_dir: Path,
+    backend: FilesystemBackend,
+    top_k: int = 5,
+    token_budget: int = 2000,
+) -> list[str]:
+    """
+    Return the text of up to ``top_k`` memories most relevant to ``query``.
+
+    Memories are taken best-first while they fit in ``token_budget``; one that
+    would overflow the budget is skipped in favour of smaller, lower-ranked
+    ones.
+    """
+    with _LOCK:
+        index = sync_memory_index(memories_dir, index_dir, backend)
+        ranked = [
+            (name, index.docs[name].token_estimate) for name, _ in index.search(query)
+        ]
+
+    selected: list[str] = []
+    remaining = token_budget
+    for name, token_estimate in ranked:
+        if len(selected) >= top_k:
+            break
+        if token_estimate > remaining:
+            continue
+        selected.append(backend.read_text(memories_dir / name, encoding="utf-8"))
+        remaining -= token_estimate
+    return selected
+
+
+def clear_memory_index_cache() -> None:
+    with _LOCK:
+        _INDEXES.clear()
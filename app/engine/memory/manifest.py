@@ -0,0 +1,238 @@
+"""
+Manifest of parsed memory files.
+
+``.index/manifest.jsonl`` holds one record per memory: its file name,
+``(mtime_ns, size)``, content hash, frontmatter fields and pre-extracted Key
+Insights. Readers load it in a single read and only reparse files whose
+stat changed, so per-request memory handling is O(changed files).
+
+``persist_memories`` appends a record per write; a full rewrite happens only
+when a sync finds changed or deleted files. When a file name appears more
+than once the last line wins.
+"""
+
+import hashlib
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import orjson
+
+from app.core.logger import logger
+from app.engine.backends.protocol import FilesystemBackend
+
+MANIFEST_FILENAME = "manifest.jsonl"
+
+_FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---\n", re.DOTALL)
+_HEADING_RE = re.compile(r"^# (.+?)\s*$")
+
+_MANIFESTS: dict[Path, "MemoryManifest"] = {}
+_LOCK = threading.RLock()
+
+
+def parse_frontmatter(text: str) -> dict[str, object]:
+    """Parse the flat ``key: value`` frontmatter ``persist_memories`` writes."""
+    match = _FRONTMATTER_RE.match(text)
+    if match is None:
+        return {}
+    fields: dict[str, object] = {}
+    for line in match.group(1).splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            fields[key.strip()] = value[1:-1]
+        elif value.isdigit():
+            fields[key.strip()] = int(value)
+        else:
+            fields[key.strip()] = value
+    return fields
+
+
+def parse_section(text: str, heading: str) -> list[str]:
+    """Return the ``- `` bullet items under ``# {heading}`` up to the next heading.
+
+    Lines between one bullet and the next belong to the first, so multi-line
+    notes come back whole, with their line breaks.
+    """
+    items: list[list[str]] = []
+    in_section = False
+    for line in text.splitlines():
+        match = _HEADING_RE.match(line)
+        if match is not None:
+            if in_section:
+                break
+            in_section = match.group(1) == heading
+        elif in_section and line.startswith("- "):
+            items.append([line[2:]])
+        elif in_section and items:
+            items[-1].append(line)
+    return ["\n".join(lines).strip() for lines in items]
+
+
+@dataclass(slots=True)
+class MemoryRecord:
+    name: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    topic: str = ""
+    created_at: str = ""
+    type: str = ""
+    counts: dict[str, int] = field(default_factory=dict)
+    report_path: str = ""
+    insights: list[str] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, name: str, text: str, mtime_ns: int, size: int) -> "MemoryRecord":
+        fields = parse_frontmatter(text)
+        return cls(
+            name=name,
+            mtime_ns=mtime_ns,
+            size=size,
+            sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            topic=str(fields.get("topic", "")),
+            created_at=str(fields.get("created_at", "")),
+            type=str(fields.get("type", "")),
+            counts={
+                key: value
+                for key, value in fields.items()
+                if key.endswith("_count") and isinstance(value, int)
+            },
+            report_path=str(fields.get("report_path", "")),
+            insights=parse_section(text, "Key Insights"),
+        )
+
+
+@dataclass
+class MemoryManifest:
+    """Parsed memory records keyed by file name, backed by a JSONL file."""
+
+    path: Path
+    backend: FilesystemBackend
+    records: dict[str, MemoryRecord] = field(default_factory=dict)
+
+    def load(self) -> "MemoryManifest":
+        self.records = {}
+        if not self.backend.is_file(self.path):
+            return self
+        damaged = False
+        for line in self.backend.read_bytes(self.path).splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = MemoryRecord(**orjson.loads(line))
+            except (orjson.JSONDecodeError, TypeError) as exc:
+                # A torn append; the next sync re-parses that file.
+                logger.warning(f"Skipping bad manifest line in {self.path}: {exc}")
+                damaged = True
+                continue
+            self.records[record.name] = record
+        if damaged:
+            # Rewrite so later appends don't land on the end of a torn line.
+            self.rewrite()
+        return self
+
+    def insights(self) -> list[str]:
+        return [
+            insight for record in self.records.values() for insight in record.insights
+        ]
+
+    def append(self, record: MemoryRecord) -> None:
+        self.records[record.name] = record
+        self.backend.mkdir(self.path.parent)
+        with self.backend.open_write(self.path, "ab", encoding=None) as fh:
+            fh.write(orjson.dumps(asdict(record)) + b"\n")
+
+    def rewrite(self) -> None:
+        payload = b"".join(
+            orjson.dumps(asdict(record)) + b"\n" for record in self.records.values()
+        )
+        self.backend.mkdir(self.path.parent)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        self.backend.write_bytes(tmp_path, payload)
+        self.backend.move(tmp_path, self.path)
+
+    def sync(self, memories_dir: Path) -> int:
+        """Reparse new or changed memory files and drop deleted ones.
+
+        Returns the number of records that changed.
+        """
+        # ``DirEntry.stat`` reuses what the directory scan already fetched
+        # where the platform provides it.
+        on_disk = {
+            entry.name: entry
+            for entry in self.backend.glob(memories_dir, "*.md")
+            if entry.is_file()
+        }
+
+        changed = 0
+        for name in [name for name in self.records if name not in on_disk]:
+            del self.records[name]
+            changed += 1
+        for name, entry in on_disk.items():
+            stat = entry.stat()
+            record = self.records.get(name)
+            if (
+                record is not None
+                and record.mtime_ns == stat.st_mtime_ns
+                and record.size == stat.st_size
+            ):
+                continue
+            text = self.backend.read_text(entry.path, encoding="utf-8")
+            self.records[name] = MemoryRecord.parse(
+                name, text, stat.st_mtime_ns, stat.st_size
+            )
+            changed += 1
+        if changed:
+            self.rewrite()
+        return changed
+
+
+def _manifest(index_dir: Path, backend: FilesystemBackend) -> MemoryManifest:
+    path = index_dir / MANIFEST_FILENAME
+    key = backend.resolve(path)
+    manifest = _MANIFESTS.get(key)
+    if manifest is None:
+        manifest = _MANIFESTS[key] = MemoryManifest(path, backend).load()
+    return manifest
+
+
+def load_manifest(
+    memories_dir: Path, index_dir: Path, backend: FilesystemBackend
+) -> MemoryManifest:
+    """Return the manifest, synced with the memory files on disk."""
+    with _LOCK:
+        manifest = _manifest(index_dir, backend)
+        manifest.sync(memories_dir)
+        return manifest
+
+
+def record_memory(
+    memory_path: Path,
+    content: str,
+    index_dir: Path,
+    backend: FilesystemBackend,
+) -> MemoryRecord:
+    """Append the record for a freshly written memory."""
+    stat = backend.stat(memory_path)
+    record = MemoryRecord.parse(
+        Path(memory_path).name, content, stat.st_mtime_ns, stat.st_size
+    )
+    with _LOCK:
+        _manifest(index_dir, backend).append(record)
+    return record
+
+
+def memory_insights(
+    memories_dir: Path, index_dir: Path, backend: FilesystemBackend
+) -> list[str]:
+    """Key Insights across all memories, without reparsing unchanged files."""
+    return load_manifest(memories_dir, index_dir, backend).insights()
+
+
+def clear_manifest_cache() -> None:
+    with _LOCK:
+        _MANIFESTS.clear()
@@ -0,0 +1,393 @@
+"""
+Offline vector index over ``.memories/*.md`` and ``.vault/*.md``.
+
+Embeddings live in a float32 matrix file (``{name}.f32``) next to a small
+JSON sidecar listing the document id of every row and the
+``(mtime_ns, size)`` of the file each row was embedded from. The matrix is
+opened with ``np.memmap`` so a search touches only the pages it scans, and
+new documents are appended to the file in place. A re-written document
+(vault notes are overwritten by id, rollup shards are rewritten by
+compaction) gets a fresh row once its stat changes; its old row is
+tombstoned and dropped the next time the matrix is compacted.
+
+The default ``HashingEmbedder`` needs no model or network. Any object
+satisfying ``Embedder`` can be passed instead; the sidecar records the
+embedder's name and dimension and the index is rebuilt when they change.
+"""
+
+import threading
+import zlib
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+import orjson
+
+from app.core.logger import logger
+from app.core.settings import settings
+from app.engine.backends.protocol import FilesystemBackend
+from app.engine.memory.index import tokenize
+
+VECTOR_INDEX_NAME = "documents"
+VECTOR_INDEX_VERSION = 2
+
+# Rows scored per matmul; bounds the temporary score buffer for large indexes.
+SEARCH_BATCH_ROWS = 65_536
+
+_VECTOR_INDEXES: dict[Path, "VectorIndex"] = {}
+_LOCK = threading.RLock()
+
+
+@runtime_checkable
+class Embedder(Protocol):
+    name: str
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return an ``(len(texts), dim)`` float32 array of L2-normalized rows."""
+        ...
+
+
+class HashingEmbedder:
+    """Deterministic feature-hashing embedder over unigrams and bigrams.
+
+    Terms are hashed with CRC32 (stable across processes, unlike ``hash``)
+    into ``dim`` signed buckets with sublinear term-frequency weights.
+    """
+
+    def __init__(self, dim: int = 512) -> None:
+        self.dim = dim
+        self.name = f"hashing-crc32-{dim}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for feature in features:
+                digest = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                matrix[row, digest % self.dim] += sign
+        np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        return _normalize(matrix)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+@lru_cache(maxsize=1)
+def get_embedder() -> Embedder:
+    return HashingEmbedder(dim=settings.memory.embedding_dim)
+
+
+@dataclass
+class VectorIndex:
+    """Append-only float32 embedding matrix keyed by document id."""
+
+    embedder: Embedder
+    index_dir: Path
+    backend: FilesystemBackend
+    name: str = VECTOR_INDEX_NAME
+    # Document id per matrix row; ``None`` marks a superseded row.
+    row_ids: list[str | None] = field(default_factory=list)
+    # ``(mtime_ns, size)`` of the file each live document was embedded from.
+    stats: dict[str, tuple[int, int]] = field(default_factory=dict)
+    _rows: dict[str, int] = field(default_factory=dict, repr=False)
+    _matrix: np.ndarray | None = field(default=None, repr=False)
+
+    @property
+    def matrix_path(self) -> Path:
+        return self.index_dir / f"{self.name}.f32"
+
+    @property
+    def meta_path(self) -> Path:
+        return self.index_dir / f"{self.name}.json"
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def ids(self) -> list[str]:
+        return list(self._rows)
+
+    def load(self) -> "VectorIndex":
+        """Read the sidecar; rebuild from scratch if it is missing or stale."""
+        meta = self._read_meta()
+        if meta is None:
+            self._reset()
+            return self
+        self.row_ids = meta["row_ids"]
+        self.stats = {doc_id: tuple(stat) for doc_id, stat in meta["stats"].items()}
+        self._rows = {doc_id: i for i, doc_id in enumerate(self.row_ids) if doc_id}
+        self._matrix = None
+        return self
+
+    def add(
+        self,
+        items: Iterable[tuple[str, str]],
+        stats: Mapping[str, tuple[int, int]] | None = None,
+    ) -> int:
+        """Embed and append ``(doc_id, text)`` pairs. Returns rows written.
+
+        ``stats`` maps document ids to the ``(mtime_ns, size)`` of their
+        file; documents without one are re-embedded on the next sync.
+        """
+        items = list(items)
+        if not items:
+            return 0
+        vectors = self.embedder.embed([text for _, text in items])
+        self.backend.mkdir(self.index_dir)
+        with self.backend.open_write(self.matrix_path, "ab", encoding=None) as fh:
+            # Drop rows left behind by an append whose sidecar never landed.
+            fh.truncate(len(self.row_ids) * self.embedder.dim * 4)
+            fh.write(vectors.astype(np.float32, copy=False).tobytes())
+        for doc_id, _ in items:
+            previous = self._rows.get(doc_id)
+            if previous is not None:
+                self.row_ids[previous] = None
+            self._rows[doc_id] = len(self.row_ids)
+            self.row_ids.append(doc_id)
+            stat = (stats or {}).get(doc_id)
+            if stat is None:
+                self.stats.pop(doc_id, None)
+            else:
+                self.stats[doc_id] = stat
+        self._matrix = None
+        if len(self.row_ids) - len(self._rows) >= max(len(self._rows), 1):
+            self.compact()
+        else:
+            self._write_meta()
+        return len(items)
+
+    def remove(self, doc_ids: Iterable[str]) -> None:
+        removed = False
+        for doc_id in doc_ids:
+            row = self._rows.pop(doc_id, None)
+            self.stats.pop(doc_id, None)
+            if row is not None:
+                self.row_ids[row] = None
+                removed = True
+        if removed:
+            self._write_meta()
+
+    def compact(self) -> None:
+        """Rewrite the matrix without tombstoned rows."""
+        live = [row for row, doc_id in enumerate(self.row_ids) if doc_id is not None]
+        matrix = np.array(self._load_matrix()[live], dtype=np.float32)
+        tmp_path = self.matrix_path.with_name(f".{self.matrix_path.name}.tmp")
+        self.backend.write_bytes(tmp_path, matrix.tobytes())
+        self._matrix = None
+        self.backend.move(tmp_path, self.matrix_path)
+        self.row_ids = [self.row_ids[row] for row in live]
+        self._rows = {doc_id: i for i, doc_id in enumerate(self.row_ids)}
+        self._write_meta()
+
+    def search(self, query: str, k: int = 5) -> list[tuple[str, float]]:
+        """Cosine top-``k`` documents for ``query`` as ``(doc_id, score)``."""
+        return self.search_batch([query], k)[0]
+
+    def search_batch(
+        self, queries: Sequence[str], k: int = 5
+    ) -> list[list[tuple[str, float]]]:
+        """Cosine top-``k`` for several queries with one scan of the matrix."""
+        if not queries:
+            return []
+        matrix = self._load_matrix()
+        if not self._rows or matrix.shape[0] == 0:
+            return [[] for _ in queries]
+
+        q = self.embedder.embed(queries).T
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        for start in range(0, matrix.shape[0], SEARCH_BATCH_ROWS):
+            block = np.asarray(matrix[start : start + SEARCH_BATCH_ROWS]) @ q
+            scores = np.concatenate([best_scores, block.T], axis=1)
+            rows = np.concatenate(
+                [
+                    best_rows,
+                    np.broadcast_to(
+                        np.arange(start, start + block.shape[0]),
+                        (len(queries), block.shape[0]),
+                    ),
+                ],
+                axis=1,
+            )
+            # Over-fetch so tombstoned rows can be skipped below.
+            keep = min(scores.shape[1], k + len(self.row_ids) - len(self._rows))
+            top = np.argpartition(-scores, keep - 1, axis=1)[:, :keep]
+            best_scores = np.take_along_axis(scores, top, axis=1)
+            best_rows = np.take_along_axis(rows, top, axis=1)
+
+        results: list[list[tuple[str, float]]] = []
+        for scores, rows in zip(best_scores, best_rows):
+            hits: list[tuple[str, float]] = []
+            for i in np.argsort(-scores):
+                doc_id = self.row_ids[rows[i]]
+                if doc_id is None or scores[i] <= 0:
+                    continue
+                hits.append((doc_id, float(scores[i])))
+                if len(hits) == k:
+                    break
+            results.append(hits)
+        return results
+
+    def _load_matrix(self) -> np.ndarray:
+        if self._matrix is not None:
+            return self._matrix
+        rows, dim = len(self.row_ids), self.embedder.dim
+        if rows == 0 or not self.backend.is_file(self.matrix_path):
+            self._matrix = np.empty((0, dim), dtype=np.float32)
+            return self._matrix
+        with self.backend.open_read(self.matrix_path, "rb", encoding=None) as fh:
+            try:
+                # The sidecar is written after the append, so trailing rows
+                # from an interrupted write are ignored.
+                self._matrix = np.memmap(
+                    fh, dtype=np.float32, mode="r", shape=(rows, dim)
+                )
+            except (OSError, ValueError, AttributeError):
+                # Backends without a real file descriptor. ``memmap`` has
+                # already seeked to the end to size the file.
+                fh.seek(0)
+                data = np.frombuffer(fh.read(), dtype=np.float32)
+                self._matrix = data[: rows * dim].reshape(rows, dim)
+        return self._matrix
+
+    def _read_meta(self) -> dict | None:
+        if not self.backend.is_file(self.meta_path):
+            return None
+        try:
+            meta = orjson.loads(self.backend.read_bytes(self.meta_path))
+        except orjson.JSONDecodeError as exc:
+            logger.warning(
+                f"Rebuilding unreadable vector index {self.meta_path}: {exc}"
+            )
+            return None
+        if (
+            meta.get("version") != VECTOR_INDEX_VERSION
+            or meta.get("embedder") != self.embedder.name
+            or meta.get("dim") != self.embedder.dim
+        ):
+            logger.info(
+                f"Rebuilding vector index {self.meta_path} for {self.embedder.name}"
+            )
+            return None
+        return meta
+
+    def _write_meta(self) -> None:
+        payload = orjson.dumps(
+            {
+                "version": VECTOR_INDEX_VERSION,
+                "embedder": self.embedder.name,
+                "dim": self.embedder.dim,
+                "row_ids": self.row_ids,
+                "stats": self.stats,
+            }
+        )
+        tmp_path = self.meta_path.with_name(f".{self.meta_path.name}.tmp")
+        self.backend.write_bytes(tmp_path, payload)
+        self.backend.move(tmp_path, self.meta_path)
+
+    def _reset(self) -> None:
+        self.row_ids = []
+        self.stats = {}
+        self._rows = {}
+        self._matrix = None
+        self.backend.delete_file(self.matrix_path)
+        self.backend.delete_file(self.meta_path)
+
+
+def document_id(directory: Path, path: Path) -> str:
+    return (Path(directory) / Path(path).name).as_posix()
+
+
+def _vector_index(index_dir: Path, backend: FilesystemBackend) -> VectorIndex:
+    embedder = get_embedder()
+    key = backend.resolve(index_dir)
+    index = _VECTOR_INDEXES.get(key)
+    if index is None or index.embedder is not embedder:
+        index = VectorIndex(embedder=embedder, index_dir=index_dir, backend=backend)
+        _VECTOR_INDEXES[key] = index.load()
+    return index
+
+
+def sync_vector_index(
+    directories: Sequence[Path], index_dir: Path, backend: FilesystemBackend
+) -> VectorIndex:
+    """Embed markdown files that are new or changed and drop deleted ones."""
+    with _LOCK:
+        index = _vector_index(index_dir, backend)
+        on_disk: dict[str, tuple[Path, tuple[int, int]]] = {}
+        for directory in directories:
+            for entry in backend.glob(directory, "*.md"):
+                if entry.is_file():
+                    stat = entry.stat()
+                    on_disk[document_id(directory, Path(entry.path))] = (
+                        Path(entry.path),
+                        (stat.st_mtime_ns, stat.st_size),
+                    )
+        index.remove([doc_id for doc_id in index.ids if doc_id not in on_disk])
+        changed = {
+            doc_id: stat
+            for doc_id, (_, stat) in on_disk.items()
+            if index.stats.get(doc_id) != stat
+        }
+        index.add(
+            (
+                (doc_id, backend.read_text(on_disk[doc_id][0], encoding="utf-8"))
+                for doc_id in changed
+            ),
+            stats=changed,
+        )
+        return index
+
+
+def index_documents(
+    documents: Iterable[tuple[Path, str]],
+    index_dir: Path,
+    backend: FilesystemBackend,
+) -> None:
+    """Append freshly written ``(path, text)`` documents to the vector index.
+
+    ``path`` is the relative path the document was written to (e.g.
+    ``.vault/note.md``); it becomes the document id.
+    """
+    documents = list(documents)
+    stats: dict[str, tuple[int, int]] = {}
+    for path, _ in documents:
+        stat = backend.stat(path)
+        stats[document_id(path.parent, path)] = (stat.st_mtime_ns, stat.st_size)
+    with _LOCK:
+        index = _vector_index(index_dir, backend)
+        index.add(
+            ((document_id(path.parent, path), text) for path, text in documents),
+            stats=stats,
+        )
+
+
+def search_related(
+    query: str,
+    directories: Sequence[Path],
+    index_dir: Path,
+    backend: FilesystemBackend,
+    k: int = 5,
+) -> list[tuple[str, float]]:
+    """Return ``(document_id, cosine)`` for the ``k`` nearest documents."""
+    with _LOCK:
+        index = sync_vector_index(directories, index_dir, backend)
+        return index.search(query, k)
+
+
+def clear_vector_index_cache() -> None:
+    with _LOCK:
+        _VECTOR_INDEXES.clear()
+        get_embedder.cache_clear()
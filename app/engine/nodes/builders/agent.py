@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import asyncio
+import hashlib
+from collections.abc import Hashable, Iterator, Mapping, Sequence
 from typing import TypeAlias, TypedDict
 
+import httpx
+import orjson
 from langchain.agents import create_agent
 from langchain_core.messages import AnyMessage, BaseMessage
 from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
 from langgraph.graph.state import CompiledStateGraph
+from openai import DefaultAsyncHttpxClient
 
 from app.core.logger import logger
 from app.core.settings import settings
@@ -26,6 +32,23 @@ class StreamPart(TypedDict):
 
 StreamChunk: TypeAlias = tuple[str, object] | StreamPart
 
+ExecutorKey: TypeAlias = tuple[Hashable, ...]
+
+# Agent executors keyed by (tools, system prompt, response format, LLM config
+# hash). Compiled agents hold no per-run state, so one instance serves every
+# run with the same shape. ``_POOL_LLM_HASH`` records the config the pool was
+# built against; a mismatch drops every entry.
+_EXECUTOR_POOL: dict[ExecutorKey, CompiledStateGraph] = {}
+_POOL_LLM_HASH: str | None = None
+
+# One long-lived async HTTP client per model so keep-alive connections and TLS
+# sessions survive across runs and across executor rebuilds. Each client
+# remembers the event loop it was created on: pooled connections are bound
+# to that loop, so a different loop gets a fresh client.
+_LLM_HTTP_CLIENTS: dict[
+    str, tuple[asyncio.AbstractEventLoop | None, httpx.AsyncClient]
+] = {}
+
 
 def _extract_messages(result: Mapping[str, object]) -> list[AnyMessage]:
     messages = result.get("messages")
@@ -38,21 +61,115 @@ def _extract_messages(result: Mapping[str, object]) -> list[AnyMessage]:
     return messages
 
 
+def _llm_config_hash() -> str:
+    payload = orjson.dumps(
+        settings.llm.model_dump(mode="json"),
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _freeze(value: object) -> Hashable:
+    if isinstance(value, BaseTool):
+        return ("tool", value.name)
+    if isinstance(value, type):
+        return ("type", f"{value.__module__}.{value.__qualname__}")
+    if isinstance(value, Mapping):
+        return (
+            "mapping",
+            orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str),
+        )
+    schema = getattr(value, "schema", None)
+    if schema is not None:
+        return (type(value).__name__, _freeze(schema), getattr(value, "strict", None))
+    return ("repr", repr(value))
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _llm_http_client(model: str) -> httpx.AsyncClient:
+    loop = _running_loop()
+    entry = _LLM_HTTP_CLIENTS.get(model)
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+    if entry is not None:
+        # Executors hold the old client through their ChatOpenAI; rebuild
+        # them against the new one. The old client's connections belong to
+        # another (usually finished) loop, so it is dropped, not closed here.
+        _EXECUTOR_POOL.clear()
+    client = DefaultAsyncHttpxClient()
+    _LLM_HTTP_CLIENTS[model] = (loop, client)
+    return client
+
+
 def build_agent_executor(
     *,
     tools: Sequence[object],
     system_prompt: str,
     response_format: object,
 ) -> CompiledStateGraph:
-    """Build a LangChain agent executor with shared OpenAI model config."""
+    """Return a pooled LangChain agent executor with shared OpenAI model config.
+
+    Executors are reused across runs while ``settings.llm`` is unchanged; any
+    change to the LLM config drops the pool so the next call rebuilds.
+    """
+    global _POOL_LLM_HASH
+
+    llm_hash = _llm_config_hash()
+    if llm_hash != _POOL_LLM_HASH:
+        if _EXECUTOR_POOL:
+            logger.debug("LLM config changed; dropping pooled agent executors")
+        _EXECUTOR_POOL.clear()
+        _POOL_LLM_HASH = llm_hash
+
+    llm_kwargs = settings.llm.model_dump(mode="python")
+    # Resolved before the pool lookup: a new event loop gets a new client and
+    # that drops the executors bound to the old one.
+    http_client = _llm_http_client(llm_kwargs["model"])
+
+    key: ExecutorKey = (
+        tuple(_freeze(tool) for tool in tools),
+        system_prompt,
+        _freeze(response_format),
+        llm_hash,
+    )
+    executor = _EXECUTOR_POOL.get(key)
+    if executor is not None:
+        return executor
 
-    return create_agent(
-        model=ChatOpenAI(**settings.llm.model_dump(mode="python")),
+    executor = create_agent(
+        model=ChatOpenAI(**llm_kwargs, http_async_client=http_client),
         tools=tools,
         system_prompt=system_prompt,
         response_format=response_format,
         middleware=[tool_retry, context_editing],
     )
+    _EXECUTOR_POOL[key] = executor
+    return executor
+
+
+def clear_agent_executors() -> None:
+    """Drop every pooled agent executor; HTTP clients are kept."""
+    global _POOL_LLM_HASH
+
+    _EXECUTOR_POOL.clear()
+    _POOL_LLM_HASH = None
+
+
+async def aclose_agent_executors() -> None:
+    """Drop pooled executors and close the shared LLM HTTP clients."""
+    clear_agent_executors()
+    loop = _running_loop()
+    clients = list(_LLM_HTTP_CLIENTS.values())
+    _LLM_HTTP_CLIENTS.clear()
+    for client_loop, client in clients:
+        if client_loop is loop or client_loop is None:
+            await client.aclose()
 
 
 def _extract_text_from_reasoning_block(block: Mapping[str, object]) -> str:
@@ -72,7 +189,8 @@ def _extract_text_from_reasoning_block(block: Mapping[str, object]) -> str:
     return ""
 
 
-def _log_stream_chunk(workflow_name: str, token: object) -> None:
+def iter_content_chunks(token: object) -> Iterator[tuple[str, str]]:
+    """Yield ``("reasoning" | "text", text)`` pairs from a streamed message."""
     content_blocks = getattr(token, "content_blocks", None)
     if not isinstance(content_blocks, list):
         return
@@ -85,13 +203,16 @@ def _log_stream_chunk(workflow_name: str, token: object) -> None:
         if block_type == "reasoning":
             reasoning_text = _extract_text_from_reasoning_block(block)
             if reasoning_text:
-                logger.debug(
-                    f"[{workflow_name.upper()}] reasoning chunk: {reasoning_text}"
-                )
+                yield "reasoning", reasoning_text
         elif block_type == "text":
             text = block.get("text")
             if isinstance(text, str) and text:
-                logger.debug(f"[{workflow_name.upper()}] text chunk: {text}")
+                yield "text", text
+
+
+def _log_stream_chunk(workflow_name: str, token: object) -> None:
+    for kind, text in iter_content_chunks(token):
+        logger.debug(f"[{workflow_name.upper()}] {kind} chunk: {text}")
 
 
 async def run_agent_executor(
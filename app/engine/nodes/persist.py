@@ -1,29 +1,37 @@
+import asyncio
+
 from app.core.paths import DEFAULT_REPORT_PATH
 from app.core.settings import settings
-from app.engine.backends import get_filesystem_backend
+from app.engine.backends import get_async_filesystem_backend
 from app.engine.schema import ResearchState
 from app.engine.tools.io import persist_memories, write_sources
 
 
-def persist_artifacts(state: ResearchState) -> ResearchState:
-    backend = get_filesystem_backend(
+async def persist_artifacts(state: ResearchState) -> ResearchState:
+    backend = get_async_filesystem_backend(
         backend_type=settings.filesystem.backend_type,
         base_path=settings.filesystem.base_path,
+        max_workers=settings.filesystem.io_workers,
     )
-    sources_dir = settings.OUTPUT_DIR
-    write_sources(
-        sources_dir / "sources.csv",
-        state["sources"],
-        backend=backend,
-    )
-    persist_memories(
-        settings.MEMORIES_DIR,
-        state["topic"],
-        state["research_notes"],
-        state["key_insights"],
-        state["reasoning"],
-        state["sources"],
-        DEFAULT_REPORT_PATH,
-        backend=backend,
+    # Both writers touch several files (and the memory indexes), so each runs
+    # as one unit on the backend's I/O pool rather than call by call.
+    await asyncio.gather(
+        backend.run_sync(
+            write_sources,
+            settings.OUTPUT_DIR / "sources.csv",
+            state["sources"],
+            backend=backend.backend,
+        ),
+        backend.run_sync(
+            persist_memories,
+            settings.MEMORIES_DIR,
+            state["topic"],
+            state["research_notes"],
+            state["key_insights"],
+            state["reasoning"],
+            state["sources"],
+            DEFAULT_REPORT_PATH,
+            backend=backend.backend,
+        ),
     )
     return state
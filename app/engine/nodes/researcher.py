@@ -10,7 +10,8 @@ from app.engine.nodes.builders.agent import build_agent_executor, run_agent_exec
 from app.engine.nodes.types import AgentNode, Workflow
 from app.engine.outputs import ResearcherOutput
 from app.engine.tools import MCP_TOOLS, OPENAI_TOOLS
-from app.engine.tools.io import save_note
+from app.engine.tools.io import save_note, search_related_notes
+from app.engine.tools.search import federated_search
 from app.engine.tools.web import fetch_url
 
 if TYPE_CHECKING:
@@ -25,8 +26,10 @@ def create_researcher_agent() -> AgentNode:
     TOOLS = [
         *OPENAI_TOOLS,
         *MCP_TOOLS,
+        federated_search,
         fetch_url,
         save_note,
+        search_related_notes,
     ]
 
     async def research_node(
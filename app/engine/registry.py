@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Callable
 
 from langgraph.checkpoint.memory import BaseCheckpointSaver
@@ -6,6 +7,13 @@ from langgraph.graph.state import CompiledStateGraph
 # Global registry: name -> factory function
 _WORKFLOW_REGISTRY: dict[str, Callable[[], CompiledStateGraph]] = {}
 
+# Compiled graphs keyed by (workflow name, id(checkpointer)). Each entry holds
+# the compiled graph, which in turn holds a strong reference to its
+# checkpointer, so an id can't be recycled while its entry is alive. The LRU
+# bound keeps short-lived checkpointers from accumulating.
+_COMPILED_CACHE_SIZE = 32
+_COMPILED_CACHE: OrderedDict[tuple[str, int], CompiledStateGraph] = OrderedDict()
+
 
 def workflow(name: str):
     """
@@ -21,6 +29,7 @@ def workflow(name: str):
         fn: Callable[[], CompiledStateGraph],
     ) -> Callable[[], CompiledStateGraph]:
         _WORKFLOW_REGISTRY[name.lower()] = fn
+        invalidate_workflow_cache(name)
         return fn
 
     return decorator
@@ -39,8 +48,46 @@ def get_workflow(
 ) -> CompiledStateGraph:
     """
     Retrieve a compiled workflow graph by name.
+
+    Graphs are compiled once per (name, checkpointer) and reused; compiled
+    graphs are stateless between invocations, so sharing them across
+    concurrent runs is safe.
     """
     name = name.lower()
     if name not in _WORKFLOW_REGISTRY:
         raise ValueError(f"Workflow '{name}' not found. Available: {list_workflows()}")
-    return _WORKFLOW_REGISTRY[name](checkpointer)
+
+    key = (name, id(checkpointer))
+    graph = _COMPILED_CACHE.get(key)
+    if graph is not None:
+        _COMPILED_CACHE.move_to_end(key)
+        return graph
+
+    graph = _WORKFLOW_REGISTRY[name](checkpointer)
+    _COMPILED_CACHE[key] = graph
+    if len(_COMPILED_CACHE) > _COMPILED_CACHE_SIZE:
+        _COMPILED_CACHE.popitem(last=False)
+    return graph
+
+
+def warm_workflows(checkpointer: BaseCheckpointSaver) -> list[str]:
+    """
+    Compile every registered workflow against ``checkpointer`` ahead of time.
+    """
+    names = list_workflows()
+    for name in names:
+        get_workflow(name, checkpointer)
+    return names
+
+
+def invalidate_workflow_cache(name: str | None = None) -> None:
+    """
+    Drop compiled graphs for ``name``, or for every workflow when omitted.
+    """
+    if name is None:
+        _COMPILED_CACHE.clear()
+        return
+
+    name = name.lower()
+    for key in [key for key in _COMPILED_CACHE if key[0] == name]:
+        del _COMPILED_CACHE[key]
@@ -51,3 +51,10 @@ class ResearchRequest(BaseModel):
     seed_urls: list[str] = Field(default_factory=list)
     experiment_snippets: list[str] = Field(default_factory=list)
     search: SearchQuery | None = None
+
+
+class RerunRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    # ResearchState keys to overwrite before the node runs again.
+    updates: dict[str, object] = Field(default_factory=dict)
@@ -0,0 +1,280 @@
+"""
+Two-tier TTL cache for paid search API results.
+
+Lookups go through an in-memory LRU first and then a SQLite table that
+survives restarts, so repeated queries within a run and across runs on
+related topics skip the provider round trip. Keys are the provider, the
+normalized query, the result limit and the search type.
+
+Entries are fresh for the provider's TTL. After that they are still served
+for ``stale_while_revalidate_s`` while a single background task refetches
+them. Errors are never cached. Hit ratio and the estimated latency saved
+(the provider's mean fetch time per hit) are exported under
+``collectors.search_cache`` in ``GET /api/v1/metrics``.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Protocol
+
+import orjson
+
+from app.core.logger import logger
+from app.core.metrics import Timing, metrics
+from app.core.settings import SearchCacheConfig, settings
+
+SearchResult = tuple[Any, str | None]
+Fetch = Callable[[], Awaitable[SearchResult]]
+
+# Boolean operators are case-sensitive for Brave; everything else is not.
+_OPERATORS = frozenset({"AND", "OR", "NOT"})
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and casefold everything but boolean operators."""
+    return " ".join(
+        token if token in _OPERATORS else token.casefold() for token in query.split()
+    )
+
+
+def cache_key(provider: str, query: str, limit: int, search_type: str | None) -> str:
+    canonical = orjson.dumps(
+        [provider, normalize_query(query), limit, search_type or ""]
+    )
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class SearchCacheTier(Protocol):
+    """Storage for ``(stored_at, value)`` pairs; ``stored_at`` is wall time."""
+
+    def get(self, key: str) -> tuple[float, Any] | None: ...
+
+    def set(self, key: str, stored_at: float, value: Any) -> None: ...
+
+
+class MemorySearchCacheTier:
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[float, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, stored_at: float, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteSearchCacheTier:
+    """Results as JSON rows in a single SQLite table.
+
+    Rows older than ``max_age_s`` are pruned when the file is opened; reads
+    don't check age, the cache compares ``stored_at`` against its TTLs.
+    """
+
+    def __init__(self, path: str | Path, max_age_s: float) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value BLOB NOT NULL)"
+            )
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE stored_at < ?",
+                (time.time() - max_age_s,),
+            )
+
+    def get(self, key: str) -> tuple[float, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, value FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], orjson.loads(row[1])
+
+    def set(self, key: str, stored_at: float, value: Any) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?)",
+                (key, stored_at, orjson.dumps(value)),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SearchCache:
+    """Read-through cache over ``tiers``, fastest first."""
+
+    def __init__(
+        self,
+        tiers: list[SearchCacheTier],
+        ttl_s: dict[str, float] | None = None,
+        default_ttl_s: float = 3600.0,
+        stale_while_revalidate_s: float = 0.0,
+    ) -> None:
+        self.tiers = tiers
+        self.ttl_s = ttl_s or {}
+        self.default_ttl_s = default_ttl_s
+        self.stale_while_revalidate_s = stale_while_revalidate_s
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._fetch_timings: dict[str, Timing] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.latency_saved_s = 0.0
+
+    async def get_or_fetch(
+        self,
+        provider: str,
+        query: str,
+        limit: int,
+        search_type: str | None,
+        fetch: Fetch,
+    ) -> SearchResult:
+        key = cache_key(provider, query, limit, search_type)
+        entry = await asyncio.to_thread(self._lookup, key)
+        if entry is not None:
+            age = time.time() - entry[0]
+            ttl = self.ttl_s.get(provider, self.default_ttl_s)
+            if age < ttl + self.stale_while_revalidate_s:
+                self.hits += 1
+                timing = self._fetch_timings.get(provider)
+                if timing is not None and timing.count:
+                    self.latency_saved_s += timing.total / timing.count
+                if age >= ttl:
+                    self.stale_hits += 1
+                    self._revalidate(key, provider, fetch)
+                return entry[1], None
+        self.misses += 1
+        return await self._fetch(key, provider, fetch)
+
+    def stats(self) -> dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "latency_saved_s": self.latency_saved_s,
+            "fetch_latency_s": {
+                provider: timing.as_dict()
+                for provider, timing in self._fetch_timings.items()
+            },
+        }
+
+    def close(self) -> None:
+        for task in self._refreshing.values():
+            task.cancel()
+        for tier in self.tiers:
+            close = getattr(tier, "close", None)
+            if close is not None:
+                close()
+
+    def _lookup(self, key: str) -> tuple[float, Any] | None:
+        for index, tier in enumerate(self.tiers):
+            entry = tier.get(key)
+            if entry is not None:
+                # Promote into the faster tiers for the next lookup.
+                for faster in self.tiers[:index]:
+                    faster.set(key, *entry)
+                return entry
+        return None
+
+    def _store(self, key: str, stored_at: float, value: Any) -> None:
+        for tier in self.tiers:
+            tier.set(key, stored_at, value)
+
+    async def _fetch(self, key: str, provider: str, fetch: Fetch) -> SearchResult:
+        started = time.perf_counter()
+        value, error = await fetch()
+        if error is None:
+            timing = self._fetch_timings.setdefault(provider, Timing())
+            timing.observe(time.perf_counter() - started)
+            await asyncio.to_thread(self._store, key, time.time(), value)
+        return value, error
+
+    def _revalidate(self, key: str, provider: str, fetch: Fetch) -> None:
+        if key in self._refreshing:
+            return
+        self.refreshes += 1
+        task = asyncio.create_task(self._fetch(key, provider, fetch))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda done: self._refreshed(key, done))
+
+    def _refreshed(self, key: str, task: asyncio.Task) -> None:
+        self._refreshing.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Search cache refresh failed: {task.exception()}")
+
+
+def build_search_cache(config: SearchCacheConfig) -> SearchCache:
+    tiers: list[SearchCacheTier] = [MemorySearchCacheTier(config.max_entries)]
+    if config.path is not None:
+        max_age_s = max([config.default_ttl_s, *config.ttl_s.values()])
+        tiers.append(
+            SqliteSearchCacheTier(
+                config.path, max_age_s + config.stale_while_revalidate_s
+            )
+        )
+    return SearchCache(
+        tiers,
+        ttl_s=config.ttl_s,
+        default_ttl_s=config.default_ttl_s,
+        stale_while_revalidate_s=config.stale_while_revalidate_s,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_search_cache() -> SearchCache:
+    cache = build_search_cache(settings.search_cache)
+    metrics.register_collector("search_cache", cache.stats)
+    return cache
+
+
+def clear_search_cache() -> None:
+    """Close and forget the process-wide cache (the next call rebuilds it)."""
+    if get_search_cache.cache_info().currsize:
+        get_search_cache().close()
+    get_search_cache.cache_clear()
+
+
+async def cached_search(
+    provider: str,
+    query: str,
+    limit: int,
+    search_type: str | None,
+    fetch: Fetch,
+) -> SearchResult:
+    """Serve ``fetch()`` through the process-wide cache when it is enabled."""
+    if not settings.search_cache.enabled:
+        return await fetch()
+    return await get_search_cache().get_or_fetch(
+        provider, query, limit, search_type, fetch
+    )
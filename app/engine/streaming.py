@@ -0,0 +1,105 @@
+"""
+Translate LangGraph stream chunks into client-facing progress events.
+
+``executor.stream_execute`` runs the outer graph with
+``astream(stream_mode=["tasks", "updates", "messages", "values"],
+subgraphs=True)``. Agent executors invoked inside nodes forward their own
+chunks under a namespaced path, so tokens and tool calls from every agent
+arrive here as they happen.
+"""
+
+from collections.abc import Iterator, Mapping
+from typing import TypedDict
+
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+from app.engine.nodes.builders.agent import iter_content_chunks
+
+STREAM_MODES = ["tasks", "updates", "messages", "values"]
+
+
+class StreamEvent(TypedDict):
+    event: str
+    data: dict[str, object]
+
+
+def _agent_name(namespace: tuple[str, ...]) -> str | None:
+    # Namespaces look like ("researcher:<task-id>", ...); the first segment
+    # names the outer node the chunk originated from.
+    if not namespace:
+        return None
+    return namespace[0].split(":", 1)[0]
+
+
+def _node_events(data: Mapping[str, object]) -> Iterator[StreamEvent]:
+    name = data.get("name")
+    if "input" in data:
+        yield StreamEvent(event="node", data={"node": name, "status": "started"})
+    elif data.get("error"):
+        yield StreamEvent(
+            event="node",
+            data={"node": name, "status": "failed", "error": str(data["error"])},
+        )
+    else:
+        yield StreamEvent(event="node", data={"node": name, "status": "finished"})
+
+
+def _tool_events(node: str | None, data: Mapping[str, object]) -> Iterator[StreamEvent]:
+    for update in data.values():
+        if not isinstance(update, Mapping):
+            continue
+        messages = update.get("messages")
+        if not isinstance(messages, list):
+            continue
+        for message in messages:
+            if isinstance(message, AIMessage):
+                for call in message.tool_calls:
+                    yield StreamEvent(
+                        event="tool_call",
+                        data={
+                            "node": node,
+                            "id": call.get("id"),
+                            "name": call.get("name"),
+                            "args": call.get("args"),
+                        },
+                    )
+            elif isinstance(message, ToolMessage):
+                yield StreamEvent(
+                    event="tool_result",
+                    data={
+                        "node": node,
+                        "id": message.tool_call_id,
+                        "name": message.name,
+                        "status": message.status,
+                    },
+                )
+
+
+def _token_events(node: str | None, data: object) -> Iterator[StreamEvent]:
+    if not (isinstance(data, tuple) and len(data) == 2):
+        return
+    token, _ = data
+    # Messages mode also echoes tool and input messages; only model output
+    # chunks carry tokens.
+    if not isinstance(token, AIMessageChunk):
+        return
+    for kind, text in iter_content_chunks(token):
+        event = "reasoning" if kind == "reasoning" else "token"
+        yield StreamEvent(event=event, data={"node": node, "text": text})
+
+
+def translate_chunk(
+    namespace: tuple[str, ...], mode: str, data: object
+) -> Iterator[StreamEvent]:
+    """Map one ``(namespace, mode, data)`` stream chunk to progress events.
+
+    Top-level ``values`` chunks are not forwarded; the executor keeps the last
+    one as the final state.
+    """
+    node = _agent_name(namespace)
+    if mode == "tasks" and not namespace and isinstance(data, Mapping):
+        yield from _node_events(data)
+    elif mode == "updates" and namespace and isinstance(data, Mapping):
+        yield from _tool_events(node, data)
+    elif mode == "messages":
+        yield from _token_events(node, data)
@@ -0,0 +1,188 @@
+"""
+Rank fusion of search results across providers.
+
+``fuse_results`` turns several ranked result lists (one per provider) into a
+single list:
+
+1. URLs are canonicalized (scheme, ``www.``, default ports, fragments,
+   tracking parameters, trailing slashes) so the same page found by two
+   providers, or twice by one, collapses to one entry.
+2. Entries are scored by reciprocal-rank fusion, ``sum(1 / (k + rank))``
+   over the providers that returned them. Provider scores aren't
+   comparable, ranks are.
+3. Optionally, entries whose title and snippet SimHash fingerprints are
+   within ``max_distance`` bits of a better-ranked entry (mirrors,
+   syndicated copies) are dropped.
+
+Steps 1–2 run as one Polars pipeline; the SimHash comparison is vectorized
+with NumPy.
+"""
+
+import hashlib
+import re
+from collections.abc import Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+import polars as pl
+
+RRF_K = 60
+SIMHASH_MAX_DISTANCE = 3
+
+_TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "mc_cid",
+        "mc_eid",
+        "ref",
+        "ref_src",
+        "igshid",
+        "_hsenc",
+        "_hsmi",
+    }
+)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_TOKEN = re.compile(r"\w+")
+_BITS = np.arange(64, dtype=np.uint64)
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical form of ``url`` for duplicate detection, not for fetching.
+
+    ``http``/``https`` and ``www.`` variants map to the same key, so the
+    result may not resolve; callers keep the original URL for that.
+    """
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip()
+    host = (parts.hostname or "").removeprefix("www.")
+    scheme = parts.scheme.lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over the casefolded word tokens of ``text``."""
+    tokens = _TOKEN.findall(text.casefold())
+    if not tokens:
+        return 0
+    hashes = np.array(
+        [
+            int.from_bytes(
+                hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+            )
+            for token in tokens
+        ],
+        dtype=np.uint64,
+    )
+    ones = ((hashes[:, None] >> _BITS) & np.uint64(1)).sum(axis=0)
+    majority = (2 * ones > len(tokens)).astype(np.uint64)
+    return int((majority << _BITS).sum())
+
+
+def fuse_results(
+    result_lists: Sequence[list[dict[str, str]]],
+    limit: int,
+    k: int = RRF_K,
+    collapse_near_duplicates: bool = True,
+    max_distance: int = SIMHASH_MAX_DISTANCE,
+) -> list[dict[str, str]]:
+    """Fuse per-provider ranked lists into one deduplicated ranking.
+
+    Each list is taken to be best-first. The returned entries keep the URL
+    and provider of their best-ranked occurrence, fill ``title`` and
+    ``notes`` from the first occurrence that has them, and carry the fused
+    RRF score in ``score``.
+    """
+    rows = [
+        {
+            "list": list_index,
+            "rank": rank,
+            "url": entry.get("url", ""),
+            "title": entry.get("title", ""),
+            "notes": entry.get("notes", ""),
+            "provider": entry.get("provider", ""),
+        }
+        for list_index, results in enumerate(result_lists)
+        for rank, entry in enumerate(results, start=1)
+        if entry.get("url")
+    ]
+    if not rows:
+        return []
+
+    frame = (
+        pl.DataFrame(rows)
+        .with_columns(
+            pl.col("url")
+            .map_elements(canonicalize_url, return_dtype=pl.String)
+            .alias("key")
+        )
+        # A page listed twice by one provider counts once, at its best rank.
+        .sort("rank", "list")
+        .with_columns(
+            pl.when(pl.int_range(pl.len()).over("key", "list") == 0)
+            .then(1.0 / (k + pl.col("rank")))
+            .otherwise(0.0)
+            .alias("rrf")
+        )
+        .group_by("key", maintain_order=True)
+        .agg(
+            pl.col("url").first(),
+            pl.col("provider").first(),
+            pl.col("title").filter(pl.col("title") != "").first(),
+            pl.col("notes").filter(pl.col("notes") != "").first(),
+            pl.col("rrf").sum(),
+            pl.col("rank").min().alias("best_rank"),
+        )
+        .sort(["rrf", "best_rank"], descending=[True, False], maintain_order=True)
+        .with_columns(pl.col("title", "notes").fill_null(""))
+    )
+
+    fused = frame.select("title", "url", "notes", "provider", "rrf").to_dicts()
+    if collapse_near_duplicates:
+        fused = _collapse_near_duplicates(fused, max_distance, limit)
+    return [
+        {
+            "title": entry["title"],
+            "url": entry["url"],
+            "notes": entry["notes"],
+            "provider": entry["provider"],
+            "score": f"{entry['rrf']:.6f}",
+        }
+        for entry in fused[:limit]
+    ]
+
+
+def _collapse_near_duplicates(
+    entries: list[dict[str, object]],
+    max_distance: int,
+    limit: int,
+) -> list[dict[str, object]]:
+    fingerprints = np.array(
+        [simhash(f"{entry['title']} {entry['notes']}") for entry in entries],
+        dtype=np.uint64,
+    )
+    kept: list[int] = []
+    textual: list[int] = []
+    for index, fingerprint in enumerate(fingerprints):
+        if len(kept) == limit:
+            break
+        # Entries without text have no meaningful fingerprint; never merge them.
+        if fingerprint:
+            if textual:
+                distances = np.bitwise_count(fingerprints[textual] ^ fingerprint)
+                if int(distances.min()) <= max_distance:
+                    continue
+            textual.append(index)
+        kept.append(index)
+    return [entries[index] for index in kept]
@@ -1,4 +1,3 @@
-import re
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -7,8 +6,15 @@ from langchain.tools import tool
 from pydantic import BaseModel, Field
 
 from app.core.settings import settings
-from app.engine.backends import get_filesystem_backend
-from app.engine.backends.protocol import FilesystemBackend
+from app.engine.backends import get_async_filesystem_backend, get_filesystem_backend
+from app.engine.backends.protocol import AsyncFilesystemBackend, FilesystemBackend
+from app.engine.memory import (
+    index_documents,
+    index_memory,
+    parse_section,
+    record_memory,
+    search_related,
+)
 
 
 def _resolve_backend() -> FilesystemBackend:
@@ -18,6 +24,14 @@ def _resolve_backend() -> FilesystemBackend:
     )
 
 
+def _resolve_async_backend() -> AsyncFilesystemBackend:
+    return get_async_filesystem_backend(
+        backend_type=settings.filesystem.backend_type,
+        base_path=settings.filesystem.base_path,
+        max_workers=settings.filesystem.io_workers,
+    )
+
+
 def timestamp() -> str:
     return datetime.now(UTC).isoformat()
 
@@ -30,28 +44,21 @@ def load_memories(
     memories_dir: Path,
     backend: FilesystemBackend,
 ) -> list[str]:
-    if not backend.is_dir(memories_dir):
-        return []
-
-    memories: list[str] = []
-    for memory in backend.list_dir(memories_dir):
-        if memory.suffix != ".md":
-            continue
-        memories.append(backend.read_text(memory, encoding="utf-8"))
-    return memories
+    # Sorted so memories come back oldest first, as their file names order.
+    paths = sorted(
+        entry.path for entry in backend.glob(memories_dir, "*.md") if entry.is_file()
+    )
+    return [backend.read_text(path, encoding="utf-8") for path in paths]
 
 
 def extract_memory_insights(memories: list[str]) -> list[str]:
-    insights: list[str] = []
-    for memory in memories:
-        section_match = re.split(r"^# Key Insights\s*$", memory, flags=re.MULTILINE)
-        if len(section_match) < 2:
-            continue
-        section = section_match[1]
-        for line in section.splitlines():
-            if line.startswith("- "):
-                insights.append(line[2:].strip())
-    return insights
+    # For memories already on disk, ``memory_insights`` serves the same data
+    # from the manifest without reparsing.
+    return [
+        insight
+        for memory in memories
+        for insight in parse_section(memory, "Key Insights")
+    ]
 
 
 def persist_memories(
@@ -96,6 +103,9 @@ def persist_memories(
         ]
     )
     backend.write_text(memory_path, content, encoding="utf-8")
+    record_memory(memory_path, content, settings.INDEX_DIR, backend=backend)
+    index_memory(memory_path, content, settings.INDEX_DIR, backend=backend)
+    index_documents([(memory_path, content)], settings.INDEX_DIR, backend=backend)
     return [backend.resolve(memory_path)]
 
 
@@ -114,7 +124,9 @@ def write_sources(
             "score": [entry.get("score", "") for entry in sources],
         }
     )
-    frame.write_csv(backend.resolve(sources_path))
+    # Serialize in memory and write through the backend so non-disk
+    # backends receive the file too.
+    backend.write_text(sources_path, frame.write_csv(), encoding="utf-8")
 
 
 @tool(parse_docstring=True)
@@ -134,7 +146,7 @@ def save_note(note: str) -> str:
 
 
 @tool(parse_docstring=True)
-def write_report(content: str) -> str:
+async def write_report(content: str) -> str:
     """Write the final research report to ``settings.OUTPUT_DIR / report.md``.
 
     Args:
@@ -143,10 +155,10 @@ def write_report(content: str) -> str:
     Returns:
         A status string naming the resolved output path.
     """
-    backend = _resolve_backend()
+    backend = _resolve_async_backend()
     output_path = settings.OUTPUT_DIR / "report.md"
-    ensure_dir(output_path.parent, backend=backend)
-    written_path = backend.write_text(output_path, content, encoding="utf-8")
+    await backend.mkdir(output_path.parent)
+    written_path = await backend.write_text(output_path, content, encoding="utf-8")
     return f"Report saved to {written_path}"
 
 
@@ -160,7 +172,7 @@ class ZettelNote(BaseModel):
 
 
 @tool(parse_docstring=True)
-def write_zettelkasten_notes(notes: list[ZettelNote]) -> str:
+async def write_zettelkasten_notes(notes: list[ZettelNote]) -> str:
     """Persist extracted atomic notes to ``settings.VAULT_DIR``.
 
     Args:
@@ -172,14 +184,48 @@ def write_zettelkasten_notes(notes: list[ZettelNote]) -> str:
         path they were saved to.
     """
     vault_dir = settings.VAULT_DIR
-    backend = _resolve_backend()
-    ensure_dir(vault_dir, backend=backend)
-    # Simplified for the tool version, assuming inputs are pre-formatted
-    # or we format them here.
-    count = 0
-    for note in notes:
-        # note is now a ZettelNote object
-        p = vault_dir / f"{note.id}.md"
-        backend.write_text(p, note.content, encoding="utf-8")
-        count += 1
+    backend = _resolve_async_backend()
+    await backend.mkdir(vault_dir)
+    # One batch: every path is validated before anything is written, and a
+    # failure part-way leaves no half-written vault behind.
+    written = [(vault_dir / f"{note.id}.md", note.content) for note in notes]
+    await backend.write_many(written, encoding="utf-8")
+    count = len(written)
+    await backend.run_sync(
+        index_documents, written, settings.INDEX_DIR, backend=backend.backend
+    )
     return f"Saved {count} notes to {backend.resolve(vault_dir)}"
+
+
+@tool(parse_docstring=True)
+async def search_related_notes(query: str) -> str:
+    """Find past research memories and vault notes related to a query.
+
+    Searches a local embedding index, so it answers in milliseconds without
+    any web requests. Use it before searching the web to reuse what earlier
+    runs already found.
+
+    Args:
+        query: Natural-language description of the topic or question.
+
+    Returns:
+        A markdown list of the closest notes with their path, similarity
+        score and an excerpt, or a message saying nothing related was found.
+    """
+    backend = _resolve_async_backend()
+    hits = await backend.run_sync(
+        search_related,
+        query,
+        [settings.MEMORIES_DIR, settings.VAULT_DIR],
+        settings.INDEX_DIR,
+        backend=backend.backend,
+        k=settings.memory.related_top_k,
+    )
+    if not hits:
+        return "No related notes found."
+    lines: list[str] = []
+    for doc_id, score in hits:
+        text = await backend.read_text(doc_id, encoding="utf-8")
+        excerpt = " ".join(text.split())[:400]
+        lines.append(f"- `{doc_id}` (score {score:.2f}): {excerpt}")
+    return "\n".join(lines)
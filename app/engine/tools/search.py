@@ -1,11 +1,16 @@
+import asyncio
 from typing import Any
 
 import httpx
 import orjson
 from langchain_core.tools import tool
 
+from app.core.metrics import metrics
 from app.core.settings import settings
 from app.engine.schema import SearchQuery
+from app.engine.search_cache import cached_search
+from app.engine.tools.fusion import fuse_results
+from app.services.http import circuit_open, send_request
 
 
 def quote_term(term: str) -> str:
@@ -77,7 +82,7 @@ def build_semantic_query(query: SearchQuery, fallback: str) -> str:
 
 
 @tool(parse_docstring=True)
-def call_brave_search(query: str) -> tuple[list[dict[str, str]], str | None]:
+async def call_brave_search(query: str) -> tuple[list[dict[str, str]], str | None]:
     """Search the web using Brave Search.
 
     Args:
@@ -88,26 +93,42 @@ def call_brave_search(query: str) -> tuple[list[dict[str, str]], str | None]:
         A ``(results, error)`` pair. ``results`` is a list of dictionaries
         with ``title``, ``url``, ``notes``, ``provider``, and ``score``
         keys. ``error`` is ``None`` on success or a descriptive string if
-        the API key is missing or the request failed.
+        the API key is missing or the request failed. While Brave is
+        failing the results come from Exa instead (``provider`` says which).
     """
     limit = settings.DEFAULT_SEARCH_LIMIT
-    api_key = settings.BRAVE_SEARCH_API_KEY
-    if not api_key:
+    if circuit_open("brave") and settings.EXA_API_KEY:
+        return await _search_exa(query, limit, "auto")
+    return await _search_brave(query, limit)
+
+
+async def _search_brave(
+    query: str, limit: int
+) -> tuple[list[dict[str, str]], str | None]:
+    if not settings.BRAVE_SEARCH_API_KEY:
         return [], "BRAVE_SEARCH_API_KEY is not set."
+    return await cached_search(
+        "brave", query, limit, None, lambda: _fetch_brave(query, limit)
+    )
 
+
+async def _fetch_brave(
+    query: str, limit: int
+) -> tuple[list[dict[str, str]], str | None]:
+    api_key = settings.BRAVE_SEARCH_API_KEY
     url = settings.BRAVE_SEARCH_URL
     params = {"q": query, "count": limit}
     headers = {
         "Accept": "application/json",
         "X-Subscription-Token": api_key,
-        "User-Agent": "langgraph-researcher/1.0",
     }
 
     try:
-        with httpx.Client(timeout=20.0) as client:
-            response = client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            payload = response.json()
+        response = await send_request(
+            "brave", "GET", url, params=params, headers=headers
+        )
+        response.raise_for_status()
+        payload = response.json()
     except (httpx.HTTPError, ValueError) as exc:
         return [], f"Brave search failed: {exc}"
 
@@ -126,7 +147,7 @@ def call_brave_search(query: str) -> tuple[list[dict[str, str]], str | None]:
 
 
 @tool(parse_docstring=True)
-def call_exa_search(
+async def call_exa_search(
     query: str, search_type: str = "auto"
 ) -> tuple[list[dict[str, str]], str | None]:
     """Search using Exa.ai's neural/semantic search.
@@ -141,13 +162,33 @@ def call_exa_search(
         A ``(results, error)`` pair. ``results`` is a list of dictionaries
         with ``title``, ``url``, ``notes``, ``provider``, and ``score``
         keys. ``error`` is ``None`` on success or a descriptive string if
-        the API key is missing or the request failed.
+        the API key is missing or the request failed. While Exa is failing
+        the results come from Brave instead (``provider`` says which).
     """
     limit = settings.DEFAULT_SEARCH_LIMIT
-    api_key = settings.EXA_API_KEY
-    if not api_key:
+    if circuit_open("exa") and settings.BRAVE_SEARCH_API_KEY:
+        return await _search_brave(query, limit)
+    return await _search_exa(query, limit, search_type)
+
+
+async def _search_exa(
+    query: str, limit: int, search_type: str
+) -> tuple[list[dict[str, str]], str | None]:
+    if not settings.EXA_API_KEY:
         return [], "EXA_API_KEY is not set."
+    return await cached_search(
+        "exa",
+        query,
+        limit,
+        search_type or "auto",
+        lambda: _fetch_exa(query, limit, search_type),
+    )
+
 
+async def _fetch_exa(
+    query: str, limit: int, search_type: str
+) -> tuple[list[dict[str, str]], str | None]:
+    api_key = settings.EXA_API_KEY
     payload: dict[str, Any] = {
         "query": query,
         "numResults": limit,
@@ -161,18 +202,18 @@ def call_exa_search(
         "Accept": "application/json",
         "Authorization": f"Bearer {api_key}",
         "x-api-key": api_key,
-        "User-Agent": "langgraph-researcher/1.0",
     }
 
     try:
-        with httpx.Client(timeout=20.0) as client:
-            response = client.post(
-                settings.EXA_SEARCH_URL,
-                content=orjson.dumps(payload),
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await send_request(
+            "exa",
+            "POST",
+            settings.EXA_SEARCH_URL,
+            content=orjson.dumps(payload),
+            headers=headers,
+        )
+        response.raise_for_status()
+        data = response.json()
     except (httpx.HTTPError, ValueError) as exc:
         return [], f"Exa search failed: {exc}"
 
@@ -191,7 +232,7 @@ def call_exa_search(
 
 
 @tool(parse_docstring=True)
-def call_exa_context(query: str) -> tuple[str | None, str | None]:
+async def call_exa_context(query: str) -> tuple[str | None, str | None]:
     """Fetch code context or snippets from Exa for a programming query.
 
     Useful for retrieving code examples or library documentation relevant
@@ -218,46 +259,115 @@ def call_exa_context(query: str) -> tuple[str | None, str | None]:
     headers = {
         "Content-Type": "application/json",
         "x-api-key": api_key,
-        "User-Agent": "langgraph-researcher/1.0",
     }
 
     try:
-        with httpx.Client(timeout=20.0) as client:
-            response = client.post(
-                settings.EXA_CONTEXT_URL,
-                content=orjson.dumps(payload),
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response"), None
+        response = await send_request(
+            "exa",
+            "POST",
+            settings.EXA_CONTEXT_URL,
+            content=orjson.dumps(payload),
+            headers=headers,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("response"), None
     except (httpx.HTTPError, ValueError) as exc:
         return None, f"Exa context search failed: {exc}"
 
 
-def merge_sources(
-    primary: list[dict[str, str]],
-    secondary: list[dict[str, str]],
-    limit: int,
-) -> list[dict[str, str]]:
-    seen: dict[str, float] = {}
-    merged: list[dict[str, str]] = []
-    for index, entry in enumerate(primary + secondary):
-        url = entry.get("url", "")
-        if not url:
-            continue
-        raw_score = entry.get("score", "")
-        try:
-            score = float(raw_score) if raw_score else 0.0
-        except ValueError:
-            score = 0.0
-        if entry.get("title"):
-            score += 0.5
-        if entry.get("notes"):
-            score += 0.5
-        score += 1.0 / (index + 1)
-        if url not in seen or score > seen[url]:
-            seen[url] = score
-            merged.append(entry)
-    merged.sort(key=lambda item: seen.get(item.get("url", ""), 0.0), reverse=True)
-    return merged[:limit]
+def _search_query(
+    query: str,
+    phrases: list[str] | None,
+    sites: list[str] | None,
+    excluded: list[str] | None,
+) -> SearchQuery:
+    if not (phrases or sites or excluded):
+        # Nothing to combine: both providers get the expression verbatim.
+        return SearchQuery(
+            raw=query,
+            all_terms=[],
+            any_terms=[],
+            phrases=[],
+            excluded=[],
+            sites=[],
+            filetypes=[],
+            intitle=[],
+            inurl=[],
+        )
+    return SearchQuery(
+        raw="",
+        all_terms=query.split(),
+        any_terms=[],
+        phrases=phrases or [],
+        excluded=excluded or [],
+        sites=sites or [],
+        filetypes=[],
+        intitle=[],
+        inurl=[],
+    )
+
+
+async def _within_deadline(
+    provider: str,
+    search: Any,
+) -> tuple[list[dict[str, str]], str | None]:
+    deadline = settings.search.deadlines_s.get(
+        provider, settings.search.default_deadline_s
+    )
+    try:
+        async with asyncio.timeout(deadline):
+            results, error = await search
+    except TimeoutError:
+        metrics.inc(f"search.federated.{provider}.timeout")
+        return [], f"{provider} timed out after {deadline:g}s"
+    metrics.inc(f"search.federated.{provider}.{'error' if error else 'ok'}")
+    return results, error
+
+
+@tool(parse_docstring=True)
+async def federated_search(
+    query: str,
+    phrases: list[str] | None = None,
+    sites: list[str] | None = None,
+    excluded: list[str] | None = None,
+    search_type: str = "auto",
+) -> tuple[list[dict[str, str]], str | None]:
+    """Search Brave and Exa at once and return one deduplicated result list.
+
+    Prefer this over calling ``call_brave_search`` and ``call_exa_search``
+    separately: both providers are queried concurrently and their results
+    are merged, so one call covers keyword and semantic search.
+
+    Args:
+        query: Search terms or a natural-language search expression.
+        phrases: Optional exact phrases every result must contain.
+        sites: Optional domains to restrict the search to.
+        excluded: Optional terms results must not contain.
+        search_type: Exa search mode, e.g. ``auto`` (default), ``neural``,
+            or ``keyword``.
+
+    Returns:
+        A ``(results, error)`` pair. ``results`` is a list of dictionaries
+        with ``title``, ``url``, ``notes``, ``provider``, and ``score``
+        keys, best first. ``error`` is ``None`` if every configured provider
+        answered, otherwise it names the providers that failed or timed out
+        (``results`` then holds whatever the others returned).
+    """
+    limit = settings.DEFAULT_SEARCH_LIMIT
+    search_query = _search_query(query, phrases, sites, excluded)
+    searches: dict[str, Any] = {}
+    if settings.BRAVE_SEARCH_API_KEY:
+        searches["brave"] = _search_brave(build_boolean_query(search_query), limit)
+    if settings.EXA_API_KEY:
+        semantic = build_semantic_query(search_query, fallback=query)
+        searches["exa"] = _search_exa(semantic, limit, search_type)
+    if not searches:
+        return [], "Neither BRAVE_SEARCH_API_KEY nor EXA_API_KEY is set."
+
+    answers = await asyncio.gather(
+        *(_within_deadline(provider, search) for provider, search in searches.items())
+    )
+    errors = [error for _, error in answers if error]
+    fused = fuse_results([results for results, _ in answers], limit=limit)
+    return fused, "; ".join(errors) if errors else None
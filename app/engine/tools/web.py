@@ -2,10 +2,11 @@ import httpx
 from langchain_core.tools import tool
 
 from app.core.settings import settings
+from app.services.http import send_request
 
 
 @tool(parse_docstring=True)
-def fetch_url(url: str) -> str:
+async def fetch_url(url: str) -> str:
     """Fetch a URL via Jina Reader and return its Markdown rendering.
 
     Args:
@@ -17,15 +18,14 @@ def fetch_url(url: str) -> str:
         ``Error fetching URL`` if the request failed.
     """
     jina_url = f"https://r.jina.ai/{url}"
-    headers = {"User-Agent": "langgraph-researcher/1.0"}
+    headers: dict[str, str] = {}
 
     if settings.JINA_API_KEY:
         headers["Authorization"] = f"Bearer {settings.JINA_API_KEY}"
 
     try:
-        with httpx.Client(timeout=15.0) as client:
-            response = client.get(jina_url, headers=headers)
-            response.raise_for_status()
-            return response.text
+        response = await send_request("jina", "GET", jina_url, headers=headers)
+        response.raise_for_status()
+        return response.text
     except httpx.HTTPError as exc:
         return f"Error fetching URL {url} via Jina: {str(exc)}"
@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from phoenix.otel import register
@@ -7,6 +8,15 @@ from phoenix.otel import register
 import app.engine.graphs  # noqa: F401
 from app.api.v1.router import api_router
 from app.core.logger import logger
+from app.core.settings import settings
+from app.engine.backends import close_async_filesystem_backends
+from app.engine.checkpointer import close_checkpointer, open_checkpointer
+from app.engine.jobs import get_job_manager
+from app.engine.memory.compaction import run_compaction_schedule
+from app.engine.nodes.builders.agent import aclose_agent_executors
+from app.engine.registry import warm_workflows
+from app.engine.search_cache import clear_search_cache
+from app.services.http import aclose_http_clients, get_http_registry
 
 
 @asynccontextmanager
@@ -17,7 +27,30 @@ async def lifespan(app: FastAPI):
         auto_instrument=True,
     )
     logger.info("Phoenix OTEL tracer registered")
+    get_http_registry()
+    checkpointer = await open_checkpointer()
+    warmed = warm_workflows(checkpointer)
+    logger.info(f"Compiled workflow graphs: {', '.join(warmed)}")
+    compaction = None
+    if settings.memory.compaction_interval_s > 0:
+        compaction = asyncio.create_task(
+            run_compaction_schedule(
+                settings.memory.compaction_interval_s,
+                settings.memory.compaction_keep_recent,
+            )
+        )
     yield
+    # Shutdown
+    if compaction is not None:
+        compaction.cancel()
+        with suppress(asyncio.CancelledError):
+            await compaction
+    await get_job_manager().shutdown()
+    await aclose_agent_executors()
+    await aclose_http_clients()
+    clear_search_cache()
+    await close_checkpointer()
+    close_async_filesystem_backends()
 
 
 app = FastAPI(lifespan=lifespan)
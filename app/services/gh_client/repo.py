@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import httpx
 from github import GithubException
 
 from app.core.logger import logger
 from app.core.paths import DEFAULT_ASSETS_DIR
+from app.core.settings import settings
 from app.engine.backends import get_filesystem_backend
 from app.services.gh_client.types import SnapshotResult
+from app.services.http import get_rate_limiter, get_sync_http_client
 
 GITHUB_ARCHIVE_FORMAT = "tarball"
+# Chunk size for streaming the archive body into ``tarfile``.
+ARCHIVE_CHUNK_SIZE = 64 * 1024
 
 if TYPE_CHECKING:
     from github import Github
@@ -23,6 +28,22 @@ if TYPE_CHECKING:
     from app.engine.backends import FilesystemBackend
 
 
+@contextmanager
+def _github_api_call() -> Iterator[None]:
+    """Pace a PyGithub request through the shared ``github`` limiter."""
+    limiter = get_rate_limiter("github")
+    limiter.acquire_sync()
+    status, headers = None, None
+    try:
+        yield
+        status = 200
+    except GithubException as exc:
+        status, headers = exc.status, exc.headers
+        raise
+    finally:
+        limiter.release(status, headers)
+
+
 class GitHubRepositoryService:
     """Operations for GitHub repositories using an injected PyGithub client."""
 
@@ -35,7 +56,8 @@ class GitHubRepositoryService:
     ) -> None:
         self.client = client
         self.filesystem_backend = filesystem_backend or get_filesystem_backend(
-            base_path=base_path or DEFAULT_ASSETS_DIR
+            backend_type=settings.filesystem.backend_type,
+            base_path=base_path or DEFAULT_ASSETS_DIR,
         )
         self.repo = self._get_repo(repo_name)
         # Per-instance tree cache keyed by commit sha; avoids the
@@ -66,8 +88,9 @@ class GitHubRepositoryService:
             return None
 
         try:
-            default_branch = self.repo.default_branch
-            commit = self.repo.get_commit(default_branch)
+            with _github_api_call():
+                default_branch = self.repo.default_branch
+                commit = self.repo.get_commit(default_branch)
             return self._get_tree_for_commit_sha(commit.sha)
         except GithubException as exc:
             logger.warning(
@@ -86,7 +109,8 @@ class GitHubRepositoryService:
         cached = self._tree_cache.get(commit_sha)
         if cached is not None:
             return cached
-        tree = self.repo.get_git_tree(commit_sha, recursive=True).tree
+        with _github_api_call():
+            tree = self.repo.get_git_tree(commit_sha, recursive=True).tree
         self._tree_cache[commit_sha] = tree
         return tree
 
@@ -105,9 +129,13 @@ class GitHubRepositoryService:
         if self.repo is None:
             return None
 
-        requested_ref = ref or self.repo.default_branch
+        requested_ref = ref
+        if not requested_ref:
+            with _github_api_call():
+                requested_ref = self.repo.default_branch
         try:
-            commit_sha = self.repo.get_commit(requested_ref).sha
+            with _github_api_call():
+                commit_sha = self.repo.get_commit(requested_ref).sha
         except GithubException as exc:
             logger.warning(
                 "Unable to resolve ref '%s' for '%s': %s",
@@ -129,9 +157,9 @@ class GitHubRepositoryService:
         snapshot_relative_dir = Path(owner) / f"{name}@{commit_sha}"
         snapshot_dir = self.filesystem_backend.resolve(snapshot_relative_dir)
 
-        if self.filesystem_backend.is_dir(
-            snapshot_relative_dir
-        ) and self.filesystem_backend.list_dir(snapshot_relative_dir):
+        # One entry is enough to tell; don't list the whole snapshot.
+        existing = self.filesystem_backend.iter_dir(snapshot_relative_dir)
+        if next(existing, None) is not None:
             return SnapshotResult(
                 repo_name=self.repo.full_name,
                 commit_sha=commit_sha,
@@ -142,7 +170,8 @@ class GitHubRepositoryService:
             )
 
         self.filesystem_backend.mkdir(snapshot_relative_dir)
-        archive_url = self.repo.get_archive_link(GITHUB_ARCHIVE_FORMAT, commit_sha)
+        with _github_api_call():
+            archive_url = self.repo.get_archive_link(GITHUB_ARCHIVE_FORMAT, commit_sha)
 
         headers: dict[str, str] = {}
         token = self._installation_token()
@@ -150,11 +179,15 @@ class GitHubRepositoryService:
             headers["Authorization"] = f"token {token}"
 
         try:
-            with httpx.Client(timeout=90.0, follow_redirects=True) as client:
-                response = client.get(archive_url, headers=headers)
+            # Stream the body straight into the extractor so peak memory is
+            # one chunk plus the current member, not the whole archive.
+            client = get_sync_http_client("github")
+            with client.stream(
+                "GET", archive_url, headers=headers, follow_redirects=True
+            ) as response:
                 response.raise_for_status()
-                self.filesystem_backend.extract_tar_bytes(
-                    response.content,
+                self.filesystem_backend.extract_tar_stream(
+                    response.iter_bytes(ARCHIVE_CHUNK_SIZE),
                     destination=snapshot_relative_dir,
                     strip_components=1,
                 )
@@ -174,7 +207,8 @@ class GitHubRepositoryService:
                 commit_sha,
                 exc,
             )
-            # Best-effort cleanup of the empty dir we created above.
+            # Best-effort cleanup of whatever was extracted before the failure,
+            # so the non-empty skip check doesn't treat it as complete.
             try:
                 self.filesystem_backend.delete_dir(
                     snapshot_relative_dir, missing_ok=True
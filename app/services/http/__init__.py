@@ -0,0 +1,25 @@
+from app.services.http.clients import (
+    HttpClientRegistry,
+    aclose_http_clients,
+    circuit_open,
+    get_http_client,
+    get_http_registry,
+    get_rate_limiter,
+    get_sync_http_client,
+    send_request,
+)
+from app.services.http.limits import ProviderLimiter
+from app.services.http.resilience import CircuitOpenError
+
+__all__ = [
+    "CircuitOpenError",
+    "HttpClientRegistry",
+    "ProviderLimiter",
+    "aclose_http_clients",
+    "circuit_open",
+    "get_http_client",
+    "get_http_registry",
+    "get_rate_limiter",
+    "get_sync_http_client",
+    "send_request",
+]
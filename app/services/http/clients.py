@@ -0,0 +1,281 @@
+"""
+Process-wide pooled HTTP clients for outbound tool calls.
+
+Every provider gets one long-lived ``httpx.AsyncClient`` (and, for the few
+synchronous callers, one ``httpx.Client``) with its own connection limits,
+so keep-alive connections and TLS sessions are reused across tool calls and
+runs. The FastAPI lifespan closes them on shutdown.
+
+Connection reuse is measured through httpcore's ``trace`` extension: each
+new TCP connection and TLS handshake is counted against the provider, next
+to the number of requests sent. Stats are exported under
+``collectors.http`` in ``GET /api/v1/metrics``.
+"""
+
+import asyncio
+import importlib.util
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import httpx
+
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.core.settings import HttpConfig, settings
+from app.services.http.limits import (
+    ProviderLimiter,
+    RateLimitedSyncTransport,
+    RateLimitedTransport,
+)
+from app.services.http.resilience import (
+    CircuitBreaker,
+    LatencyWindow,
+    hedged_request,
+)
+
+USER_AGENT = "langgraph-researcher/1.0"
+
+
+@dataclass(slots=True)
+class ClientStats:
+    requests: int = 0
+    connections: int = 0
+    tls_handshakes: int = 0
+    http_versions: Counter[str] = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, object]:
+        reused = max(self.requests - self.connections, 0)
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "tls_handshakes": self.tls_handshakes,
+            "reuse_ratio": reused / self.requests if self.requests else 0.0,
+            "http_versions": dict(self.http_versions),
+        }
+
+
+class HttpClientRegistry:
+    """Lazily created HTTP clients keyed by provider name."""
+
+    def __init__(self, config: HttpConfig) -> None:
+        self.config = config
+        self.http2 = config.http2 and importlib.util.find_spec("h2") is not None
+        if config.http2 and not self.http2:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using 1.1")
+        self._lock = threading.Lock()
+        # Async clients remember the loop they were created on: pooled
+        # connections can't be shared across event loops.
+        self._clients: dict[str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]]
+        self._clients = {}
+        self._sync_clients: dict[str, httpx.Client] = {}
+        self._stats: dict[str, ClientStats] = {}
+        self._limiters: dict[str, ProviderLimiter] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._latencies: dict[str, LatencyWindow] = {}
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(name)
+            if entry is not None and entry[0] is loop and not entry[1].is_closed:
+                return entry[1]
+            stats = self._stats.setdefault(name, ClientStats())
+
+            async def on_request(request: httpx.Request) -> None:
+                stats.requests += 1
+
+                async def trace(event: str, info: dict) -> None:
+                    _record_trace(stats, event)
+
+                request.extensions["trace"] = trace
+
+            async def on_response(response: httpx.Response) -> None:
+                stats.http_versions[response.http_version] += 1
+
+            transport = RateLimitedTransport(
+                httpx.AsyncHTTPTransport(http2=self.http2, limits=self._limits()),
+                self._limiter(name),
+            )
+            client = httpx.AsyncClient(
+                transport=transport,
+                event_hooks={"request": [on_request], "response": [on_response]},
+                **self._client_kwargs(name),
+            )
+            self._clients[name] = (loop, client)
+            return client
+
+    def get_sync(self, name: str) -> httpx.Client:
+        with self._lock:
+            client = self._sync_clients.get(name)
+            if client is not None and not client.is_closed:
+                return client
+            stats = self._stats.setdefault(name, ClientStats())
+
+            def on_request(request: httpx.Request) -> None:
+                stats.requests += 1
+                request.extensions["trace"] = lambda event, info: _record_trace(
+                    stats, event
+                )
+
+            def on_response(response: httpx.Response) -> None:
+                stats.http_versions[response.http_version] += 1
+
+            transport = RateLimitedSyncTransport(
+                httpx.HTTPTransport(http2=self.http2, limits=self._limits()),
+                self._limiter(name),
+            )
+            client = httpx.Client(
+                transport=transport,
+                event_hooks={"request": [on_request], "response": [on_response]},
+                **self._client_kwargs(name),
+            )
+            self._sync_clients[name] = client
+            return client
+
+    async def request(
+        self, name: str, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send through provider ``name``'s client, its breaker and hedging.
+
+        Only use it for idempotent calls: a hedged request may reach the
+        provider twice.
+        """
+        client = self.get(name)
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(
+                    name,
+                    failure_threshold=self.config.breaker_failure_threshold,
+                    reset_s=self.config.breaker_reset_s,
+                )
+            latency = self._latencies.get(name)
+            if latency is None:
+                latency = self._latencies[name] = LatencyWindow(
+                    percentile=self.config.hedge_percentile,
+                    min_samples=self.config.hedge_min_samples,
+                    initial_delay_s=self.config.hedge_initial_delay_s,
+                )
+        return await hedged_request(
+            name,
+            lambda: client.request(method, url, **kwargs),
+            breaker,
+            latency,
+            hedge=name in self.config.hedge_providers,
+        )
+
+    def circuit_open(self, name: str) -> bool:
+        with self._lock:
+            breaker = self._breakers.get(name)
+        return breaker is not None and breaker.is_open
+
+    def limiter(self, name: str) -> ProviderLimiter:
+        with self._lock:
+            return self._limiter(name)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            snapshot: dict[str, dict[str, object]] = {
+                name: stats.as_dict() for name, stats in self._stats.items()
+            }
+            limiters = dict(self._limiters)
+            breakers = dict(self._breakers)
+            latencies = dict(self._latencies)
+        for name, limiter in limiters.items():
+            snapshot.setdefault(name, {})["limiter"] = limiter.stats()
+        for name, breaker in breakers.items():
+            snapshot.setdefault(name, {})["circuit"] = breaker.stats()
+        for name, latency in latencies.items():
+            snapshot.setdefault(name, {})["hedging"] = latency.stats()
+        return snapshot
+
+    async def aclose(self) -> None:
+        with self._lock:
+            clients = [client for _, client in self._clients.values()]
+            sync_clients = list(self._sync_clients.values())
+            self._clients.clear()
+            self._sync_clients.clear()
+        for client in clients:
+            await client.aclose()
+        for client in sync_clients:
+            client.close()
+
+    def _limiter(self, name: str) -> ProviderLimiter:
+        # Called with ``self._lock`` held.
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = ProviderLimiter(
+                name,
+                requests_per_s=self.config.requests_per_s.get(
+                    name, self.config.default_requests_per_s
+                ),
+                max_concurrency=self.config.max_concurrency,
+            )
+            self._limiters[name] = limiter
+        return limiter
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections_per_host,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry_s,
+        )
+
+    def _client_kwargs(self, name: str) -> dict[str, object]:
+        config = self.config
+        return {
+            "timeout": httpx.Timeout(
+                config.timeouts_s.get(name, config.timeout_s),
+                connect=config.connect_timeout_s,
+            ),
+            "headers": {"User-Agent": USER_AGENT},
+        }
+
+
+def _record_trace(stats: ClientStats, event: str) -> None:
+    if event == "connection.connect_tcp.complete":
+        stats.connections += 1
+    elif event == "connection.start_tls.complete":
+        stats.tls_handshakes += 1
+
+
+@lru_cache(maxsize=1)
+def get_http_registry() -> HttpClientRegistry:
+    registry = HttpClientRegistry(settings.http)
+    metrics.register_collector("http", registry.stats)
+    return registry
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Shared async client for provider ``name``; call from the event loop."""
+    return get_http_registry().get(name)
+
+
+def get_sync_http_client(name: str) -> httpx.Client:
+    """Shared blocking client for provider ``name``, for synchronous callers."""
+    return get_http_registry().get_sync(name)
+
+
+async def send_request(name: str, method: str, url: str, **kwargs) -> httpx.Response:
+    """Idempotent request to provider ``name`` with hedging and circuit breaking.
+
+    Raises ``CircuitOpenError`` (an ``httpx.HTTPError``) without sending
+    anything while the provider's circuit is open.
+    """
+    return await get_http_registry().request(name, method, url, **kwargs)
+
+
+def circuit_open(name: str) -> bool:
+    return get_http_registry().circuit_open(name)
+
+
+def get_rate_limiter(name: str) -> ProviderLimiter:
+    """Shared limiter for provider ``name``, for calls not made through httpx."""
+    return get_http_registry().limiter(name)
+
+
+async def aclose_http_clients() -> None:
+    """Close every pooled client. Called from the FastAPI lifespan."""
+    await get_http_registry().aclose()
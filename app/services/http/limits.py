@@ -0,0 +1,212 @@
+"""
+Per-provider rate limiting with adaptive concurrency.
+
+Every provider has one ``ProviderLimiter`` shared by its async and sync
+clients (and by PyGithub calls). A request needs a token from a bucket
+refilled at ``requests_per_s`` and a free concurrency slot. The slot limit
+follows AIMD: it grows by one per ``limit`` successful responses up to
+``max_concurrency`` and halves on every 429/503.
+
+Throttling responses also pause the provider: ``Retry-After`` (seconds or
+an HTTP date) or an exhausted ``X-RateLimit-Remaining`` with its
+``X-RateLimit-Reset`` blocks new requests until the window reopens, so
+concurrent workflows back off together instead of stampeding the API.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from app.core.metrics import metrics
+
+THROTTLE_STATUSES = frozenset({429, 503})
+# How often a request waiting only for a concurrency slot re-checks.
+SLOT_POLL_S = 0.02
+# ``X-RateLimit-Reset`` values above this are epoch timestamps, not deltas.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class ProviderLimiter:
+    """Token bucket plus AIMD concurrency limit for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_s: float,
+        max_concurrency: int,
+        burst: float | None = None,
+    ) -> None:
+        self.name = name
+        self.rate = requests_per_s
+        self.burst = burst if burst is not None else max(1.0, requests_per_s)
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.throttled = 0
+        self.waits = 0
+        self.wait_s = 0.0
+
+    async def acquire(self) -> None:
+        delay = self._reserve()
+        if delay <= 0:
+            return
+        started = time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._reserve()
+        self._record_wait(time.monotonic() - started)
+
+    def acquire_sync(self) -> None:
+        delay = self._reserve()
+        if delay <= 0:
+            return
+        started = time.monotonic()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._reserve()
+        self._record_wait(time.monotonic() - started)
+
+    def release(
+        self,
+        status_code: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Free the slot and adapt to the response; ``None`` if none arrived."""
+        pause_s = _pause_from_headers(status_code, headers or {})
+        with self._lock:
+            self.in_flight -= 1
+            if pause_s:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + pause_s)
+            if status_code in THROTTLE_STATUSES:
+                self.throttled += 1
+                self.limit = max(1.0, self.limit / 2)
+            elif status_code is not None and status_code < 500:
+                self.limit = min(
+                    float(self.max_concurrency), self.limit + 1 / self.limit
+                )
+        if status_code in THROTTLE_STATUSES:
+            metrics.inc(f"ratelimit.{self.name}.throttled")
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "concurrency_limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "tokens": self._tokens,
+                "throttled": self.throttled,
+                "waits": self.waits,
+                "wait_s": self.wait_s,
+                "blocked_for_s": max(0.0, self.blocked_until - time.monotonic()),
+            }
+
+    def _reserve(self) -> float:
+        """Take a token and a slot, or return how long to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            if self.blocked_until > now:
+                return self.blocked_until - now
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled_at) * self.rate
+            )
+            self._refilled_at = now
+            if self.in_flight >= int(self.limit):
+                return SLOT_POLL_S
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            self.in_flight += 1
+            return 0.0
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_s += waited
+        metrics.observe(f"ratelimit.{self.name}.wait_s", waited)
+
+
+def _pause_from_headers(status_code: int | None, headers: Mapping[str, str]) -> float:
+    headers = {key.lower(): value for key, value in headers.items()}
+    if status_code in THROTTLE_STATUSES:
+        retry_after = _retry_after_s(headers.get("retry-after"))
+        if retry_after is not None:
+            return retry_after
+    # Brave sends ``1, 15000`` (per-second and monthly windows); the
+    # first window is the one that matters for pacing.
+    remaining = _first_number(headers.get("x-ratelimit-remaining"))
+    reset = _first_number(headers.get("x-ratelimit-reset"))
+    if remaining is not None and remaining <= 0 and reset is not None:
+        return max(0.0, reset - time.time()) if reset > _EPOCH_THRESHOLD else reset
+    return 0.0
+
+
+def _retry_after_s(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _first_number(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value.split(",")[0])
+    except ValueError:
+        return None
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: ProviderLimiter
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.limiter.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            self.limiter.release()
+            raise
+        # The slot is freed once headers arrive; streamed bodies don't hold it.
+        self.limiter.release(response.status_code, response.headers)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RateLimitedSyncTransport(httpx.BaseTransport):
+    def __init__(
+        self, transport: httpx.BaseTransport, limiter: ProviderLimiter
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.limiter.acquire_sync()
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            self.limiter.release()
+            raise
+        self.limiter.release(response.status_code, response.headers)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
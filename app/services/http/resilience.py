@@ -0,0 +1,215 @@
+"""
+Hedged requests and circuit breaking for provider calls.
+
+``hedged_request`` sends a second, identical request when the first one is
+slower than the provider's recent ``hedge_percentile`` latency and returns
+whichever answers first; the loser is cancelled. A slow outlier then costs
+roughly the percentile latency instead of the full timeout, for one extra
+request in ~``1 - percentile`` of calls.
+
+``CircuitBreaker`` opens after ``failure_threshold`` consecutive failures
+(transport errors and 5xx responses) and rejects calls with
+``CircuitOpenError`` until ``reset_s`` has passed. It then lets a single
+probe through: success closes the circuit, failure re-opens it. Callers
+catch the error, an ``httpx.HTTPError``, to fail fast or fall back to
+another provider.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+
+import httpx
+
+from app.core.metrics import metrics
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_s: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_s = reset_s
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self.opens = 0
+        self.rejected = 0
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.state is CircuitState.OPEN and not self._reset_due()
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self.state is CircuitState.OPEN and self._reset_due():
+                self.state = CircuitState.HALF_OPEN
+            if self.state is CircuitState.CLOSED:
+                return
+            if self.state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+        metrics.inc(f"circuit.{self.name}.rejected")
+        raise CircuitOpenError(f"{self.name} circuit is open; not calling it")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if (
+                self.state is CircuitState.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                if self.state is not CircuitState.OPEN:
+                    self.opens += 1
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+                opened = True
+            else:
+                opened = False
+        if opened:
+            metrics.inc(f"circuit.{self.name}.opened")
+
+    def abandon(self) -> None:
+        """The call was cancelled before it could succeed or fail."""
+        with self._lock:
+            self._probing = False
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "state": str(self.state),
+                "consecutive_failures": self.failures,
+                "opens": self.opens,
+                "rejected": self.rejected,
+            }
+
+    def _reset_due(self) -> bool:
+        return time.monotonic() - self.opened_at >= self.reset_s
+
+
+class LatencyWindow:
+    """Recent successful-response latencies and the derived hedge delay."""
+
+    def __init__(
+        self,
+        percentile: float,
+        min_samples: int,
+        initial_delay_s: float,
+        size: int = 256,
+    ) -> None:
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay_s = initial_delay_s
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def observe(self, latency_s: float) -> None:
+        with self._lock:
+            self._samples.append(latency_s)
+
+    def hedge_delay(self) -> float:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.initial_delay_s
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "hedge_delay_s": self.hedge_delay(),
+            "samples": len(self._samples),
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+Send = Callable[[], Awaitable[httpx.Response]]
+
+
+async def hedged_request(
+    name: str,
+    send: Send,
+    breaker: CircuitBreaker,
+    latency: LatencyWindow,
+    hedge: bool = True,
+) -> httpx.Response:
+    """Run ``send`` under ``breaker``, hedging it once after the delay."""
+    breaker.before_request()
+    started = time.perf_counter()
+    attempts = [asyncio.ensure_future(send())]
+    try:
+        response = await _first_response(name, send, attempts, latency, hedge)
+    except asyncio.CancelledError:
+        breaker.abandon()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+    finally:
+        for attempt in attempts:
+            if not attempt.done():
+                attempt.cancel()
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+        latency.observe(time.perf_counter() - started)
+    return response
+
+
+async def _first_response(
+    name: str,
+    send: Send,
+    attempts: list[asyncio.Future],
+    latency: LatencyWindow,
+    hedge: bool,
+) -> httpx.Response:
+    if hedge:
+        done, _ = await asyncio.wait(attempts, timeout=latency.hedge_delay())
+        if not done:
+            latency.hedged += 1
+            metrics.inc(f"hedging.{name}.hedged")
+            attempts.append(asyncio.ensure_future(send()))
+    pending = set(attempts)
+    error: BaseException | None = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for attempt in done:
+            if attempt.exception() is not None:
+                error = attempt.exception()
+                continue
+            if attempt is not attempts[0]:
+                latency.hedge_wins += 1
+                metrics.inc(f"hedging.{name}.won")
+            # Both may finish in the same tick; close the duplicate.
+            for other in done - {attempt}:
+                if other.exception() is None:
+                    await other.result().aclose()
+            return attempt.result()
+    assert error is not None
+    raise error
@@ -0,0 +1,42 @@
+"""Measure per-request workflow setup time with and without the graph cache.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/bench_workflow_setup.py [iterations]
+"""
+
+import sys
+import time
+
+from langgraph.checkpoint.memory import MemorySaver
+
+import app.engine.graphs  # noqa: F401
+from app.engine.registry import get_workflow, invalidate_workflow_cache
+
+
+def bench(name: str, iterations: int, cached: bool) -> float:
+    checkpointer = MemorySaver()
+    invalidate_workflow_cache()
+    get_workflow(name, checkpointer)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if not cached:
+            invalidate_workflow_cache(name)
+        get_workflow(name, checkpointer)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for name in ("research", "researcher"):
+        cold = bench(name, iterations, cached=False)
+        warm = bench(name, iterations, cached=True)
+        print(
+            f"{name:<12} rebuild: {cold * 1e3:8.3f} ms/request  "
+            f"cached: {warm * 1e6:8.3f} us/request  "
+            f"speedup: {cold / warm:,.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
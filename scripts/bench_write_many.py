@@ -0,0 +1,53 @@
+"""Compare writing vault notes one at a time against one ``write_many`` batch.
+
+``loop`` is plain ``write_text`` per note (not crash-safe); ``loop+atomic``
+is the per-note tmp-file-and-move pattern used elsewhere in the repo, which
+gives each file the same guarantee ``write_many`` does.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/bench_write_many.py [notes]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+
+
+def _notes(count: int) -> list[tuple[Path, str]]:
+    body = "# Note\n\n" + "Atomic idea with a [[link]] to another note.\n" * 20
+    return [(Path("vault") / f"note-{index:05d}.md", body) for index in range(count)]
+
+
+def bench(count: int, mode: str) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = InProcessFilesystemBackend(base_path=tmp)
+        notes = _notes(count)
+        start = time.perf_counter()
+        if mode == "loop":
+            for path, content in notes:
+                backend.write_text(path, content)
+        elif mode == "loop+atomic":
+            for path, content in notes:
+                tmp = path.with_name(f".{path.name}.tmp")
+                backend.write_text(tmp, content)
+                backend.move(tmp, path)
+        else:
+            backend.write_many(notes, fsync=mode == "batch+fsync")
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for mode in ("loop", "loop+atomic", "batch", "batch+fsync"):
+        elapsed = bench(count, mode)
+        print(
+            f"{mode:<12} {count} notes: {elapsed * 1e3:8.1f} ms  "
+            f"({elapsed / count * 1e6:7.1f} us/note)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -29,3 +29,122 @@ def test_unknown_enum_value_returns_422() -> None:
         json={"topic": "enum-validation"},
     )
     assert resp.status_code == 422
+
+
+def test_submit_unregistered_workflow_returns_404() -> None:
+    client = TestClient(app)
+    resp = client.post(
+        "/api/v1/workflows/jobs/persist",
+        json={"topic": "routing-test"},
+    )
+    assert resp.status_code == 404
+
+
+def test_unknown_job_returns_404() -> None:
+    client = TestClient(app)
+
+    assert client.get("/api/v1/workflows/jobs/missing").status_code == 404
+    assert client.get("/api/v1/workflows/jobs/missing/result").status_code == 404
+    assert client.post("/api/v1/workflows/jobs/missing/cancel").status_code == 404
+    assert client.post("/api/v1/workflows/jobs/missing/resume").status_code == 404
+    assert (
+        client.post("/api/v1/workflows/jobs/missing/rerun/summarizer").status_code
+        == 404
+    )
+
+
+def test_stream_endpoint_emits_server_sent_events(monkeypatch) -> None:
+    async def fake_stream_execute(workflow_name, request):
+        yield {"event": "run", "data": {"thread_id": "t-1"}}
+        yield {"event": "token", "data": {"node": "researcher", "text": "hi"}}
+        yield {"event": "done", "data": {"thread_id": "t-1", "state": {}}}
+
+    monkeypatch.setattr("app.api.v1.workflows.stream_execute", fake_stream_execute)
+    client = TestClient(app)
+    resp = client.post(
+        "/api/v1/workflows/stream/research",
+        json={"topic": "sse-test"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text.split("\n\n")[:3] == [
+        'event: run\ndata: {"thread_id":"t-1"}',
+        'event: token\ndata: {"node":"researcher","text":"hi"}',
+        'event: done\ndata: {"thread_id":"t-1","state":{}}',
+    ]
+
+
+def test_overloaded_workflow_returns_429_with_retry_after(monkeypatch) -> None:
+    from app.engine.admission import AdmissionController
+
+    controller = AdmissionController(max_in_flight=0, max_queue=0, retry_after_s=3)
+    monkeypatch.setattr(
+        "app.engine.executor.get_admission_controller", lambda: controller
+    )
+    client = TestClient(app)
+    resp = client.post(
+        "/api/v1/workflows/run/research",
+        json={"topic": "overload-test"},
+    )
+
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == "3"
+
+
+def test_unregistered_workflow_does_not_take_an_admission_slot(monkeypatch) -> None:
+    from app.engine.admission import AdmissionController
+
+    controller = AdmissionController(max_in_flight=0, max_queue=0)
+    monkeypatch.setattr(
+        "app.engine.executor.get_admission_controller", lambda: controller
+    )
+    client = TestClient(app)
+    resp = client.post(
+        "/api/v1/workflows/run/persist",
+        json={"topic": "routing-test"},
+    )
+
+    assert resp.status_code == 404
+
+
+def test_stream_releases_slot_when_response_never_starts(monkeypatch) -> None:
+    import asyncio
+
+    from app.api.v1 import workflows
+    from app.engine.admission import AdmissionController
+    from app.engine.nodes.types import Workflow
+    from app.engine.schema import ResearchRequest
+
+    controller = AdmissionController(max_in_flight=1, max_queue=0)
+    monkeypatch.setattr(
+        "app.api.v1.workflows.get_admission_controller", lambda: controller
+    )
+    started: list[bool] = []
+
+    async def fake_stream_execute(workflow_name, request):
+        started.append(True)
+        yield {"event": "done", "data": {}}
+
+    monkeypatch.setattr("app.api.v1.workflows.stream_execute", fake_stream_execute)
+
+    async def disconnected(message) -> None:
+        raise OSError("client went away")
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def scenario() -> None:
+        response = await workflows.stream_workflow(
+            Workflow.RESEARCH, ResearchRequest(topic="sse-leak")
+        )
+        assert controller.stats()["research"]["in_flight"] == 1
+        try:
+            await response({"type": "http"}, receive, disconnected)
+        except OSError:
+            pass
+
+    asyncio.run(scenario())
+
+    assert started == []
+    assert controller.stats()["research"]["in_flight"] == 0
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from app.engine.backends.blobstore import BlobStoreFilesystemBackend
+from app.engine.backends.errors import InvalidPathError, PathEscapeError
+from app.engine.backends.factory import FilesystemBackendType, get_filesystem_backend
+
+
+def _build_tar(files: dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(name=f"root-folder/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_identical_content_is_stored_once(tmp_path: Path) -> None:
+    backend = BlobStoreFilesystemBackend(base_path=tmp_path)
+
+    backend.write_text("a/one.md", "same")
+    backend.write_text("b/two.md", "same")
+    backend.write_many({"c/three.md": "same", "c/four.md": "other"})
+
+    assert backend.read_text("b/two.md") == "same"
+    assert backend.stat("a/one.md").st_ino == backend.stat("c/three.md").st_ino
+    assert backend.stat("a/one.md").st_nlink == 4
+    stats = backend.stats()
+    assert stats["blobs_written"] == 2
+    assert stats["dedup_hits"] == 2
+    assert stats["bytes_deduplicated"] == 8
+
+
+def test_rewrites_and_open_write_never_touch_shared_blobs(tmp_path: Path) -> None:
+    backend = BlobStoreFilesystemBackend(base_path=tmp_path)
+    backend.write_text("a.md", "shared")
+    backend.write_text("b.md", "shared")
+
+    backend.write_text("a.md", "changed")
+    with backend.open_write("b.md", "a") as fh:
+        fh.write("!")
+
+    assert backend.read_text("a.md") == "changed"
+    assert backend.read_text("b.md") == "shared!"
+
+    backend.write_text("c.md", "shared")
+    backend.write_text("d.md", "shared")
+    with backend.open_write("c.md") as fh:
+        fh.write("truncated")
+    assert backend.read_text("d.md") == "shared"
+
+
+def test_repeated_snapshots_only_store_changed_files(tmp_path: Path) -> None:
+    backend = BlobStoreFilesystemBackend(base_path=tmp_path)
+    files = {f"src/mod{i}.py": f"print({i})" for i in range(5)}
+
+    backend.extract_tar_bytes(_build_tar(files), "owner/repo@sha-1")
+    backend.extract_tar_bytes(
+        _build_tar({**files, "src/mod0.py": "print('new')"}), "owner/repo@sha-2"
+    )
+
+    assert backend.read_text("owner/repo@sha-2/src/mod0.py") == "print('new')"
+    assert backend.read_text("owner/repo@sha-2/src/mod1.py") == "print(1)"
+    stats = backend.stats()
+    assert stats["blobs_written"] == 6
+    assert stats["dedup_hits"] == 4
+
+
+def test_collect_garbage_removes_unreferenced_blobs(tmp_path: Path) -> None:
+    backend = BlobStoreFilesystemBackend(base_path=tmp_path)
+    backend.write_text("a.md", "keep")
+    backend.write_text("b.md", "drop")
+    backend.delete_file("b.md")
+
+    assert backend.collect_garbage() == len("drop")
+    assert backend.read_text("a.md") == "keep"
+    assert backend.collect_garbage() == 0
+
+
+def test_sandbox_and_blob_dir_are_not_addressable(tmp_path: Path) -> None:
+    backend = BlobStoreFilesystemBackend(base_path=tmp_path / "root")
+
+    with pytest.raises(PathEscapeError):
+        backend.write_text("../outside.md", "x")
+    with pytest.raises(InvalidPathError):
+        backend.list_dir(".blobs")
+
+
+def test_registered_in_backend_factories(tmp_path: Path) -> None:
+    backend = get_filesystem_backend(
+        backend_type=FilesystemBackendType.BLOB_STORE, base_path=tmp_path
+    )
+    assert isinstance(backend, BlobStoreFilesystemBackend)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.engine.backends.caching import CachingFilesystemBackend
+from app.engine.backends.errors import PathEscapeError
+from app.engine.backends.factory import FilesystemBackendType, get_filesystem_backend
+
+
+def test_repeated_reads_are_served_from_cache(tmp_path: Path) -> None:
+    backend = CachingFilesystemBackend(base_path=tmp_path)
+    backend.write_text("notes/a.md", "hello")
+
+    assert backend.read_text("notes/a.md") == "hello"
+    assert backend.read_text("notes/a.md") == "hello"
+    assert backend.read_bytes("notes/a.md") == b"hello"
+
+    stats = backend.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 5
+    assert stats["resolve_hits"] == 2
+
+
+def test_writes_through_the_backend_invalidate(tmp_path: Path) -> None:
+    backend = CachingFilesystemBackend(base_path=tmp_path)
+    backend.write_text("a.md", "one")
+    assert backend.read_text("a.md") == "one"
+
+    backend.write_text("a.md", "two")
+    assert backend.read_text("a.md") == "two"
+
+    with backend.open_write("a.md", "ab", encoding=None) as fh:
+        fh.write(b"!")
+    assert backend.read_text("a.md") == "two!"
+
+    backend.move("a.md", "b.md")
+    with pytest.raises(FileNotFoundError):
+        backend.read_text("a.md")
+    assert backend.read_text("b.md") == "two!"
+
+    backend.delete_file("b.md")
+    with pytest.raises(FileNotFoundError):
+        backend.read_text("b.md")
+    assert backend.stats()["invalidations"] >= 3
+
+
+def test_external_changes_are_detected_by_stat(tmp_path: Path) -> None:
+    backend = CachingFilesystemBackend(base_path=tmp_path)
+    backend.write_text("a.md", "before")
+    assert backend.read_text("a.md") == "before"
+
+    target = tmp_path / "a.md"
+    target.write_text("after!", encoding="utf-8")
+    # Same size, so only the bumped mtime gives the edit away.
+    os.utime(target, ns=(0, target.stat().st_mtime_ns + 1_000_000))
+
+    assert backend.read_text("a.md") == "after!"
+    assert backend.stats()["hits"] == 0
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path: Path) -> None:
+    backend = CachingFilesystemBackend(base_path=tmp_path, max_bytes=80)
+    for index in range(9):
+        backend.write_bytes(f"{index}.bin", b"x" * 10)
+    backend.write_bytes("big.bin", b"x" * 11)
+
+    for index in range(9):
+        backend.read_bytes(f"{index}.bin")
+    backend.read_bytes("big.bin")
+
+    stats = backend.stats()
+    # ``big.bin`` is over the per-entry cap and ``0.bin`` was evicted first.
+    assert stats["bytes"] == 80
+    assert stats["entries"] == 8
+    backend.read_bytes("8.bin")
+    backend.read_bytes("0.bin")
+    assert backend.stats()["hits"] == 1
+
+
+def test_delete_dir_drops_cached_children(tmp_path: Path) -> None:
+    backend = CachingFilesystemBackend(base_path=tmp_path)
+    backend.write_text("dir/a.md", "x")
+    backend.read_text("dir/a.md")
+
+    backend.delete_dir("dir")
+
+    assert backend.stats()["entries"] == 0
+    with pytest.raises(FileNotFoundError):
+        backend.read_text("dir/a.md")
+
+
+def test_sandbox_is_still_enforced(tmp_path: Path) -> None:
+    backend = CachingFilesystemBackend(base_path=tmp_path / "root")
+    with pytest.raises(PathEscapeError):
+        backend.read_text("../outside.md")
+
+
+def test_registered_in_backend_factories(tmp_path: Path) -> None:
+    backend = get_filesystem_backend(
+        backend_type=FilesystemBackendType.CACHING, base_path=tmp_path
+    )
+    assert isinstance(backend, CachingFilesystemBackend)
@@ -63,3 +63,97 @@ def test_extract_tar_bytes_with_strip_components(tmp_path: Path) -> None:
     backend.extract_tar_bytes(archive, destination="snapshots/repo", strip_components=1)
 
     assert backend.read_text("snapshots/repo/src/main.py") == "print('ok')"
+
+
+def test_extract_tar_stream_reads_small_chunks(tmp_path: Path) -> None:
+    backend = InProcessFilesystemBackend(base_path=tmp_path)
+    archive = _build_tar_with_rooted_file("root-folder/src/main.py", "print('ok')")
+    chunks = (archive[i : i + 7] for i in range(0, len(archive), 7))
+
+    backend.extract_tar_stream(chunks, destination="snapshots/repo")
+
+    assert backend.read_text("snapshots/repo/src/main.py") == "print('ok')"
+
+
+def test_extract_tar_stream_rejects_escaping_members(tmp_path: Path) -> None:
+    backend = InProcessFilesystemBackend(base_path=tmp_path / "root")
+    archive = _build_tar_with_rooted_file("root-folder/../../evil.py", "x")
+
+    with pytest.raises(PathEscapeError):
+        backend.extract_tar_stream([archive], destination="snapshots/repo")
+
+    assert not (tmp_path / "root" / "evil.py").exists()
+
+
+def test_write_many_writes_every_file(tmp_path: Path) -> None:
+    backend = InProcessFilesystemBackend(base_path=tmp_path)
+    backend.write_text("vault/a.md", "old")
+
+    written = backend.write_many(
+        {"vault/a.md": "new", "vault/b.md": "b", "vault/sub/c.bin": b"\x00c"},
+        fsync=True,
+    )
+
+    assert written == [
+        backend.resolve("vault/a.md"),
+        backend.resolve("vault/b.md"),
+        backend.resolve("vault/sub/c.bin"),
+    ]
+    assert backend.read_text("vault/a.md") == "new"
+    assert backend.read_text("vault/b.md") == "b"
+    assert backend.read_bytes("vault/sub/c.bin") == b"\x00c"
+    assert sorted(p.name for p in backend.list_dir("vault")) == ["a.md", "b.md", "sub"]
+
+
+def test_write_many_validates_all_paths_before_writing(tmp_path: Path) -> None:
+    backend = InProcessFilesystemBackend(base_path=tmp_path / "root")
+
+    with pytest.raises(PathEscapeError):
+        backend.write_many([("vault/a.md", "a"), ("../outside.md", "x")])
+
+    assert not backend.exists("vault")
+
+
+def test_iter_dir_walk_and_glob(tmp_path: Path) -> None:
+    backend = InProcessFilesystemBackend(base_path=tmp_path)
+    for path in ("a.md", "x/b.md", "x/y/c.md", "x/y/d.txt"):
+        backend.write_text(path, "1")
+
+    assert sorted(e.name for e in backend.iter_dir(".")) == ["a.md", "x"]
+    assert list(backend.iter_dir("missing")) == []
+    assert sorted(e.name for e in backend.walk(".", lambda e: e.is_file())) == [
+        "a.md",
+        "b.md",
+        "c.md",
+        "d.txt",
+    ]
+    assert sorted(
+        e.name for e in backend.walk(".", descend=lambda e: e.name != "y")
+    ) == ["a.md", "b.md", "x", "y"]
+    assert [e.name for e in backend.glob(".", "*.md")] == ["a.md"]
+    assert sorted(e.name for e in backend.glob(".", "**/*.md")) == [
+        "a.md",
+        "b.md",
+        "c.md",
+    ]
+    assert sorted(e.name for e in backend.glob("x", "*/*.txt")) == ["d.txt"]
+
+
+def test_walk_stops_early_and_stays_in_sandbox(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.md").write_text("x", encoding="utf-8")
+    backend = InProcessFilesystemBackend(base_path=root)
+    backend.write_text("notes/a.md", "1")
+    (root / "notes" / "link").symlink_to(outside, target_is_directory=True)
+
+    names = [e.name for e in backend.walk(".")]
+    assert "secret.md" not in names
+
+    walker = backend.walk(".")
+    assert next(walker).name == "notes"
+    walker.close()
+
+    with pytest.raises(PathEscapeError):
+        next(backend.walk("../outside"))
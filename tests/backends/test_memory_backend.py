@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import io
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from app.engine.backends.errors import PathEscapeError
+from app.engine.backends.factory import FilesystemBackendType, get_filesystem_backend
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.backends.memory import MemoryFilesystemBackend
+
+
+def _build_tar(name: str, content: str) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        data = content.encode("utf-8")
+        info = tarfile.TarInfo(name=name)
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_files_live_only_in_memory(tmp_path: Path) -> None:
+    backend = MemoryFilesystemBackend(base_path=tmp_path / "root")
+
+    backend.write_text("notes/a.md", "hello")
+    backend.write_bytes("notes/data.bin", b"xyz")
+
+    assert backend.read_text("notes/a.md") == "hello"
+    assert backend.read_bytes(backend.resolve("notes/data.bin")) == b"xyz"
+    assert [p.name for p in backend.list_dir("notes")] == ["a.md", "data.bin"]
+    assert backend.is_dir("notes") and backend.is_file("notes/a.md")
+    assert backend.stat("notes/a.md").st_size == 5
+    assert sorted(e.name for e in backend.glob(".", "**/*.md")) == ["a.md"]
+    assert not (tmp_path / "root").exists()
+
+
+def test_open_write_modes_match_the_disk_backend(tmp_path: Path) -> None:
+    backend = MemoryFilesystemBackend(base_path=tmp_path)
+
+    with backend.open_write("log.bin", "ab", encoding=None) as fh:
+        fh.write(b"abc")
+    with backend.open_write("log.bin", "ab", encoding=None) as fh:
+        fh.truncate(2)
+        fh.write(b"Z")
+    with backend.open_write("notes.txt") as fh:
+        fh.write("line\n")
+    with backend.open_read("notes.txt") as fh:
+        text = fh.read()
+
+    assert backend.read_bytes("log.bin") == b"abZ"
+    assert text == "line\n"
+    with pytest.raises(FileExistsError):
+        backend.open_write("log.bin", "xb", encoding=None)
+
+
+def test_move_delete_and_tar_extraction(tmp_path: Path) -> None:
+    backend = MemoryFilesystemBackend(base_path=tmp_path)
+    backend.write_text("a/file.txt", "content")
+
+    assert backend.move("a/file.txt", "b/file.txt") == backend.resolve("b/file.txt")
+    assert not backend.exists("a/file.txt")
+    backend.move("b", "c")
+    assert backend.read_text("c/file.txt") == "content"
+    backend.delete_dir("c")
+    assert not backend.exists("c")
+
+    archive = _build_tar("root-folder/src/main.py", "print('ok')")
+    backend.extract_tar_bytes(archive, destination="snapshots/repo")
+    assert backend.read_text("snapshots/repo/src/main.py") == "print('ok')"
+
+
+def test_sandbox_is_enforced(tmp_path: Path) -> None:
+    backend = MemoryFilesystemBackend(base_path=tmp_path / "root")
+
+    with pytest.raises(PathEscapeError):
+        backend.write_text("../outside.md", "x")
+    with pytest.raises(PathEscapeError):
+        backend.extract_tar_bytes(
+            _build_tar("root-folder/../../evil.py", "x"), destination="snap"
+        )
+
+
+def test_write_behind_flushes_to_disk(tmp_path: Path) -> None:
+    disk = InProcessFilesystemBackend(base_path=tmp_path)
+    disk.write_text("old/stale.md", "stale")
+    backend = MemoryFilesystemBackend(flush_to=disk)
+
+    backend.write_text("vault/a.md", "a")
+    backend.write_text("vault/b.md", "b")
+    backend.delete_file("vault/b.md")
+    backend.mkdir("old")
+    backend.delete_dir("old")
+    assert not disk.exists("vault/a.md")
+
+    assert backend.flush() == 1
+    assert disk.read_text("vault/a.md") == "a"
+    assert not disk.exists("vault/b.md")
+    assert not disk.exists("old")
+
+    backend.move("vault/a.md", "vault/c.md")
+    backend.close()
+    assert not disk.exists("vault/a.md")
+    assert disk.read_text("vault/c.md") == "a"
+    assert backend.stats()["dirty"] == 0
+
+
+def test_registered_in_backend_factories(tmp_path: Path) -> None:
+    backend = get_filesystem_backend(
+        backend_type=FilesystemBackendType.MEMORY, base_path=tmp_path
+    )
+    assert isinstance(backend, MemoryFilesystemBackend)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.engine.backends import (
+    AsyncFilesystemBackend,
+    FilesystemBackendType,
+    close_async_filesystem_backends,
+    get_async_filesystem_backend,
+    get_filesystem_backend,
+)
+from app.engine.backends.errors import PathEscapeError
+from app.engine.backends.threaded import AsyncInProcessFilesystemBackend
+
+
+@pytest.mark.asyncio
+async def test_operations_run_off_the_event_loop(tmp_path: Path) -> None:
+    backend = AsyncInProcessFilesystemBackend(base_path=tmp_path, max_workers=2)
+    loop_thread = threading.get_ident()
+    try:
+        await backend.write_text("notes/a.md", "hello")
+        await backend.write_bytes("notes/b.bin", b"xyz")
+
+        assert await backend.read_text("notes/a.md") == "hello"
+        assert await backend.read_bytes("notes/b.bin") == b"xyz"
+        assert [p.name for p in await backend.list_dir("notes")] == ["a.md", "b.bin"]
+        assert (await backend.stat("notes/a.md")).st_size == 5
+        assert await backend.run_sync(threading.get_ident) != loop_thread
+
+        await backend.move("notes/a.md", "moved/a.md")
+        assert await backend.is_file("moved/a.md")
+        assert not await backend.exists("notes/a.md")
+        with pytest.raises(PathEscapeError):
+            await backend.read_text("../outside.md")
+    finally:
+        backend.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrent_io(tmp_path: Path) -> None:
+    backend = AsyncInProcessFilesystemBackend(base_path=tmp_path, max_workers=2)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.02)
+        with lock:
+            running -= 1
+
+    try:
+        await asyncio.gather(*(backend.run_sync(slow) for _ in range(6)))
+    finally:
+        backend.shutdown()
+
+    assert peak == 2
+
+
+def test_factory_wraps_the_cached_sync_backend(tmp_path: Path) -> None:
+    backend = get_async_filesystem_backend(
+        FilesystemBackendType.IN_PROCESS, tmp_path, max_workers=2
+    )
+    try:
+        assert isinstance(backend, AsyncFilesystemBackend)
+        assert backend is get_async_filesystem_backend(
+            FilesystemBackendType.IN_PROCESS, str(tmp_path), max_workers=2
+        )
+        assert backend.backend is get_filesystem_backend(
+            FilesystemBackendType.IN_PROCESS, tmp_path
+        )
+    finally:
+        close_async_filesystem_backends()
+
+    assert (
+        get_async_filesystem_backend(
+            FilesystemBackendType.IN_PROCESS, tmp_path, max_workers=2
+        )
+        is not backend
+    )
+    close_async_filesystem_backends()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from app.core.settings import HttpConfig, settings
+from app.engine.tools import search as search_module
+from app.engine.tools.search import call_brave_search
+from app.services.http import HttpClientRegistry
+
+
+def test_clients_are_pooled_per_provider_and_loop() -> None:
+    registry = HttpClientRegistry(HttpConfig(timeouts_s={"jina": 3.0}))
+
+    async def clients() -> tuple[httpx.AsyncClient, ...]:
+        return registry.get("brave"), registry.get("brave"), registry.get("jina")
+
+    brave, brave_again, jina = asyncio.run(clients())
+    assert brave is brave_again
+    assert brave is not jina
+    assert brave.timeout.read == 20.0
+    assert jina.timeout.read == 3.0
+    assert jina.timeout.connect == 5.0
+
+    # A client bound to a finished loop is replaced, not reused.
+    (next_brave, *_) = asyncio.run(clients())
+    assert next_brave is not brave
+    # Async and sync clients of one provider pace against the same limiter.
+    sync_brave = registry.get_sync("brave")
+    assert sync_brave._transport.limiter is brave._transport.limiter
+    assert registry.limiter("brave") is brave._transport.limiter
+    assert "limiter" in registry.stats()["brave"]
+
+    asyncio.run(registry.aclose())
+    assert next_brave.is_closed
+    assert sync_brave.is_closed
+
+
+@pytest.mark.asyncio
+async def test_stats_count_requests_connections_and_versions() -> None:
+    registry = HttpClientRegistry(HttpConfig())
+    client = registry.get("exa")
+    on_request = client.event_hooks["request"][0]
+    on_response = client.event_hooks["response"][0]
+
+    for _ in range(4):
+        request = httpx.Request("GET", "https://exa.invalid/")
+        await on_request(request)
+        await on_response(httpx.Response(200, request=request))
+    trace = request.extensions["trace"]
+    await trace("connection.connect_tcp.complete", {})
+    await trace("connection.start_tls.complete", {})
+
+    stats = registry.stats()["exa"]
+    assert stats["requests"] == 4
+    assert stats["connections"] == 1
+    assert stats["tls_handshakes"] == 1
+    assert stats["reuse_ratio"] == 0.75
+    assert stats["http_versions"] == {"HTTP/1.1": 4}
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_brave_search_uses_shared_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["q"] == "rust async"
+        assert request.headers["X-Subscription-Token"] == "key"
+        body = {"web": {"results": [{"title": "T", "url": "https://a"}]}}
+        return httpx.Response(200, content=orjson.dumps(body))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        search_module,
+        "send_request",
+        lambda name, method, url, **kwargs: client.request(method, url, **kwargs),
+    )
+    monkeypatch.setattr(settings, "BRAVE_SEARCH_API_KEY", "key")
+    monkeypatch.setattr(settings.search_cache, "enabled", False)
+
+    results, error = await call_brave_search.ainvoke({"query": "rust async"})
+
+    assert error is None
+    assert [entry["url"] for entry in results] == ["https://a"]
+    await client.aclose()
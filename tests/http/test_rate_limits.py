@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from app.services.http.limits import ProviderLimiter, RateLimitedTransport
+
+
+def test_token_bucket_paces_requests_beyond_the_burst() -> None:
+    limiter = ProviderLimiter("test", requests_per_s=20.0, max_concurrency=8, burst=1)
+
+    started = time.monotonic()
+    for _ in range(3):
+        limiter.acquire_sync()
+        limiter.release(200)
+
+    assert time.monotonic() - started >= 0.09
+    stats = limiter.stats()
+    assert stats["waits"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_aimd_halves_on_throttling_and_recovers_additively() -> None:
+    limiter = ProviderLimiter("test", requests_per_s=1000.0, max_concurrency=8)
+
+    for expected in (4, 2, 1, 1):
+        limiter.acquire_sync()
+        limiter.release(429)
+        assert limiter.stats()["concurrency_limit"] == expected
+
+    # Each success adds 1 / limit: 1 -> 2 -> 2.5 -> 2.9 -> 3.2.
+    for _ in range(4):
+        limiter.acquire_sync()
+        limiter.release(200)
+    assert limiter.stats()["concurrency_limit"] == 3
+    assert limiter.stats()["throttled"] == 4
+
+
+@pytest.mark.parametrize(
+    ("status", "headers", "low", "high"),
+    [
+        (429, {"Retry-After": "5"}, 4.5, 5.0),
+        (
+            503,
+            lambda: {"retry-after": formatdate(time.time() + 10, usegmt=True)},
+            8.0,
+            10.0,
+        ),
+        (
+            200,
+            {"X-RateLimit-Remaining": "0, 900", "X-RateLimit-Reset": "2, 86400"},
+            1.5,
+            2.0,
+        ),
+        (
+            403,
+            lambda: {
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 30),
+            },
+            25.0,
+            30.0,
+        ),
+        (200, {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "2"}, 0.0, 0.0),
+    ],
+)
+def test_provider_is_paused_by_rate_limit_headers(
+    status: int, headers: object, low: float, high: float
+) -> None:
+    # Time-based headers are built when the test runs, not at collection.
+    if callable(headers):
+        headers = headers()
+    limiter = ProviderLimiter("test", requests_per_s=1000.0, max_concurrency=8)
+    limiter.acquire_sync()
+    limiter.release(status, headers)
+
+    assert low <= limiter.stats()["blocked_for_s"] <= high
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_holds_requests_until_a_slot_frees() -> None:
+    limiter = ProviderLimiter("test", requests_per_s=1000.0, max_concurrency=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    limiter.release(200)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.stats()["in_flight"] == 1
+
+
+@pytest.mark.asyncio
+async def test_transport_backs_off_after_retry_after() -> None:
+    statuses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "0.2"})
+
+    limiter = ProviderLimiter("test", requests_per_s=1000.0, max_concurrency=8)
+    transport = RateLimitedTransport(httpx.MockTransport(handler), limiter)
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert (await client.get("https://api.invalid/")).status_code == 429
+        started = time.monotonic()
+        assert (await client.get("https://api.invalid/")).status_code == 200
+
+    assert time.monotonic() - started >= 0.15
+    assert limiter.stats()["throttled"] == 1
+    assert limiter.stats()["in_flight"] == 0
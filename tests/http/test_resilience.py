@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.http import CircuitOpenError
+from app.services.http.resilience import (
+    CircuitBreaker,
+    LatencyWindow,
+    hedged_request,
+)
+
+
+def _window(initial_delay_s: float = 0.05) -> LatencyWindow:
+    return LatencyWindow(
+        percentile=0.9, min_samples=10, initial_delay_s=initial_delay_s
+    )
+
+
+def _breaker(threshold: int = 3, reset_s: float = 60.0) -> CircuitBreaker:
+    return CircuitBreaker("test", failure_threshold=threshold, reset_s=reset_s)
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_the_duplicate_wins() -> None:
+    calls: list[int] = []
+
+    async def send() -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, text=f"attempt {len(calls)}")
+
+    latency = _window()
+    started = time.monotonic()
+    response = await hedged_request("test", send, _breaker(), latency)
+
+    assert response.text == "attempt 2"
+    assert time.monotonic() - started < 1
+    assert latency.stats()["hedged"] == 1
+    assert latency.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_requests_are_not_hedged() -> None:
+    calls: list[int] = []
+
+    async def send() -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(200)
+
+    latency = _window()
+    await hedged_request("test", send, _breaker(), latency)
+    await hedged_request("test", send, _breaker(), latency, hedge=False)
+
+    assert len(calls) == 2
+    assert latency.stats()["hedged"] == 0
+    assert latency.stats()["samples"] == 2
+
+
+def test_hedge_delay_follows_the_latency_percentile() -> None:
+    latency = _window(initial_delay_s=3.0)
+    for value in range(1, 10):
+        latency.observe(value / 10)
+    assert latency.hedge_delay() == 3.0
+
+    latency.observe(1.0)
+    assert latency.hedge_delay() == 1.0
+    for _ in range(90):
+        latency.observe(0.1)
+    assert latency.hedge_delay() == pytest.approx(0.1)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_fails_fast_and_recovers_after_a_probe() -> None:
+    breaker = _breaker(threshold=2, reset_s=0.05)
+    outcomes = iter(["error", "500", "ok"])
+    calls: list[str] = []
+
+    async def send() -> httpx.Response:
+        outcome = next(outcomes)
+        calls.append(outcome)
+        if outcome == "error":
+            raise httpx.ConnectError("refused")
+        return httpx.Response(500 if outcome == "500" else 200)
+
+    async def call() -> httpx.Response:
+        return await hedged_request("test", send, breaker, _window(), hedge=False)
+
+    with pytest.raises(httpx.ConnectError):
+        await call()
+    assert (await call()).status_code == 500
+    assert breaker.is_open
+
+    with pytest.raises(CircuitOpenError):
+        await call()
+    assert calls == ["error", "500"]
+
+    await asyncio.sleep(0.06)
+    assert (await call()).status_code == 200
+    assert breaker.stats() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "opens": 1,
+        "rejected": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_half_open_allows_one_probe_and_reopens_on_failure() -> None:
+    breaker = _breaker(threshold=1, reset_s=0.05)
+    release = asyncio.Event()
+
+    async def failing() -> httpx.Response:
+        await release.wait()
+        return httpx.Response(503)
+
+    release.set()
+    await hedged_request("test", failing, breaker, _window(), hedge=False)
+    await asyncio.sleep(0.06)
+
+    release.clear()
+    probe = asyncio.create_task(
+        hedged_request("test", failing, breaker, _window(), hedge=False)
+    )
+    await asyncio.sleep(0)
+    with pytest.raises(CircuitOpenError):
+        await hedged_request("test", failing, breaker, _window(), hedge=False)
+
+    release.set()
+    assert (await probe).status_code == 503
+    assert breaker.is_open
+    assert breaker.stats()["opens"] == 2
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.memory import (
+    parse_frontmatter,
+    parse_section,
+    retrieve_memories,
+    search_related,
+)
+from app.engine.memory.compaction import compact_memories, main
+
+MEMORIES = Path("memories")
+INDEX = Path("index")
+
+
+@pytest.fixture
+def backend(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> InProcessFilesystemBackend:
+    monkeypatch.setattr("app.core.settings.settings.INDEX_DIR", INDEX)
+    return InProcessFilesystemBackend(base_path=tmp_path)
+
+
+def _run(backend, slug: str, ts: int, insights: list[str], topic: str = "") -> str:
+    name = f"{slug}-2025010100{ts:04d}.md"
+    body = "\n".join(
+        [
+            "---",
+            f'topic: "{topic or slug.replace("-", " ")}"',
+            "type: research_run",
+            "---",
+            "",
+            "# Key Insights",
+            "",
+            *[f"- {insight}" for insight in insights],
+            "",
+            "# Research Notes",
+            "",
+            f"- note {ts}",
+            "",
+        ]
+    )
+    backend.write_text(MEMORIES / name, body)
+    return name
+
+
+def _names(backend, directory: Path) -> list[str]:
+    return [path.name for path in backend.list_dir(directory) if path.is_file()]
+
+
+def test_old_runs_merge_into_a_deduplicated_shard(backend) -> None:
+    names = [
+        _run(backend, "vector-db", i, ["HNSW is fast", f"insight {i}"])
+        for i in range(5)
+    ]
+    _run(backend, "other-topic", 0, ["untouched"])
+
+    result = compact_memories(MEMORIES, backend, keep_recent=2)
+
+    assert result.shards == ["vector-db.rollup.md"]
+    assert result.merged == result.archived == 3
+    assert sorted(_names(backend, MEMORIES)) == sorted(
+        [*names[3:], "vector-db.rollup.md", "other-topic-20250101000000.md"]
+    )
+    assert sorted(_names(backend, MEMORIES / ".archive")) == sorted(names[:3])
+
+    shard = backend.read_text(MEMORIES / "vector-db.rollup.md")
+    meta = parse_frontmatter(shard)
+    assert meta["topic"] == "vector db"
+    assert meta["type"] == "rollup"
+    assert meta["run_count"] == 3
+    assert parse_section(shard, "Key Insights") == [
+        "HNSW is fast",
+        "insight 2",
+        "insight 1",
+        "insight 0",
+    ]
+    assert len(parse_section(shard, "Research Notes")) == 3
+
+
+def test_repeated_compaction_folds_into_existing_shard(backend) -> None:
+    for i in range(3):
+        _run(backend, "topic", i, ["same insight"])
+    compact_memories(MEMORIES, backend, keep_recent=1)
+    for i in range(3, 6):
+        _run(backend, "topic", i, ["same insight", "new insight"])
+
+    compact_memories(MEMORIES, backend, keep_recent=1)
+
+    shard = backend.read_text(MEMORIES / "topic.rollup.md")
+    meta = parse_frontmatter(shard)
+    assert meta["run_count"] == 5
+    assert str(meta["first_run"]).endswith("0000")
+    assert str(meta["last_run"]).endswith("0004")
+    assert parse_section(shard, "Key Insights") == ["same insight", "new insight"]
+    # Bounded: one shard plus keep_recent run files.
+    assert len(_names(backend, MEMORIES)) == 2
+
+
+def test_rewritten_shard_is_reindexed(backend) -> None:
+    for i in range(2):
+        _run(backend, "topic", i, ["shared insight"])
+    compact_memories(MEMORIES, backend, keep_recent=0)
+    # Index the first shard version, as a run between compactions would.
+    assert retrieve_memories("zebracorn", MEMORIES, INDEX, backend) == []
+    _run(backend, "topic", 2, ["zebracorn"])
+    index_files = {
+        path.name: backend.read_bytes(path) for path in backend.list_dir(INDEX)
+    }
+
+    compact_memories(MEMORIES, backend, keep_recent=0)
+
+    # The CLI runs next to the app: compaction leaves the indexes to the
+    # app's own sync rather than writing them from a second process.
+    assert {
+        path.name: backend.read_bytes(path) for path in backend.list_dir(INDEX)
+    } == index_files
+    (shard,) = retrieve_memories("zebracorn", MEMORIES, INDEX, backend)
+    assert "- zebracorn" in shard
+    (top, _), *_ = search_related("zebracorn", [MEMORIES], INDEX, backend, k=1)
+    assert top == (MEMORIES / "topic.rollup.md").as_posix()
+
+
+def test_multi_line_notes_survive_the_rollup(backend) -> None:
+    note = "Benchmarks:\n  recall@10 = 0.95\n  p99 = 4ms"
+    backend.write_text(
+        MEMORIES / "topic-20250101000000.md",
+        f"# Key Insights\n\n- fast\n\n# Research Notes\n\n- {note}\n- short\n",
+    )
+
+    compact_memories(MEMORIES, backend, keep_recent=0)
+
+    shard = backend.read_text(MEMORIES / "topic.rollup.md")
+    assert parse_section(shard, "Research Notes") == [note, "short"]
+    assert parse_section(shard, "Key Insights") == ["fast"]
+
+
+def test_dry_run_changes_nothing(backend, monkeypatch, capsys) -> None:
+    for i in range(4):
+        _run(backend, "topic", i, ["x"])
+    monkeypatch.setattr(
+        "app.engine.memory.compaction.get_filesystem_backend", lambda **_: backend
+    )
+
+    main(["--memories-dir", str(MEMORIES), "--keep-recent", "1", "--dry-run"])
+
+    assert "'merged': 3" in capsys.readouterr().out
+    assert len(_names(backend, MEMORIES)) == 4
+    assert not backend.exists(MEMORIES / ".archive")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.memory import (
+    clear_manifest_cache,
+    clear_memory_index_cache,
+    retrieve_memories,
+    sync_memory_index,
+)
+from app.engine.memory.index import INDEX_FILENAME, MemoryIndex
+from app.engine.memory.manifest import MANIFEST_FILENAME, MemoryManifest
+from app.engine.tools.io import persist_memories
+
+MEMORIES = Path("memories")
+INDEX = Path("index")
+
+
+@pytest.fixture
+def backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("app.core.settings.settings.INDEX_DIR", INDEX)
+    clear_memory_index_cache()
+    clear_manifest_cache()
+    yield InProcessFilesystemBackend(base_path=tmp_path)
+    clear_memory_index_cache()
+    clear_manifest_cache()
+
+
+def _persist(backend, topic: str, insights: list[str]) -> Path:
+    (path,) = persist_memories(
+        MEMORIES, topic, [], insights, [], [], None, backend=backend
+    )
+    return path
+
+
+def test_bm25_ranks_matching_documents() -> None:
+    index = MemoryIndex()
+    index.add("a.md", "vector databases and approximate nearest neighbour search")
+    index.add("b.md", "gardening tips for tomatoes")
+    index.add("c.md", "vector search vector search with hnsw graphs")
+
+    ranked = [name for name, _ in index.search("vector search")]
+
+    assert ranked == ["c.md", "a.md"]
+    assert index.search("the and of") == []
+
+
+def test_retrieve_returns_top_k_relevant_memories(backend) -> None:
+    _persist(backend, "rust async runtimes", ["tokio uses work stealing"])
+    _persist(backend, "sourdough baking", ["hydration drives crumb"])
+    _persist(backend, "python async io", ["asyncio runs one loop per thread"])
+
+    memories = retrieve_memories("async runtimes", MEMORIES, INDEX, backend, top_k=1)
+
+    assert len(memories) == 1
+    assert "rust async runtimes" in memories[0]
+
+
+def test_token_budget_skips_oversized_memories(backend) -> None:
+    _persist(backend, "graph databases", ["graph " * 2000])
+    _persist(backend, "graph theory", ["short graph note"])
+
+    memories = retrieve_memories(
+        "graph", MEMORIES, INDEX, backend, top_k=5, token_budget=200
+    )
+
+    assert len(memories) == 1
+    assert "graph theory" in memories[0]
+
+
+def test_index_is_persisted_and_synced_with_disk(backend) -> None:
+    kept = _persist(backend, "kept topic", [])
+    dropped = _persist(backend, "dropped topic", [])
+    assert backend.is_file(INDEX / INDEX_FILENAME)
+
+    # Simulate another process: files changed behind this process's back.
+    clear_memory_index_cache()
+    backend.delete_file(dropped)
+    backend.write_text(MEMORIES / "manual-20250101000000.md", "manual topic")
+    index = sync_memory_index(MEMORIES, INDEX, backend)
+
+    assert set(index.docs) == {kept.name, "manual-20250101000000.md"}
+    clear_memory_index_cache()
+    reloaded = sync_memory_index(MEMORIES, INDEX, backend)
+    assert set(reloaded.docs) == set(index.docs)
+
+
+def test_corrupt_index_is_rebuilt(backend) -> None:
+    _persist(backend, "resilient indexes", [])
+    clear_memory_index_cache()
+    backend.write_bytes(INDEX / INDEX_FILENAME, b"{not json")
+
+    memories = retrieve_memories("resilient", MEMORIES, INDEX, backend)
+
+    assert len(memories) == 1
+
+
+def test_retrieval_lists_memories_through_the_manifest(backend) -> None:
+    backend.write_text(MEMORIES / "manual.md", "# Key Insights\n\n- quokka facts\n")
+    reads: list[str] = []
+    original = backend.read_text
+    backend.read_text = lambda p, **kw: reads.append(Path(p).name) or original(p)
+
+    assert retrieve_memories("quokka", MEMORIES, INDEX, backend) == [
+        "# Key Insights\n\n- quokka facts\n"
+    ]
+    records = MemoryManifest(INDEX / MANIFEST_FILENAME, backend).load().records
+    assert records["manual.md"].insights == ["quokka facts"]
+
+    # Served from the synced manifest and index: nothing is parsed again
+    # except the hit itself.
+    reads.clear()
+    retrieve_memories("quokka", MEMORIES, INDEX, backend)
+    assert reads == ["manual.md"]
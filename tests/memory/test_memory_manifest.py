@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.memory import (
+    clear_manifest_cache,
+    load_manifest,
+    memory_insights,
+    parse_frontmatter,
+)
+from app.engine.memory.manifest import MANIFEST_FILENAME, MemoryManifest
+from app.engine.tools.io import extract_memory_insights, persist_memories
+
+MEMORIES = Path("memories")
+INDEX = Path("index")
+
+
+@pytest.fixture
+def backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("app.core.settings.settings.INDEX_DIR", INDEX)
+    clear_manifest_cache()
+    yield InProcessFilesystemBackend(base_path=tmp_path)
+    clear_manifest_cache()
+
+
+def _persist(backend, topic: str, insights: list[str]) -> Path:
+    (path,) = persist_memories(
+        MEMORIES, topic, ["a note"], insights, ["why"], [], None, backend=backend
+    )
+    return path
+
+
+def test_persist_appends_parsed_record(backend) -> None:
+    path = _persist(backend, "cache design", ["lru beats fifo", "ttl needs jitter"])
+
+    lines = backend.read_bytes(INDEX / MANIFEST_FILENAME).splitlines()
+    record = (
+        MemoryManifest(INDEX / MANIFEST_FILENAME, backend).load().records[path.name]
+    )
+
+    assert len(lines) == 1
+    assert record.topic == "cache design"
+    assert record.type == "research_run"
+    assert record.counts["notes_count"] == 1
+    assert record.counts["insight_count"] == 2
+    # Only the Key Insights section, not the notes or reasoning bullets.
+    assert record.insights == ["lru beats fifo", "ttl needs jitter"]
+    assert record.size == len(backend.read_bytes(path))
+
+
+def test_sync_reparses_only_changed_files(backend, monkeypatch) -> None:
+    unchanged = _persist(backend, "first topic", ["kept"])
+    changed = _persist(backend, "second topic", ["old"])
+    clear_manifest_cache()
+
+    text = backend.read_text(changed).replace("- old", "- new insight")
+    backend.write_text(changed, text)
+    os.utime(backend.resolve(changed), ns=(1, 1))
+    backend.write_text(MEMORIES / "extra.md", "# Key Insights\n\n- extra\n")
+
+    reads: list[str] = []
+    original = backend.read_text
+    monkeypatch.setattr(
+        backend, "read_text", lambda p, **kw: reads.append(Path(p).name) or original(p)
+    )
+    manifest = load_manifest(MEMORIES, INDEX, backend)
+
+    assert sorted(reads) == sorted([changed.name, "extra.md"])
+    assert unchanged.name not in reads
+    assert sorted(manifest.insights()) == ["extra", "kept", "new insight"]
+
+
+def test_deleted_memories_drop_out(backend) -> None:
+    kept = _persist(backend, "kept", ["stays"])
+    dropped = _persist(backend, "dropped", ["goes"])
+    backend.delete_file(dropped)
+
+    assert memory_insights(MEMORIES, INDEX, backend) == ["stays"]
+    clear_manifest_cache()
+    reloaded = MemoryManifest(INDEX / MANIFEST_FILENAME, backend).load()
+    assert list(reloaded.records) == [kept.name]
+
+
+def test_torn_manifest_line_is_skipped_and_repaired(backend) -> None:
+    path = _persist(backend, "torn writes", ["survives"])
+    with backend.open_write(INDEX / MANIFEST_FILENAME, "ab", encoding=None) as fh:
+        fh.write(b'{"name": "half')
+    clear_manifest_cache()
+
+    assert memory_insights(MEMORIES, INDEX, backend) == ["survives"]
+    assert (
+        path.name in MemoryManifest(INDEX / MANIFEST_FILENAME, backend).load().records
+    )
+
+
+def test_parsers_match_persisted_format() -> None:
+    memory = '---\ntopic: "a: b"\ncreated_at: 2025-01-01T00:00:00+00:00\n'
+    memory += (
+        "notes_count: 3\n---\n\n# Key Insights\n\n- one\n\n# Research Notes\n\n- n\n"
+    )
+
+    assert parse_frontmatter(memory) == {
+        "topic": "a: b",
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "notes_count": 3,
+    }
+    assert extract_memory_insights([memory]) == ["one"]
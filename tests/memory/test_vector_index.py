@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.backends.memory import MemoryFilesystemBackend
+from app.engine.backends.threaded import AsyncInProcessFilesystemBackend
+from app.engine.memory import (
+    HashingEmbedder,
+    VectorIndex,
+    clear_vector_index_cache,
+    search_related,
+)
+from app.engine.tools.io import persist_memories, write_zettelkasten_notes
+
+MEMORIES = Path("memories")
+VAULT = Path("vault")
+INDEX = Path("index")
+
+
+@pytest.fixture
+def backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    backend = InProcessFilesystemBackend(base_path=tmp_path)
+    monkeypatch.setattr("app.core.settings.settings.INDEX_DIR", INDEX)
+    monkeypatch.setattr("app.core.settings.settings.VAULT_DIR", VAULT)
+    async_backend = AsyncInProcessFilesystemBackend(backend=backend, max_workers=2)
+    monkeypatch.setattr(
+        "app.engine.tools.io._resolve_async_backend", lambda: async_backend
+    )
+    clear_vector_index_cache()
+    yield backend
+    clear_vector_index_cache()
+    async_backend.shutdown()
+
+
+def test_hashing_embedder_is_deterministic_and_normalized() -> None:
+    embedder = HashingEmbedder(dim=64)
+
+    first = embedder.embed(["vector search with numpy", ""])
+    second = HashingEmbedder(dim=64).embed(["vector search with numpy"])
+
+    assert first.dtype == np.float32
+    assert first.shape == (2, 64)
+    np.testing.assert_allclose(np.linalg.norm(first[0]), 1.0, rtol=1e-6)
+    assert not first[1].any()
+    np.testing.assert_array_equal(first[0], second[0])
+
+
+def test_append_search_and_memmap_reload(backend) -> None:
+    index = VectorIndex(HashingEmbedder(dim=128), INDEX, backend).load()
+    index.add([("a", "tokio async runtime work stealing")])
+    index.add([("b", "sourdough bread hydration"), ("c", "python asyncio runtime")])
+
+    reloaded = VectorIndex(HashingEmbedder(dim=128), INDEX, backend).load()
+    hits = reloaded.search("async runtime", k=2)
+
+    assert backend.read_bytes(INDEX / "documents.f32").__len__() == 3 * 128 * 4
+    assert [doc_id for doc_id, _ in hits] == ["a", "c"]
+    assert isinstance(reloaded._load_matrix(), np.memmap)
+    batch = reloaded.search_batch(["bread hydration", "work stealing"], k=1)
+    assert [hits[0][0] for hits in batch] == ["b", "a"]
+
+
+def test_index_works_on_backends_without_file_descriptors(tmp_path: Path) -> None:
+    backend = MemoryFilesystemBackend(base_path=tmp_path)
+    index = VectorIndex(HashingEmbedder(dim=128), INDEX, backend).load()
+    index.add([("a", "tokio async runtime"), ("b", "sourdough bread hydration")])
+
+    reloaded = VectorIndex(HashingEmbedder(dim=128), INDEX, backend).load()
+
+    assert reloaded.search("async runtime", k=1)[0][0] == "a"
+
+
+def test_rewritten_documents_are_tombstoned_then_compacted(backend) -> None:
+    index = VectorIndex(HashingEmbedder(dim=64), INDEX, backend).load()
+    index.add([("note", "graph databases"), ("other", "unrelated gardening")])
+    index.add([("note", "vector databases")])
+    assert index.row_ids == [None, "other", "note"]
+
+    index.add([("note", "vector databases and search")])
+
+    # As many superseded rows as live ones triggers a rewrite.
+    assert index.row_ids == ["other", "note"]
+    assert index.search("vector databases", k=5)[0][0] == "note"
+
+
+def test_embedder_change_rebuilds_index(backend) -> None:
+    VectorIndex(HashingEmbedder(dim=64), INDEX, backend).load().add([("a", "x y")])
+
+    rebuilt = VectorIndex(HashingEmbedder(dim=32), INDEX, backend).load()
+
+    assert len(rebuilt) == 0
+    assert not backend.exists(INDEX / "documents.f32")
+
+
+@pytest.mark.asyncio
+async def test_writers_append_and_search_spans_memories_and_vault(backend) -> None:
+    persist_memories(
+        MEMORIES,
+        "kubernetes autoscaling",
+        ["horizontal pod autoscaler tuning"],
+        [],
+        [],
+        [],
+        None,
+        backend=backend,
+    )
+    await write_zettelkasten_notes.ainvoke(
+        {
+            "notes": [
+                {
+                    "id": "hpa",
+                    "title": "HPA",
+                    "content": "Kubernetes horizontal pod autoscaler basics",
+                },
+                {"id": "bread", "title": "Bread", "content": "Sourdough starter"},
+            ]
+        }
+    )
+
+    hits = search_related(
+        "kubernetes pod autoscaler", [MEMORIES, VAULT], INDEX, backend, k=2
+    )
+
+    assert {doc_id.split("/")[0] for doc_id, _ in hits} == {"memories", "vault"}
+    assert "vault/bread.md" not in [doc_id for doc_id, _ in hits]
+
+
+def test_sync_reembeds_files_rewritten_in_place(backend) -> None:
+    (path,) = persist_memories(
+        MEMORIES, "orchards", ["apple grafting"], [], [], [], None, backend=backend
+    )
+    name = Path(path).name
+    index = search_related("apple", [MEMORIES], INDEX, backend)
+    rows = list(VectorIndex(HashingEmbedder(dim=512), INDEX, backend).load().row_ids)
+    # Writer-indexed files carry their stat; syncing again embeds nothing.
+    assert len(rows) == 1
+    assert index == search_related("apple", [MEMORIES], INDEX, backend)
+
+    # Another process (e.g. memory compaction) rewrites the file.
+    backend.write_text(MEMORIES / name, "cherry blossom pruning schedules")
+    clear_vector_index_cache()
+
+    hits = search_related("cherry pruning", [MEMORIES], INDEX, backend, k=1)
+
+    doc, query = HashingEmbedder(dim=512).embed(
+        ["cherry blossom pruning schedules", "cherry pruning"]
+    )
+    assert hits == [(f"memories/{name}", pytest.approx(float(doc @ query)))]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain.agents.structured_output import ProviderStrategy
+
+from app.core.settings import LLMConfig
+from app.engine.nodes.builders import agent
+from app.engine.nodes.builders.agent import build_agent_executor
+from app.engine.outputs import SummarizerOutput, ZettelkastenOutput
+from app.engine.tools.io import write_report
+
+
+@pytest.fixture(autouse=True)
+def llm_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "app.core.settings.settings.llm",
+        LLMConfig(model="gpt-test", api_key="sk-test"),
+    )
+    agent.clear_agent_executors()
+    yield
+    agent.clear_agent_executors()
+
+
+def _build(system_prompt: str = "prompt", schema: type = SummarizerOutput):
+    return build_agent_executor(
+        tools=[write_report],
+        system_prompt=system_prompt,
+        response_format=ProviderStrategy(schema),
+    )
+
+
+def test_executor_is_reused_for_identical_shape() -> None:
+    assert _build() is _build()
+
+
+def test_executor_differs_by_prompt_and_response_format() -> None:
+    base = _build()
+
+    assert _build(system_prompt="other") is not base
+    assert _build(schema=ZettelkastenOutput) is not base
+
+
+def test_llm_config_change_drops_pooled_executors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    before = _build()
+    monkeypatch.setattr(
+        "app.core.settings.settings.llm",
+        LLMConfig(model="gpt-test", api_key="sk-test", temperature=0.2),
+    )
+
+    after = _build()
+
+    assert after is not before
+    assert len(agent._EXECUTOR_POOL) == 1
+
+
+def test_http_client_is_shared_per_model() -> None:
+    _build()
+    _build(system_prompt="other")
+
+    assert list(agent._LLM_HTTP_CLIENTS) == ["gpt-test"]
+
+
+def test_http_client_is_rebuilt_on_another_event_loop() -> None:
+    async def build():
+        executor = _build()
+        return executor, agent._LLM_HTTP_CLIENTS["gpt-test"][1]
+
+    first_executor, first_client = asyncio.run(build())
+    second_executor, second_client = asyncio.run(build())
+
+    assert second_client is not first_client
+    assert second_executor is not first_executor
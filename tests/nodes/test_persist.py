@@ -12,6 +12,7 @@ import polars as pl
 import pytest
 
 from app.engine.backends.inprocess import InProcessFilesystemBackend
+from app.engine.backends.threaded import AsyncInProcessFilesystemBackend
 from app.engine.nodes.persist import persist_artifacts
 from app.engine.schema import ResearchState
 
@@ -19,14 +20,18 @@ from app.engine.schema import ResearchState
 @pytest.fixture
 def tmp_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     backend = InProcessFilesystemBackend(base_path=tmp_path)
+    async_backend = AsyncInProcessFilesystemBackend(backend=backend, max_workers=2)
 
     def fake_factory(**_kwargs):
-        return backend
+        return async_backend
 
-    monkeypatch.setattr("app.engine.nodes.persist.get_filesystem_backend", fake_factory)
+    monkeypatch.setattr(
+        "app.engine.nodes.persist.get_async_filesystem_backend", fake_factory
+    )
     monkeypatch.setattr("app.core.settings.settings.MEMORIES_DIR", Path("memories"))
     monkeypatch.setattr("app.core.settings.settings.OUTPUT_DIR", Path("outputs"))
-    return backend
+    yield backend
+    async_backend.shutdown()
 
 
 def _state() -> ResearchState:
@@ -46,8 +51,9 @@ def _state() -> ResearchState:
     )
 
 
-def test_persist_writes_sources_and_memory(tmp_backend) -> None:
-    result = persist_artifacts(_state())
+@pytest.mark.asyncio
+async def test_persist_writes_sources_and_memory(tmp_backend) -> None:
+    result = await persist_artifacts(_state())
 
     assert result["topic"] == "langgraph persistence"
     assert tmp_backend.is_file("outputs/sources.csv")
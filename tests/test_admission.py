@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.metrics import metrics
+from app.engine.admission import (
+    AdmissionController,
+    QueueFullError,
+    QueueTimeoutError,
+)
+
+
+@pytest.mark.asyncio
+async def test_runs_beyond_limit_wait_and_are_admitted_in_order() -> None:
+    controller = AdmissionController(max_in_flight=1, max_queue=2)
+    admitted: list[str] = []
+
+    async def run(label: str) -> None:
+        async with controller.admit("research"):
+            admitted.append(label)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(run("a"), run("b"), run("c"))
+
+    assert admitted == ["a", "b", "c"]
+    assert controller.stats()["research"] == {
+        "limit": 1,
+        "in_flight": 0,
+        "queue_depth": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_immediately() -> None:
+    controller = AdmissionController(max_in_flight=1, max_queue=1, retry_after_s=7)
+    await controller.acquire("research")
+    queued = asyncio.create_task(controller.acquire("research"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(QueueFullError) as excinfo:
+        await controller.acquire("research")
+
+    assert excinfo.value.retry_after_s == 7
+    controller.release("research")
+    await queued
+    assert controller.stats()["research"]["in_flight"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_rejects_and_frees_the_queue_slot() -> None:
+    controller = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout_s=0.01)
+    await controller.acquire("research")
+
+    with pytest.raises(QueueTimeoutError):
+        await controller.acquire("research")
+
+    assert controller.stats()["research"]["queue_depth"] == 0
+    assert metrics.snapshot()["counters"]["admission.research.rejected_timeout"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_per_workflow_limits_are_independent() -> None:
+    controller = AdmissionController(max_in_flight=1, per_workflow={"researcher": 2})
+
+    await controller.acquire("researcher")
+    await controller.acquire("researcher")
+    await controller.acquire("research")
+
+    assert controller.stats()["researcher"]["in_flight"] == 2
+    assert controller.stats()["research"]["in_flight"] == 1
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from langgraph.checkpoint.memory import MemorySaver
+
+from app.core.metrics import metrics
+from app.engine import checkpointer as checkpointer_module
+from app.engine.checkpointer import (
+    close_checkpointer,
+    get_checkpointer,
+    open_checkpointer,
+)
+
+
+class _FakePool:
+    instances: list[_FakePool] = []
+
+    def __init__(self, conninfo: str, min_size: int, max_size: int, **kwargs) -> None:
+        self.conninfo = conninfo
+        self.min_size = min_size
+        self.max_size = max_size
+        self.kwargs = kwargs
+        self.opened = 0
+        self.closed = False
+        _FakePool.instances.append(self)
+
+    async def open(self, wait: bool = False, timeout: float = 30.0) -> None:
+        self.opened += 1
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def get_stats(self) -> dict[str, int]:
+        return {"pool_size": 4, "pool_available": 1, "requests_waiting": 2}
+
+
+class _FakeSaver:
+    def __init__(self, conn: _FakePool) -> None:
+        self.conn = conn
+        self.setup_calls = 0
+
+    async def setup(self) -> None:
+        self.setup_calls += 1
+
+
+@pytest_asyncio.fixture
+async def fresh_checkpointer():
+    await close_checkpointer()
+    yield
+    await close_checkpointer()
+
+
+@pytest.fixture
+def postgres(monkeypatch: pytest.MonkeyPatch) -> None:
+    _FakePool.instances.clear()
+    monkeypatch.setattr("app.core.settings.settings.DATABASE_URL", "postgresql://x")
+    monkeypatch.setattr(checkpointer_module, "AsyncConnectionPool", _FakePool)
+    monkeypatch.setattr(checkpointer_module, "AsyncPostgresSaver", _FakeSaver)
+
+
+@pytest.mark.asyncio
+async def test_memory_checkpointer_is_process_wide(
+    fresh_checkpointer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("app.core.settings.settings.DATABASE_URL", "")
+
+    first = await get_checkpointer()
+    second = await get_checkpointer()
+
+    assert isinstance(first, MemorySaver)
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_postgres_pool_opens_and_runs_setup_once(
+    fresh_checkpointer, postgres
+) -> None:
+    first = await open_checkpointer()
+    second = await get_checkpointer()
+
+    assert first is second
+    assert len(_FakePool.instances) == 1
+    pool = _FakePool.instances[0]
+    assert pool.opened == 1
+    assert pool.kwargs["kwargs"]["autocommit"] is True
+    assert first.setup_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_saturation_is_reported_and_pool_closed(
+    fresh_checkpointer, postgres
+) -> None:
+    await open_checkpointer()
+
+    stats = metrics.snapshot()["collectors"]["checkpointer"]
+    assert stats["backend"] == "postgres"
+    assert stats["in_use"] == 3
+    assert stats["requests_waiting"] == 2
+
+    await close_checkpointer()
+    assert _FakePool.instances[0].closed is True
+    assert "checkpointer" not in metrics.snapshot()["collectors"]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.engine.coalescing import Coalescer, request_key
+from app.engine.schema import ResearchRequest
+
+
+def test_request_key_is_canonical() -> None:
+    a = ResearchRequest(topic="vector  search", seed_urls=["https://b", "https://a"])
+    b = ResearchRequest(topic=" vector search ", seed_urls=["https://a", "https://b"])
+
+    assert request_key("research", a) == request_key("RESEARCH", b)
+    assert request_key("research", a) != request_key("researcher", a)
+    assert request_key("research", a) != request_key(
+        "research", ResearchRequest(topic="vector search")
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_share_one_execution() -> None:
+    coalescer = Coalescer()
+    calls = 0
+    release = asyncio.Event()
+
+    async def run() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"calls": calls}
+
+    waiters = [asyncio.create_task(coalescer.run("k", run)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert results == [{"calls": 1}] * 3
+    assert coalescer.stats()["misses"] == 1
+    assert coalescer.stats()["coalesced"] == 2
+    assert coalescer.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_serves_repeats_and_failures_are_not_cached() -> None:
+    coalescer = Coalescer(result_ttl_s=60)
+    calls = 0
+
+    async def ok() -> str:
+        nonlocal calls
+        calls += 1
+        return "report"
+
+    async def boom() -> str:
+        raise RuntimeError("llm down")
+
+    assert await coalescer.run("k", ok) == "report"
+    assert await coalescer.run("k", ok) == "report"
+    assert calls == 1
+    assert coalescer.stats()["hits"] == 1
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await coalescer.run("bad", boom)
+    assert coalescer.stats()["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_run() -> None:
+    coalescer = Coalescer()
+    release = asyncio.Event()
+
+    async def run() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(coalescer.run("k", run))
+    second = asyncio.create_task(coalescer.run("k", run))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_only_the_flight_leader_takes_an_admission_slot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.engine import executor
+    from app.engine.admission import AdmissionController
+
+    controller = AdmissionController(max_in_flight=1, max_queue=0)
+    release = asyncio.Event()
+
+    async def prepare(workflow_name, request):
+        return {}, None
+
+    async def checkpointer():
+        return None
+
+    async def run(workflow_name, state, context, config, checkpointer):
+        await release.wait()
+        return {"report": "shared"}
+
+    monkeypatch.setattr(executor, "get_admission_controller", lambda: controller)
+    monkeypatch.setattr(executor, "get_coalescer", lambda: coalescer)
+    monkeypatch.setattr(executor, "_prepare", prepare)
+    monkeypatch.setattr(executor, "get_checkpointer", checkpointer)
+    monkeypatch.setattr(executor, "_run", run)
+    coalescer = Coalescer()
+    request = ResearchRequest(topic="admission")
+
+    runs = [
+        asyncio.create_task(executor.execute("research", request, admit=True))
+        for _ in range(3)
+    ]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert controller.stats()["research"]["in_flight"] == 1
+    release.set()
+
+    assert await asyncio.gather(*runs) == [{"report": "shared"}] * 3
+    assert controller.stats()["research"]["in_flight"] == 0
+    assert coalescer.stats()["coalesced"] == 2
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from app.engine.tools.fusion import canonicalize_url, fuse_results, simhash
+
+
+@pytest.mark.parametrize(
+    ("url", "canonical"),
+    [
+        ("https://example.com/a", "https://example.com/a"),
+        ("http://www.Example.com/a/", "https://example.com/a"),
+        ("https://example.com:443/a#section", "https://example.com/a"),
+        ("https://example.com/a?utm_source=x&gclid=1", "https://example.com/a"),
+        ("https://example.com/a?b=2&a=1&ref=feed", "https://example.com/a?a=1&b=2"),
+        ("https://example.com:8443/", "https://example.com:8443"),
+    ],
+)
+def test_canonicalize_url(url: str, canonical: str) -> None:
+    assert canonicalize_url(url) == canonical
+
+
+def _entry(url: str, provider: str, title: str = "", notes: str = "") -> dict:
+    return {"url": url, "provider": provider, "title": title, "notes": notes}
+
+
+def test_rrf_rewards_pages_found_by_several_providers() -> None:
+    brave = [
+        _entry("https://a.com/1", "brave", "First"),
+        _entry("https://www.b.com/2/", "brave", "Second"),
+        _entry("https://a.com/1?utm_medium=x", "brave"),
+    ]
+    exa = [
+        _entry("http://b.com/2", "exa", notes="from exa"),
+        _entry("https://c.com/3", "exa", "Third"),
+    ]
+
+    fused = fuse_results([brave, exa], limit=10, collapse_near_duplicates=False)
+
+    # ``b.com`` keeps the URL of its best-ranked occurrence (exa, rank 1).
+    assert [entry["url"] for entry in fused] == [
+        "http://b.com/2",
+        "https://a.com/1",
+        "https://c.com/3",
+    ]
+    # Title and notes are filled from whichever occurrence had them.
+    assert fused[0]["title"] == "Second"
+    assert fused[0]["notes"] == "from exa"
+    assert fused[0]["provider"] == "exa"
+    # The repeated ``a.com`` entry counts once, at its best rank.
+    assert float(fused[1]["score"]) == pytest.approx(1 / 61, abs=1e-6)
+    assert float(fused[0]["score"]) == pytest.approx(1 / 62 + 1 / 61, abs=1e-6)
+
+
+def test_near_duplicates_collapse_into_the_better_ranked_entry() -> None:
+    text = "Understanding reciprocal rank fusion for hybrid search systems"
+    brave = [
+        _entry("https://blog.example.com/rrf", "brave", text, "A deep dive"),
+        _entry("https://other.org/post", "brave", "Unrelated post", "on cooking"),
+        _entry("https://no-text.org/1", "brave"),
+        _entry("https://no-text.org/2", "brave"),
+    ]
+    exa = [_entry("https://mirror.net/rrf", "exa", text, "A deep dive")]
+
+    fused = fuse_results([brave, exa], limit=10)
+
+    urls = [entry["url"] for entry in fused]
+    assert urls == [
+        "https://blog.example.com/rrf",
+        "https://other.org/post",
+        "https://no-text.org/1",
+        "https://no-text.org/2",
+    ]
+    assert fuse_results([brave, exa], limit=2)[1]["url"] == "https://other.org/post"
+
+
+def test_simhash_distance_tracks_similarity() -> None:
+    base = simhash("the quick brown fox jumps over the lazy dog near the river")
+    close = simhash("the quick brown fox jumps over the lazy dog near a river")
+    far = simhash("polars lazy frames push predicates into the scan")
+
+    assert simhash("") == 0
+    assert bin(base ^ close).count("1") < bin(base ^ far).count("1")
+
+
+def test_fuse_results_handles_empty_input() -> None:
+    assert fuse_results([[], [_entry("", "exa")]], limit=5) == []
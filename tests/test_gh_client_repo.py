@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from types import SimpleNamespace
 
+import httpx
+import pytest
+
 from app.core.paths import DEFAULT_ASSETS_DIR
+from app.services.gh_client import repo as repo_module
 from app.services.gh_client.repo import GITHUB_ARCHIVE_FORMAT, GitHubRepositoryService
 
 
@@ -48,6 +53,7 @@ class _FakeFilesystemBackend:
     def __init__(self, existing_dirs: set[str] | None = None) -> None:
         self.base_path = DEFAULT_ASSETS_DIR
         self._existing_dirs = existing_dirs or set()
+        self.streamed: list[bytes] = []
 
     def resolve(self, path: str | Path) -> Path:
         return (self.base_path / Path(path)).resolve()
@@ -55,10 +61,9 @@ class _FakeFilesystemBackend:
     def is_dir(self, path: str | Path) -> bool:
         return str(path) in self._existing_dirs
 
-    def list_dir(self, path: str | Path) -> list[Path]:
+    def iter_dir(self, path: str | Path) -> Iterator[SimpleNamespace]:
         if str(path) in self._existing_dirs:
-            return [Path("already-present")]
-        return []
+            yield SimpleNamespace(name="already-present")
 
     def mkdir(
         self,
@@ -78,6 +83,16 @@ class _FakeFilesystemBackend:
         self._existing_dirs.add(str(destination))
         return self.resolve(destination)
 
+    def extract_tar_stream(
+        self,
+        chunks: Iterable[bytes],
+        destination: str | Path,
+        strip_components: int = 1,
+    ) -> Path:
+        self.streamed.extend(chunks)
+        self._existing_dirs.add(str(destination))
+        return self.resolve(destination)
+
 
 def test_get_tree_caches_by_commit_sha() -> None:
     repo = _FakeRepo()
@@ -119,3 +134,75 @@ def test_shallow_clone_skips_when_snapshot_directory_is_non_empty() -> None:
     assert result is not None
     assert result["skipped"] is True
     assert result["commit_sha"] == repo._sha
+
+
+def test_shallow_clone_streams_archive_into_backend(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    archive = b"x" * (repo_module.ARCHIVE_CHUNK_SIZE * 3)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url).endswith(f"{_FakeRepo()._sha}.tar.gz")
+        return httpx.Response(200, content=archive)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(repo_module, "get_sync_http_client", lambda name: client)
+    repo = _FakeRepo()
+    backend = _FakeFilesystemBackend()
+    service = GitHubRepositoryService(
+        _FakeClient(repo),
+        repo_name=repo.full_name,
+        filesystem_backend=backend,
+    )
+
+    result = service.shallow_clone()
+
+    assert result is not None
+    assert result["skipped"] is False
+    assert b"".join(backend.streamed) == archive
+    assert max(len(chunk) for chunk in backend.streamed) <= (
+        repo_module.ARCHIVE_CHUNK_SIZE
+    )
+
+
+def test_default_backend_follows_configured_backend_type(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from app.engine.backends import FilesystemBackendType
+    from app.engine.backends.blobstore import BlobStoreFilesystemBackend
+
+    monkeypatch.setattr(
+        "app.core.settings.settings.filesystem.backend_type",
+        FilesystemBackendType.BLOB_STORE,
+    )
+    repo = _FakeRepo()
+    service = GitHubRepositoryService(
+        _FakeClient(repo), base_path=tmp_path, repo_name=repo.full_name
+    )
+
+    assert isinstance(service.filesystem_backend, BlobStoreFilesystemBackend)
+
+
+def test_explicit_ref_only_paces_the_commit_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    released: list[int | None] = []
+    limiter = SimpleNamespace(
+        acquire_sync=lambda: None,
+        release=lambda status=None, headers=None: released.append(status),
+    )
+    monkeypatch.setattr(repo_module, "get_rate_limiter", lambda name: limiter)
+    repo = _FakeRepo()
+    service = GitHubRepositoryService(
+        _FakeClient(repo),
+        repo_name=repo.full_name,
+        filesystem_backend=_FakeFilesystemBackend(
+            existing_dirs={f"owner/repo@{repo._sha}"}
+        ),
+    )
+    released.clear()
+
+    service.shallow_clone(ref="main")
+
+    # One real request (get_commit); no token for the ref that was given.
+    assert released == [200]
@@ -47,6 +47,7 @@ def test_tool_schemas_describe_every_parameter() -> None:
         call_brave_search,
         call_exa_context,
         call_exa_search,
+        federated_search,
     )
     from app.engine.tools.web import fetch_url
 
@@ -59,6 +60,7 @@ def test_tool_schemas_describe_every_parameter() -> None:
         call_brave_search,
         call_exa_context,
         call_exa_search,
+        federated_search,
         fetch_url,
     ]
     for t in tools:
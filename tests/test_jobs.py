@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langgraph.constants import END, START
+from langgraph.graph import StateGraph
+
+from app.engine import registry
+from app.engine.executor import RunNotFoundError
+from app.engine.jobs import Job, JobConflictError, JobManager, JobStatus
+from app.engine.registry import invalidate_workflow_cache, workflow
+from app.engine.schema import ResearchRequest, ResearchState
+
+
+@pytest.fixture
+def report_workflow():
+    @workflow("jobs-test")
+    def create_jobs_test_workflow(checkpointer):
+        async def write(state: ResearchState) -> dict[str, object]:
+            return {"report": f"report on {state['topic']}"}
+
+        graph = StateGraph(ResearchState)
+        graph.add_node("write", write)
+        graph.add_edge(START, "write")
+        graph.add_edge("write", END)
+        return graph.compile(checkpointer=checkpointer)
+
+    yield "jobs-test"
+    registry._WORKFLOW_REGISTRY.pop("jobs-test", None)
+    invalidate_workflow_cache("jobs-test")
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_immediately_and_completes(report_workflow) -> None:
+    manager = JobManager(max_workers=2)
+
+    job = manager.submit(report_workflow, ResearchRequest(topic="queues"))
+    assert job.status == JobStatus.PENDING
+
+    await job.task
+    status = await manager.status(job.thread_id)
+    outcome = await manager.result(job.thread_id)
+
+    assert status["status"] == JobStatus.COMPLETED
+    assert status["next"] == []
+    assert outcome[0] == JobStatus.COMPLETED
+    assert outcome[1]["report"] == "report on queues"
+
+
+@pytest.mark.asyncio
+async def test_status_and_result_fall_back_to_checkpointer(report_workflow) -> None:
+    job = JobManager().submit(report_workflow, ResearchRequest(topic="restarts"))
+    await job.task
+
+    # A fresh manager (e.g. after a restart) has no in-memory record.
+    manager = JobManager()
+    status = await manager.status(job.thread_id)
+    status_code, state = await manager.result(job.thread_id)
+
+    assert status["status"] == JobStatus.COMPLETED
+    assert status["workflow"] == report_workflow
+    assert status_code == JobStatus.COMPLETED
+    assert state["report"] == "report on restarts"
+    assert await manager.status("unknown-thread") is None
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_bounds_concurrency_and_cancel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def fake_execute(workflow_name, request, *, thread_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await release.wait()
+        finally:
+            running -= 1
+        return {"topic": request.topic}
+
+    monkeypatch.setattr("app.engine.jobs.execute", fake_execute)
+    manager = JobManager(max_workers=2)
+    jobs = [
+        manager.submit("research", ResearchRequest(topic=f"topic-{i}"))
+        for i in range(4)
+    ]
+    await asyncio.sleep(0)
+
+    assert [job.status for job in jobs].count(JobStatus.RUNNING) == 2
+    manager.cancel(jobs[3].thread_id)
+    release.set()
+    await asyncio.gather(*(job.task for job in jobs), return_exceptions=True)
+
+    assert peak == 2
+    assert [job.status for job in jobs[:3]] == [JobStatus.COMPLETED] * 3
+    assert jobs[3].status == JobStatus.CANCELLED
+
+
+@pytest.fixture
+def flaky_workflow():
+    calls = {"gather": 0, "write": 0, "fail": True}
+
+    @workflow("jobs-flaky")
+    def create_flaky_workflow(checkpointer):
+        async def gather(state: ResearchState) -> dict[str, object]:
+            calls["gather"] += 1
+            return {"research_notes": [f"notes on {state['topic']}"]}
+
+        async def write(state: ResearchState) -> dict[str, object]:
+            calls["write"] += 1
+            if calls["fail"]:
+                raise RuntimeError("summarizer down")
+            return {"report": " / ".join(state["research_notes"])}
+
+        graph = StateGraph(ResearchState)
+        graph.add_node("gather", gather)
+        graph.add_node("write", write)
+        graph.add_edge(START, "gather")
+        graph.add_edge("gather", "write")
+        graph.add_edge("write", END)
+        return graph.compile(checkpointer=checkpointer)
+
+    yield calls
+    registry._WORKFLOW_REGISTRY.pop("jobs-flaky", None)
+    invalidate_workflow_cache("jobs-flaky")
+
+
+@pytest.mark.asyncio
+async def test_resume_continues_from_failed_node(flaky_workflow) -> None:
+    manager = JobManager()
+    job = manager.submit("jobs-flaky", ResearchRequest(topic="retries"))
+    await job.task
+    assert job.status == JobStatus.FAILED
+    assert (await manager.status(job.thread_id))["next"] == ["write"]
+
+    flaky_workflow["fail"] = False
+    resumed = await manager.resume(job.thread_id)
+    await resumed.task
+
+    assert resumed.thread_id == job.thread_id
+    assert resumed.status == JobStatus.COMPLETED
+    assert resumed.result["report"] == "notes on retries"
+    assert flaky_workflow["gather"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rerun_from_node_reuses_earlier_output(flaky_workflow) -> None:
+    flaky_workflow["fail"] = False
+    manager = JobManager()
+    job = manager.submit("jobs-flaky", ResearchRequest(topic="forks"))
+    await job.task
+
+    rerun = await manager.rerun(
+        job.thread_id, "write", {"research_notes": ["edited notes"]}
+    )
+    await rerun.task
+
+    assert rerun.status == JobStatus.COMPLETED
+    assert rerun.result["report"] == "edited notes"
+    assert flaky_workflow["gather"] == 1
+    assert flaky_workflow["write"] == 2
+    _, state = await JobManager().result(job.thread_id)
+    assert state["report"] == "edited notes"
+
+
+@pytest.mark.asyncio
+async def test_continuations_validate_before_scheduling(flaky_workflow) -> None:
+    flaky_workflow["fail"] = False
+    manager = JobManager()
+    job = manager.submit("jobs-flaky", ResearchRequest(topic="guards"))
+
+    with pytest.raises(JobConflictError):
+        await manager.resume(job.thread_id)
+    await job.task
+
+    with pytest.raises(RunNotFoundError):
+        await manager.resume("unknown-thread")
+    with pytest.raises(ValueError, match="no node"):
+        await manager.rerun(job.thread_id, "publish")
+    with pytest.raises(ValueError, match="Unknown state keys"):
+        await manager.rerun(job.thread_id, "write", {"nope": 1})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_continuations_of_one_thread_conflict(
+    flaky_workflow, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.engine import jobs
+
+    manager = JobManager()
+    job = manager.submit("jobs-flaky", ResearchRequest(topic="races"))
+    await job.task
+    flaky_workflow["fail"] = False
+    get_run_state = jobs.get_run_state
+
+    async def slow_get_run_state(thread_id: str):
+        # Let the other continuation run its checks in between.
+        await asyncio.sleep(0.01)
+        return await get_run_state(thread_id)
+
+    monkeypatch.setattr(jobs, "get_run_state", slow_get_run_state)
+
+    outcomes = await asyncio.gather(
+        manager.resume(job.thread_id),
+        manager.rerun(job.thread_id, "write"),
+        return_exceptions=True,
+    )
+
+    started = [outcome for outcome in outcomes if isinstance(outcome, Job)]
+    assert len(started) == 1
+    assert isinstance(outcomes[1], JobConflictError)
+    await started[0].task
+    assert flaky_workflow["write"] == 2
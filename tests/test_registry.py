@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from app.engine import registry
+from app.engine.registry import (
+    get_workflow,
+    invalidate_workflow_cache,
+    warm_workflows,
+    workflow,
+)
+
+
+@pytest.fixture
+def counting_workflow():
+    calls: list[object] = []
+
+    @workflow("cache-test")
+    def create_cache_test_workflow(checkpointer):
+        calls.append(checkpointer)
+        return object()
+
+    yield calls
+    registry._WORKFLOW_REGISTRY.pop("cache-test", None)
+    invalidate_workflow_cache("cache-test")
+
+
+def test_get_workflow_compiles_once_per_checkpointer(counting_workflow) -> None:
+    checkpointer = MemorySaver()
+
+    first = get_workflow("cache-test", checkpointer)
+    second = get_workflow("CACHE-TEST", checkpointer)
+
+    assert first is second
+    assert counting_workflow == [checkpointer]
+
+
+def test_get_workflow_recompiles_for_a_different_checkpointer(
+    counting_workflow,
+) -> None:
+    first = get_workflow("cache-test", MemorySaver())
+    second = get_workflow("cache-test", MemorySaver())
+
+    assert first is not second
+    assert len(counting_workflow) == 2
+
+
+def test_invalidate_workflow_cache_forces_recompile(counting_workflow) -> None:
+    checkpointer = MemorySaver()
+    first = get_workflow("cache-test", checkpointer)
+
+    invalidate_workflow_cache("cache-test")
+    second = get_workflow("cache-test", checkpointer)
+
+    assert first is not second
+    assert len(counting_workflow) == 2
+
+
+def test_warm_workflows_compiles_every_registered_workflow(counting_workflow) -> None:
+    checkpointer = MemorySaver()
+
+    warmed = warm_workflows(checkpointer)
+
+    assert "cache-test" in warmed
+    assert counting_workflow == [checkpointer]
+    get_workflow("cache-test", checkpointer)
+    assert len(counting_workflow) == 1
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from app.core.settings import settings
+from app.engine import search_cache as search_cache_module
+from app.engine.search_cache import (
+    MemorySearchCacheTier,
+    SearchCache,
+    SqliteSearchCacheTier,
+    cache_key,
+)
+from app.engine.tools import search as search_module
+from app.engine.tools.search import call_exa_search
+
+
+def _fetcher(*values: object):
+    calls: list[int] = []
+
+    async def fetch() -> tuple[object, str | None]:
+        calls.append(1)
+        return values[min(len(calls), len(values)) - 1], None
+
+    return fetch, calls
+
+
+def test_cache_key_normalizes_query_but_not_operators() -> None:
+    key = cache_key("brave", "Vector  Search OR ann", 10, None)
+
+    assert key == cache_key("brave", " vector search OR ANN ", 10, None)
+    assert key != cache_key("brave", "vector search or ann", 10, None)
+    assert key != cache_key("brave", "vector search OR ann", 5, None)
+    assert key != cache_key("exa", "vector search OR ann", 10, None)
+    assert cache_key("exa", "q", 10, "neural") != cache_key("exa", "q", 10, "auto")
+
+
+@pytest.mark.asyncio
+async def test_fresh_hits_skip_fetch_and_errors_are_not_cached() -> None:
+    cache = SearchCache([MemorySearchCacheTier()], ttl_s={"brave": 60.0})
+    fetch, calls = _fetcher(["a"])
+
+    assert await cache.get_or_fetch("brave", "q", 10, None, fetch) == (["a"], None)
+    assert await cache.get_or_fetch("brave", "Q", 10, None, fetch) == (["a"], None)
+    assert len(calls) == 1
+
+    async def failing() -> tuple[list[str], str | None]:
+        return [], "boom"
+
+    assert await cache.get_or_fetch("brave", "x", 10, None, failing) == ([], "boom")
+    assert await cache.get_or_fetch("brave", "x", 10, None, fetch) == (["a"], None)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["hit_ratio"] == 0.25
+    assert stats["latency_saved_s"] > 0
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_while_refreshing() -> None:
+    cache = SearchCache(
+        [MemorySearchCacheTier()], default_ttl_s=0.0, stale_while_revalidate_s=60.0
+    )
+    fetch, calls = _fetcher(["old"], ["new"])
+
+    await cache.get_or_fetch("exa", "q", 10, "auto", fetch)
+    assert await cache.get_or_fetch("exa", "q", 10, "auto", fetch) == (["old"], None)
+    await asyncio.gather(*cache._refreshing.values())
+
+    assert len(calls) == 2
+    assert cache.stats()["refreshes"] == 1
+    assert await cache.get_or_fetch("exa", "q", 10, "auto", fetch) == (["new"], None)
+    await asyncio.gather(*cache._refreshing.values())
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_survives_restarts_and_expires(tmp_path) -> None:
+    path = tmp_path / "search.sqlite3"
+    first = SearchCache(
+        [MemorySearchCacheTier(), SqliteSearchCacheTier(path, max_age_s=60.0)]
+    )
+    fetch, calls = _fetcher([{"url": "https://a"}])
+    await first.get_or_fetch("brave", "q", 10, None, fetch)
+    first.close()
+
+    memory = MemorySearchCacheTier()
+    second = SearchCache([memory, SqliteSearchCacheTier(path, max_age_s=60.0)])
+    result = await second.get_or_fetch("brave", "q", 10, None, fetch)
+    assert result == ([{"url": "https://a"}], None)
+    assert len(calls) == 1
+    assert len(memory) == 1
+    second.close()
+
+    # Opening with a shorter max age prunes the row; a zero TTL misses.
+    expired = SearchCache(
+        [SqliteSearchCacheTier(path, max_age_s=-1.0)], default_ttl_s=0.0
+    )
+    await expired.get_or_fetch("brave", "q", 10, None, fetch)
+    assert len(calls) == 2
+    expired.close()
+
+
+@pytest.mark.asyncio
+async def test_exa_tool_is_served_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = {"results": [{"title": "T", "url": "https://a", "snippet": "s"}]}
+        return httpx.Response(200, content=orjson.dumps(body))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    cache = SearchCache([MemorySearchCacheTier()])
+    monkeypatch.setattr(
+        search_module,
+        "send_request",
+        lambda name, method, url, **kwargs: client.request(method, url, **kwargs),
+    )
+    monkeypatch.setattr(search_cache_module, "get_search_cache", lambda: cache)
+    monkeypatch.setattr(settings, "EXA_API_KEY", "key")
+    monkeypatch.setattr(settings.search_cache, "enabled", True)
+
+    first = await call_exa_search.ainvoke({"query": "rag eval"})
+    second = await call_exa_search.ainvoke({"query": "RAG  eval"})
+
+    assert first == second
+    assert first[0][0]["url"] == "https://a"
+    assert len(requests) == 1
+    await client.aclose()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from app.core.settings import settings
+from app.engine.tools import search as search_module
+from app.engine.tools.search import call_brave_search, federated_search
+
+
+def _brave(*urls: str) -> httpx.Response:
+    results = [{"title": url, "url": url, "description": "d"} for url in urls]
+    return httpx.Response(200, content=orjson.dumps({"web": {"results": results}}))
+
+
+def _exa(*urls: str) -> httpx.Response:
+    results = [{"title": url, "url": url, "snippet": "s"} for url in urls]
+    return httpx.Response(200, content=orjson.dumps({"results": results}))
+
+
+@pytest.fixture
+def providers(monkeypatch: pytest.MonkeyPatch):
+    """Route both providers to ``handlers[host]`` through one mock client."""
+    handlers: dict[str, object] = {}
+    seen: dict[str, httpx.Request] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen[request.url.host] = request
+        return await handlers[request.url.host](request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        search_module,
+        "send_request",
+        lambda name, method, url, **kwargs: client.request(method, url, **kwargs),
+    )
+    monkeypatch.setattr(settings, "BRAVE_SEARCH_API_KEY", "brave-key")
+    monkeypatch.setattr(settings, "EXA_API_KEY", "exa-key")
+    monkeypatch.setattr(settings.search_cache, "enabled", False)
+    yield handlers, seen
+
+
+@pytest.mark.asyncio
+async def test_federated_search_queries_both_providers_and_dedupes(
+    providers,
+) -> None:
+    handlers, seen = providers
+
+    async def brave(request: httpx.Request) -> httpx.Response:
+        return _brave("https://a", "https://b")
+
+    async def exa(request: httpx.Request) -> httpx.Response:
+        return _exa("https://b", "https://c")
+
+    handlers["api.search.brave.com"] = brave
+    handlers["api.exa.ai"] = exa
+
+    results, error = await federated_search.ainvoke(
+        {"query": "vector search", "sites": ["arxiv.org"]}
+    )
+
+    assert error is None
+    assert sorted(entry["url"] for entry in results) == [
+        "https://a",
+        "https://b",
+        "https://c",
+    ]
+    brave_query = seen["api.search.brave.com"].url.params["q"]
+    assert brave_query == "vector AND search AND site:arxiv.org"
+    exa_body = orjson.loads(seen["api.exa.ai"].content)
+    assert exa_body["query"] == "vector search"
+
+
+@pytest.mark.asyncio
+async def test_federated_search_returns_partial_results_past_deadline(
+    providers, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    handlers, _ = providers
+    monkeypatch.setattr(settings.search, "deadlines_s", {"exa": 0.05})
+
+    async def brave(request: httpx.Request) -> httpx.Response:
+        return _brave("https://a")
+
+    async def exa(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return _exa("https://late")
+
+    handlers["api.search.brave.com"] = brave
+    handlers["api.exa.ai"] = exa
+
+    results, error = await asyncio.wait_for(
+        federated_search.ainvoke({"query": "rust async runtimes"}), timeout=2
+    )
+
+    assert [entry["url"] for entry in results] == ["https://a"]
+    assert error == "exa timed out after 0.05s"
+
+
+@pytest.mark.asyncio
+async def test_federated_search_without_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "BRAVE_SEARCH_API_KEY", "")
+    monkeypatch.setattr(settings, "EXA_API_KEY", "")
+
+    results, error = await federated_search.ainvoke({"query": "q"})
+
+    assert results == []
+    assert error is not None
+
+
+@pytest.mark.asyncio
+async def test_brave_tool_falls_back_to_exa_while_its_circuit_is_open(
+    providers, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    handlers, seen = providers
+
+    async def exa(request: httpx.Request) -> httpx.Response:
+        return _exa("https://a")
+
+    handlers["api.exa.ai"] = exa
+    monkeypatch.setattr(search_module, "circuit_open", lambda name: name == "brave")
+
+    results, error = await call_brave_search.ainvoke({"query": "q"})
+
+    assert error is None
+    assert [entry["provider"] for entry in results] == ["exa"]
+    assert set(seen) == {"api.exa.ai"}
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+from langchain.agents import create_agent
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.constants import END, START
+from langgraph.graph import StateGraph
+
+from app.engine import registry
+from app.engine.executor import stream_execute
+from app.engine.nodes.builders.agent import run_agent_executor
+from app.engine.registry import invalidate_workflow_cache, workflow
+from app.engine.schema import ResearchContext, ResearchRequest, ResearchState
+
+
+@pytest.fixture
+def fake_agent_workflow():
+    @workflow("stream-test")
+    def create_stream_test_workflow(checkpointer):
+        async def writer(state: ResearchState, runtime, config):
+            model = GenericFakeChatModel(
+                messages=iter([AIMessage(content="streamed report body")])
+            )
+            agent = create_agent(model=model, tools=[])
+            return await run_agent_executor(
+                agent,
+                state=state,
+                runtime_context=runtime.context,
+                config=config,
+                workflow_name="writer",
+            )
+
+        graph = StateGraph(ResearchState, context_schema=ResearchContext)
+        graph.add_node("writer", writer)
+        graph.add_edge(START, "writer")
+        graph.add_edge("writer", END)
+        return graph.compile(checkpointer=checkpointer)
+
+    yield "stream-test"
+    registry._WORKFLOW_REGISTRY.pop("stream-test", None)
+    invalidate_workflow_cache("stream-test")
+
+
+@pytest.mark.asyncio
+async def test_stream_execute_forwards_tokens_before_final_state(
+    fake_agent_workflow,
+) -> None:
+    events = [
+        event
+        async for event in stream_execute(
+            fake_agent_workflow, ResearchRequest(topic="streaming")
+        )
+    ]
+    kinds = [event["event"] for event in events]
+
+    assert kinds[0] == "run"
+    assert kinds[-1] == "done"
+    assert events[1]["data"] == {"node": "writer", "status": "started"}
+    tokens = [event["data"]["text"] for event in events if event["event"] == "token"]
+    assert "".join(tokens) == "streamed report body"
+    assert all(event["data"]["node"] == "writer" for event in events[2:-2])
+    assert kinds.index("token") < kinds.index("done")
+    assert events[-2]["data"] == {"node": "writer", "status": "finished"}
+    final_messages = events[-1]["data"]["state"]["messages"]
+    assert final_messages[-1].content == "streamed report body"
+
+
+@pytest.mark.asyncio
+async def test_stream_execute_reports_setup_failures_as_error_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def failing_prepare(workflow_name, request):
+        raise OSError("memory index unavailable")
+
+    monkeypatch.setattr("app.engine.executor._prepare", failing_prepare)
+
+    events = [
+        event
+        async for event in stream_execute("research", ResearchRequest(topic="broken"))
+    ]
+
+    assert [event["event"] for event in events] == ["run", "error"]
+    assert events[1]["data"]["message"] == "memory index unavailable"
+    assert events[1]["data"]["thread_id"] == events[0]["data"]["thread_id"]